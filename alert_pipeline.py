@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Streaming Alert Pipeline
+New jobs are alerted as soon as their source finishes; batches that arrive within a short
+window of each other go out as one message
+"""
+
+import logging
+import threading
+
+# How long the first new job waits for others to share its alert
+COALESCE_SECONDS = 2.0
+
+
+class AlertBatcher:
+    """Buffers new jobs and calls send(jobs) once the coalescing window closes.
+    rank(jobs), when given, orders each batch before it is sent (e.g. relevance.rank)."""
+
+    def __init__(self, send, window=COALESCE_SECONDS, rank=None):
+        self.send = send
+        self.window = window
+        self.rank = rank
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._pending = []
+        self._timer = None
+        self.batches_sent = 0
+
+    def add(self, jobs):
+        """Queue jobs for alerting; the first job of a batch starts the window"""
+        if not jobs:
+            return
+        with self._lock:
+            self._pending.extend(jobs)
+            if self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Send whatever is pending right now"""
+        # One send at a time so alerts arrive in the order their jobs were found
+        with self._send_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+            if self.rank is not None:
+                try:
+                    batch = self.rank(batch)
+                except Exception as e:
+                    logging.warning(f"Alert ranking failed, sending in arrival order: {e}")
+            try:
+                self.send(batch)
+                self.batches_sent += 1
+            except Exception as e:
+                logging.error(f"❌ Alert dispatch error: {str(e)}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        # End of scan: nothing else is coming, so don't wait out the window
+        self.flush()
+        return False
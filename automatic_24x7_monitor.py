@@ -5,15 +5,22 @@ Runs continuously and automatically sends real-time alerts
 No manual intervention required
 """
 
-import requests
-import json
 import datetime
 import time
 import os
 import threading
 import logging
-from concurrent.futures import ThreadPoolExecutor
 import sys
+import http_client
+import fetch_engine
+import relevance
+import alert_pipeline
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id
+from job_dedup import NearDuplicateIndex
+from watermarks import Watermarks, watermark_path, reed_id, reed_posted, jooble_id, jooble_updated
+from pagination import reed_search, jooble_search
 
 # Automatic logging setup
 logging.basicConfig(
@@ -48,19 +55,21 @@ class Automatic24x7Monitor:
         # Load existing jobs
         self.load_tracked_jobs()
         
+        self.watermarks = Watermarks(watermark_path(self.jobs_file))
+        
+        # Fingerprints of recent jobs so reposts on other sources are not alerted twice
+        self.near_duplicates = NearDuplicateIndex()
+        self.near_duplicates.seed(reversed(self.tracked_jobs.recent(2000)))
+        
         # Send startup notification
         self.send_startup_notification()
         
     def load_tracked_jobs(self):
-        try:
-            with open(self.jobs_file, 'r', encoding='utf-8') as f:
-                self.tracked_jobs = json.load(f)
-        except:
-            self.tracked_jobs = {}
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
-        with open(self.jobs_file, 'w', encoding='utf-8') as f:
-            json.dump(self.tracked_jobs, f, indent=2, ensure_ascii=False)
+        self.tracked_jobs.save()
+        self.watermarks.save()
     
     def send_startup_notification(self):
         """Send notification that automatic monitoring has started"""
@@ -96,7 +105,7 @@ class Automatic24x7Monitor:
                 'parse_mode': 'Markdown'
             }
             
-            response = requests.post(url, data=data, timeout=10)
+            response = http_client.post(url, data=data, timeout=10)
             return response.status_code == 200
             
         except Exception as e:
@@ -142,7 +151,7 @@ class Automatic24x7Monitor:
             url = "https://remoteok.io/api"
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
             
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_client.get(url, headers=headers, timeout=15, conditional=True)
             if response.status_code != 200:
                 return []
             
@@ -150,27 +159,16 @@ class Automatic24x7Monitor:
             if not jobs_data or len(jobs_data) <= 1:
                 return []
             
+            latest = [job for job in jobs_data[1:30] if isinstance(job, dict)]  # Check first 30 jobs
             new_jobs = []
-            for job in jobs_data[1:30]:  # Check first 30 jobs
-                if not isinstance(job, dict):
-                    continue
-                
+            for job in self.watermarks.fresh('remoteok', latest, lambda job: job.get('id'), lambda job: job.get('epoch')):
                 # Check for testing keywords
                 title = str(job.get('position', '')).lower()
                 description = str(job.get('description', '')).lower()
                 tags = [str(tag).lower() for tag in job.get('tags', [])]
                 
-                testing_keywords = ['test', 'qa', 'quality assurance', 'automation', 'selenium', 'cypress']
-                has_testing = any(keyword in title for keyword in testing_keywords) or \
-                             any(keyword in description for keyword in testing_keywords) or \
-                             any(keyword in ' '.join(tags) for keyword in testing_keywords)
-                
-                # Check for experience
-                exp_keywords = ['2+ year', '2 year', 'experienced', 'senior', '3+ year']
-                has_experience = any(keyword in description for keyword in exp_keywords)
-                
-                if has_testing and has_experience:
-                    job_id = f"remoteok_{job.get('id', '')}"
+                if filter_profiles.profile('testing_2_plus_years').matches(title=title, description=description, tags=tags):
+                    job_id = make_job_id('remoteok', job.get('id'), job.get('url'), job.get('position'), job.get('company'))
                     if job_id and job_id not in self.tracked_jobs:
                         new_job = {
                             'id': job_id,
@@ -194,8 +192,6 @@ class Automatic24x7Monitor:
     def scan_jooble(self):
         """Scan Jooble for testing jobs"""
         try:
-            base_url = f"https://jooble.org/api/{self.jooble_api_key}"
-            
             search_params = {
                 'keywords': 'software testing QA automation test engineer',
                 'location': '',
@@ -203,27 +199,15 @@ class Automatic24x7Monitor:
             }
             
             headers = {'Content-Type': 'application/json'}
-            response = requests.post(base_url, json=search_params, headers=headers, timeout=15)
-            
-            if response.status_code != 200:
-                return []
-            
-            data = response.json()
-            jobs_data = data.get('jobs', [])
+            jobs_data = jooble_search(self.jooble_api_key, search_params, headers)
             
             new_jobs = []
-            for job in jobs_data[:20]:
+            for job in self.watermarks.fresh('jooble', jobs_data, jooble_id, jooble_updated, ordered=False):
                 title = str(job.get('title', '')).lower()
                 snippet = str(job.get('snippet', '')).lower()
                 
-                testing_keywords = ['test', 'qa', 'quality', 'automation', 'selenium']
-                has_testing = any(keyword in title or keyword in snippet for keyword in testing_keywords)
-                
-                exp_keywords = ['2+ year', 'experienced', 'senior', 'experience']
-                has_experience = any(keyword in snippet for keyword in exp_keywords)
-                
-                if has_testing and has_experience:
-                    job_id = f"jooble_{hash(job.get('link', ''))}"
+                if filter_profiles.profile('testing_2_plus_or_experience').matches(title=title, description=snippet):
+                    job_id = make_job_id('jooble', job.get('id'), job.get('link'), job.get('title'), job.get('company'))
                     
                     if job_id not in self.tracked_jobs:
                         new_job = {
@@ -248,35 +232,19 @@ class Automatic24x7Monitor:
     def scan_reed_uk(self):
         """Scan Reed.co.uk for testing jobs"""
         try:
-            base_url = "https://www.reed.co.uk/api/1.0/search"
-            
             params = {
-                'keywords': 'software testing OR qa automation',
-                'resultsToTake': 20
+                'keywords': 'software testing OR qa automation'
             }
             
-            auth = (self.reed_api_key, '')
-            response = requests.get(base_url, params=params, auth=auth, timeout=15)
-            
-            if response.status_code != 200:
-                return []
-            
-            data = response.json()
-            jobs_data = data.get('results', [])
+            jobs_data = reed_search(self.reed_api_key, params)
             
             new_jobs = []
-            for job in jobs_data:
+            for job in self.watermarks.fresh('reed', jobs_data, reed_id, reed_posted, ordered=False):
                 title = str(job.get('jobTitle', '')).lower()
                 description = str(job.get('jobDescription', '')).lower()
                 
-                testing_keywords = ['test', 'qa', 'quality', 'automation']
-                has_testing = any(keyword in title or keyword in description for keyword in testing_keywords)
-                
-                exp_keywords = ['2+ year', 'experienced', 'senior']
-                has_experience = any(keyword in description for keyword in exp_keywords)
-                
-                if has_testing and has_experience:
-                    job_id = f"reed_{job.get('jobId', '')}"
+                if filter_profiles.profile('testing_2_plus_years').matches(title=title, description=description):
+                    job_id = make_job_id('reed', job.get('jobId'), job.get('jobUrl'), job.get('jobTitle'), job.get('employerName'))
                     
                     if job_id not in self.tracked_jobs:
                         salary_min = job.get('minimumSalary', 0)
@@ -313,25 +281,26 @@ class Automatic24x7Monitor:
         all_new_jobs = []
         
         # Scan all sources
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [
-                executor.submit(self.scan_remoteok),
-                executor.submit(self.scan_jooble),
-                executor.submit(self.scan_reed_uk)
-            ]
-            
-            for future in futures:
-                try:
-                    jobs = future.result(timeout=30)
-                    all_new_jobs.extend(jobs)
-                except Exception as e:
-                    logging.error(f"Scan error: {str(e)}")
+        sources = [
+            self.scan_remoteok,
+            self.scan_jooble,
+            self.scan_reed_uk
+        ]
+        
+        # Alert each source's new jobs as soon as it finishes, collapsing postings already seen on another source
+        with alert_pipeline.AlertBatcher(self.send_job_alert, rank=relevance.rank) as alerts:
+            for source, jobs in fetch_engine.iter_sources(sources, deadline=30):
+                if isinstance(jobs, Exception):
+                    logging.error(f"Scan error: {str(jobs)}")
+                    continue
+                new_jobs = self.near_duplicates.collapse(jobs, self.tracked_jobs)
+                alerts.add(new_jobs)
+                all_new_jobs.extend(new_jobs)
         
         # Send alerts if new jobs found
         if all_new_jobs:
             logging.info(f"🎯 Found {len(all_new_jobs)} new testing jobs!")
             self.save_tracked_jobs()
-            self.send_job_alert(all_new_jobs)
             return len(all_new_jobs)
         else:
             logging.info("ℹ️ No new jobs in this scan")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Circuit Breakers
+Per-URL and per-source health tracking; dead endpoints and stub sources are skipped with an
+exponential cool-down and retried with a single half-open probe
+"""
+
+import time
+import logging
+import threading
+import contextvars
+from urllib.parse import urlsplit
+
+import requests
+
+import rate_limit
+
+# Only job boards get per-URL breakers; a Telegram alert or Gemini call is never skipped
+JOB_BOARDS = tuple(rate_limit.HOST_RATES)
+
+FAILURE_THRESHOLD = 3
+BASE_COOLDOWN = 60
+MAX_COOLDOWN = 3600
+
+# Statuses that mean the endpoint is gone, blocking us or broken - not just "no results"
+FAILURE_STATUSES = {403, 404, 410, 429}
+
+# Weight of the newest call in the health and latency averages
+HEALTH_ALPHA = 0.2
+
+
+class CircuitOpen(requests.ConnectionError):
+    """Request skipped because its endpoint's circuit is open"""
+
+
+def is_failure_status(status_code):
+    return status_code >= 500 or status_code in FAILURE_STATUSES
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures -> half-open probe after the cool-down"""
+
+    def __init__(self, name, failure_threshold=FAILURE_THRESHOLD, base_cooldown=BASE_COOLDOWN,
+                 max_cooldown=MAX_COOLDOWN):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self._lock = threading.Lock()
+        self.state = 'closed'
+        self.failures = 0
+        self.trips = 0
+        self.opened_until = 0
+        self.calls = 0
+        self.failed_calls = 0
+        self.health = 1.0
+        self.latency = 0.0
+
+    def allow(self):
+        """True if a call may go ahead; an expired open circuit lets exactly one probe through"""
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and time.monotonic() >= self.opened_until:
+                self.state = 'half_open'
+                return True
+            return False
+
+    def retry_in(self):
+        return max(0, self.opened_until - time.monotonic())
+
+    def abandon(self):
+        """A call gave up for its own reasons; let the next call probe again"""
+        with self._lock:
+            if self.state == 'half_open':
+                self.state = 'open'
+
+    def record(self, ok, latency=0.0):
+        with self._lock:
+            self.calls += 1
+            self.health = (1 - HEALTH_ALPHA) * self.health + HEALTH_ALPHA * (1.0 if ok else 0.0)
+            self.latency = latency if self.calls == 1 else (1 - HEALTH_ALPHA) * self.latency + HEALTH_ALPHA * latency
+
+            if ok:
+                if self.state != 'closed':
+                    logging.info(f"🟢 {self.name} recovered after {self.trips} trip(s)")
+                self.state = 'closed'
+                self.failures = 0
+                self.trips = 0
+                return
+
+            self.failed_calls += 1
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                self.trips += 1
+                cooldown = min(self.max_cooldown, self.base_cooldown * 2 ** (self.trips - 1))
+                self.opened_until = time.monotonic() + cooldown
+                self.state = 'open'
+                logging.warning(f"🔴 {self.name} circuit open for {cooldown}s "
+                                f"(health {self.health:.2f}, {self.latency:.1f}s avg)")
+
+
+class BreakerRegistry:
+    """Lazily created breaker per key"""
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(key, **self.settings)
+            return self._breakers[key]
+
+    def report(self):
+        """(name, state, health, avg latency) for every tracked breaker, unhealthiest first"""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return sorted(((b.name, b.state, b.health, b.latency) for b in breakers), key=lambda row: row[2])
+
+
+url_breakers = BreakerRegistry()
+source_breakers = BreakerRegistry()
+
+
+def is_job_board(host):
+    return any(name in host.split('.') for name in JOB_BOARDS)
+
+
+def url_key(url):
+    """Breakers are per endpoint: every query against stackoverflow.com/jobs shares one.
+    Only the first path segment is kept, so API keys further down (jooble.org/api/<key>)
+    never reach the key or the logs. None for hosts that aren't job boards."""
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    if not is_job_board(host):
+        return None
+    segment = parts.path.lstrip('/').split('/', 1)[0]
+    return f"{host}/{segment}"
+
+
+def for_url(url):
+    """The URL's breaker, or None when it isn't guarded"""
+    key = url_key(url)
+    return None if key is None else url_breakers.get(key)
+
+
+def source_name(source):
+    return getattr(source, '__qualname__', None) or repr(source)
+
+
+class SourceActivity:
+    """Responses that carried data during one source run"""
+
+    def __init__(self):
+        self.responses = 0
+
+
+_activity = contextvars.ContextVar('source_activity', default=None)
+
+
+def mark_data():
+    """Called for every usable response; credits the source currently running, if any"""
+    activity = _activity.get()
+    if activity is not None:
+        activity.responses += 1
+
+
+def run_tracked(source):
+    """Run a source and return (jobs, SourceActivity)"""
+    activity = SourceActivity()
+    token = _activity.set(activity)
+    try:
+        return source(), activity
+    finally:
+        _activity.reset(token)
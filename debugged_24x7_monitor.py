@@ -13,12 +13,20 @@ import datetime
 import time
 import os
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import feedparser
 import schedule
 import logging
 import traceback
 import sys
+import http_client
+import fetch_engine
+import relevance
+import job_classifier
+import alert_pipeline
+import remoteok_source
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id
+from watermarks import Watermarks, watermark_path, entry_id, entry_published
 
 # Configure enhanced logging
 logging.basicConfig(
@@ -37,6 +45,9 @@ class Debugged24x7JobMonitor:
         self.gemini_config = gemini_config
         self.jobs_file = "debugged_24x7_jobs.json"
         self.load_tracked_jobs()
+        # Scores new jobs locally; Gemini is only asked about the ones it is unsure of
+        self.classifier = job_classifier.train(self.tracked_jobs.values())
+        self.watermarks = Watermarks(watermark_path(self.jobs_file))
         self.scan_count = 0
         self.total_jobs_found = 0
         self.debug_mode = True
@@ -69,7 +80,7 @@ class Debugged24x7JobMonitor:
         """Test Telegram bot connectivity"""
         try:
             url = f"https://api.telegram.org/bot{self.telegram_config['bot_token']}/getMe"
-            response = requests.get(url, timeout=10)
+            response = http_client.get(url, timeout=10)
             return response.status_code == 200
         except Exception as e:
             logging.error(f"Telegram test error: {e}")
@@ -88,24 +99,16 @@ class Debugged24x7JobMonitor:
             return False
         
     def load_tracked_jobs(self):
-        """Load previously tracked jobs from file"""
-        try:
-            with open(self.jobs_file, 'r') as f:
-                self.tracked_jobs = json.load(f)
-            logging.info(f"📂 Loaded {len(self.tracked_jobs)} tracked jobs")
-        except FileNotFoundError:
-            self.tracked_jobs = {}
-            logging.info("📂 Starting with empty job database")
-        except Exception as e:
-            logging.error(f"Error loading jobs: {e}")
-            self.tracked_jobs = {}
+        """Load previously tracked jobs from the job store"""
+        self.tracked_jobs = open_job_store(self.jobs_file)
+        logging.info(f"📂 Loaded {len(self.tracked_jobs)} tracked jobs")
     
     def save_tracked_jobs(self):
-        """Save tracked jobs to file"""
+        """Save newly tracked jobs to the job store"""
         try:
-            with open(self.jobs_file, 'w') as f:
-                json.dump(self.tracked_jobs, f, indent=2)
-            logging.info(f"💾 Saved {len(self.tracked_jobs)} jobs to database")
+            saved = self.tracked_jobs.save()
+            self.watermarks.save()
+            logging.info(f"💾 Saved {saved} new jobs to database ({len(self.tracked_jobs)} total)")
         except Exception as e:
             logging.error(f"Error saving jobs: {e}")
     
@@ -120,50 +123,36 @@ class Debugged24x7JobMonitor:
             # Multiple search terms for testing jobs
             search_terms = ['qa', 'testing', 'automation', 'sdet']
             
+            feed = remoteok_source.get_feed()
+            
             for term in search_terms:
                 try:
-                    url = f"https://remoteok.io/api?tag={term}"
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                        'Accept': 'application/json',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Cache-Control': 'no-cache'
-                    }
+                    tagged_jobs = feed.by_tag(term)
+                    logging.info(f"RemoteOK {term}: {len(tagged_jobs)} jobs in snapshot")
                     
-                    response = requests.get(url, headers=headers, timeout=15)
-                    logging.info(f"RemoteOK {term}: Status {response.status_code}")
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        
-                        # Skip first item (legal notice)
-                        job_data = data[1:] if len(data) > 1 else []
-                        
-                        for job in job_data[:5]:  # Top 5 per term
-                            if not job or not isinstance(job, dict):
-                                continue
-                                
-                            job_id = f"remoteok_{job.get('id', f'{term}_{len(jobs)}')}"
+                    for job in tagged_jobs[:5]:  # Top 5 per term
+                        if not job or not isinstance(job, dict):
+                            continue
                             
-                            if job_id not in self.tracked_jobs:
-                                job_entry = {
-                                    'id': job_id,
-                                    'title': job.get('position', 'N/A'),
-                                    'company': job.get('company', 'N/A'),
-                                    'location': job.get('location', 'Remote'),
-                                    'salary': self.format_salary(job.get('salary_min'), job.get('salary_max')),
-                                    'snippet': str(job.get('description', 'N/A'))[:300],
-                                    'url': f"https://remoteok.io/remote-jobs/{job.get('slug', '')}",
-                                    'source': source_name,
-                                    'date_found': datetime.datetime.now().isoformat(),
-                                    'posted_date': job.get('date', 'Recent'),
-                                    'tags': job.get('tags', []),
-                                    'search_term': term
-                                }
-                                jobs.append(job_entry)
-                    
-                    time.sleep(2)  # Rate limiting
-                    
+                        job_id = make_job_id('remoteok', job.get('id'), job.get('url'), job.get('position'), job.get('company'))
+                        
+                        if job_id not in self.tracked_jobs:
+                            job_entry = {
+                                'id': job_id,
+                                'title': job.get('position', 'N/A'),
+                                'company': job.get('company', 'N/A'),
+                                'location': job.get('location', 'Remote'),
+                                'salary': self.format_salary(job.get('salary_min'), job.get('salary_max')),
+                                'snippet': str(job.get('description', 'N/A'))[:300],
+                                'url': f"https://remoteok.io/remote-jobs/{job.get('slug', '')}",
+                                'source': source_name,
+                                'date_found': datetime.datetime.now().isoformat(),
+                                'posted_date': job.get('date', 'Recent'),
+                                'tags': job.get('tags', []),
+                                'search_term': term
+                            }
+                            jobs.append(job_entry)
+                
                 except requests.RequestException as e:
                     logging.warning(f"RemoteOK request error for {term}: {e}")
                 except json.JSONDecodeError as e:
@@ -208,15 +197,18 @@ class Debugged24x7JobMonitor:
                 'sdet'
             ]
             
-            for term in search_terms:
+            feeds = fetch_engine.fetch_feeds(
+                [f'https://stackoverflow.com/jobs/feed?q={term}&r=true' for term in search_terms]
+            )
+            
+            for term, feed in zip(search_terms, feeds):
                 try:
-                    url = f'https://stackoverflow.com/jobs/feed?q={term}&r=true'
-                    
-                    feed = feedparser.parse(url)
+                    if isinstance(feed, Exception):
+                        raise feed
                     logging.info(f"Stack Overflow {term}: Found {len(feed.entries)} entries")
                     
                     for entry in feed.entries[:3]:  # Top 3 per term
-                        job_id = f"stackoverflow_{entry.get('id', f'{term}_{len(jobs)}')}"
+                        job_id = make_job_id('stackoverflow', entry.get('id'), entry.get('link'), entry.get('title'))
                         
                         if job_id not in self.tracked_jobs:
                             job_entry = {
@@ -233,8 +225,6 @@ class Debugged24x7JobMonitor:
                                 'search_term': term
                             }
                             jobs.append(job_entry)
-                            
-                    time.sleep(1)
                     
                 except Exception as e:
                     logging.warning(f"Stack Overflow term error for {term}: {e}")
@@ -260,19 +250,18 @@ class Debugged24x7JobMonitor:
                 'https://weworkremotely.com/categories/remote-dev-ops-sysadmin-jobs.rss'
             ]
             
-            testing_keywords = ['test', 'qa', 'quality', 'automation', 'sdet']
-            
-            for rss_url in rss_urls:
+            for rss_url, feed in zip(rss_urls, fetch_engine.fetch_feeds(rss_urls, limit=8, seen=self.watermarks.seen_ids)):
                 try:
-                    feed = feedparser.parse(rss_url)
+                    if isinstance(feed, Exception):
+                        raise feed
                     logging.info(f"WeWorkRemotely RSS: Found {len(feed.entries)} entries")
                     
-                    for entry in feed.entries[:8]:
+                    for entry in self.watermarks.fresh(rss_url, feed.entries, entry_id, entry_published):
                         title = entry.get('title', '').lower()
                         description = entry.get('description', '').lower()
                         
-                        if any(keyword in title or keyword in description for keyword in testing_keywords):
-                            job_id = f"weworkremotely_{entry.get('id', f'job_{len(jobs)}')}"
+                        if filter_profiles.profile('testing').matches(title=title, description=description):
+                            job_id = make_job_id('weworkremotely', entry.get('id'), entry.get('link'), entry.get('title'))
                             
                             if job_id not in self.tracked_jobs:
                                 job_entry = {
@@ -289,8 +278,6 @@ class Debugged24x7JobMonitor:
                                 }
                                 jobs.append(job_entry)
                     
-                    time.sleep(1)
-                    
                 except Exception as e:
                     logging.warning(f"WeWorkRemotely RSS error: {e}")
             
@@ -417,7 +404,7 @@ class Debugged24x7JobMonitor:
                     'disable_web_page_preview': True
                 }
                 
-                response = requests.post(url, data=data, timeout=15)
+                response = http_client.post(url, data=data, timeout=15)
                 
                 if response.status_code == 200:
                     logging.info(f"📱 Alert #{self.scan_count} sent successfully!")
@@ -448,23 +435,25 @@ class Debugged24x7JobMonitor:
             ("WeWorkRemotely", self.check_weworkremotely_enhanced)
         ]
         
-        # Check sources with timeout protection
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            future_to_source = {executor.submit(func): name for name, func in sources}
-            
-            for future in as_completed(future_to_source, timeout=60):
-                source_name = future_to_source[future]
+        # Check sources side by side with timeout protection; alert each source's jobs as soon as it finishes
+        source_names = {func: name for name, func in sources}
+        with alert_pipeline.AlertBatcher(self.send_enhanced_alert, rank=relevance.rank) as alerts:
+            for func, jobs in fetch_engine.iter_sources(list(source_names), deadline=30):
+                source_name = source_names[func]
                 try:
-                    jobs = future.result(timeout=30)
+                    if isinstance(jobs, Exception):
+                        raise jobs
                     
+                    new_jobs = []
                     for job in jobs:
                         if job['id'] not in self.tracked_jobs:
-                            # Optional Gemini analysis
-                            if self.gemini_config:
-                                job = self.analyze_job_with_gemini(job)
+                            # Local relevance score; Gemini only for jobs the classifier is unsure about
+                            job = self.classifier.classify(job, self.analyze_job_with_gemini if self.gemini_config else None)
                             
                             self.tracked_jobs[job['id']] = job
-                            all_new_jobs.append(job)
+                            new_jobs.append(job)
+                    alerts.add(new_jobs)
+                    all_new_jobs.extend(new_jobs)
                             
                 except Exception as e:
                     logging.error(f"❌ {source_name} failed: {e}")
@@ -473,9 +462,6 @@ class Debugged24x7JobMonitor:
             self.total_jobs_found += len(all_new_jobs)
             logging.info(f"\n🎉 FOUND {len(all_new_jobs)} NEW JOBS!")
             
-            # Send alert
-            self.send_enhanced_alert(all_new_jobs)
-            
             # Save jobs
             self.save_tracked_jobs()
             
@@ -483,6 +469,8 @@ class Debugged24x7JobMonitor:
             for job in all_new_jobs:
                 score_text = f" (AI: {job.get('ai_score', 'N/A')}/10)" if job.get('ai_score') else ""
                 logging.info(f"✅ NEW: {job['title']} at {job['company']}{score_text}")
+            logging.info(f"🧠 Classifier: {self.classifier.answered} jobs scored locally, "
+                         f"{self.classifier.asked} sent to Gemini")
                 
         else:
             logging.info("ℹ️ No new jobs in this scan")
@@ -4,8 +4,6 @@ ENHANCED REAL-TIME Job Monitor with Multiple Sources
 Provides immediate alerts for real testing jobs from multiple sources
 """
 
-import requests
-import json
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -13,8 +11,14 @@ import datetime
 import time
 import os
 import threading
-from concurrent.futures import ThreadPoolExecutor
-import feedparser
+import http_client
+import fetch_engine
+import relevance
+import alert_pipeline
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id
+from watermarks import Watermarks, watermark_path, entry_id, entry_published
 
 class EnhancedRealTimeMonitor:
     def __init__(self, email_config, telegram_config):
@@ -22,20 +26,17 @@ class EnhancedRealTimeMonitor:
         self.telegram_config = telegram_config
         self.jobs_file = "enhanced_realtime_jobs.json"
         self.load_tracked_jobs()
+        self.watermarks = Watermarks(watermark_path(self.jobs_file))
         self.scan_count = 0
         
     def load_tracked_jobs(self):
-        """Load previously tracked jobs from file"""
-        try:
-            with open(self.jobs_file, 'r') as f:
-                self.tracked_jobs = json.load(f)
-        except FileNotFoundError:
-            self.tracked_jobs = {}
+        """Load previously tracked jobs from the job store"""
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
-        """Save tracked jobs to file"""
-        with open(self.jobs_file, 'w') as f:
-            json.dump(self.tracked_jobs, f, indent=2)
+        """Save newly tracked jobs to the job store"""
+        self.tracked_jobs.save()
+        self.watermarks.save()
     
     def check_remoteok_enhanced(self):
         """Enhanced RemoteOK check with better filtering"""
@@ -49,34 +50,20 @@ class EnhancedRealTimeMonitor:
                 'Accept': 'application/json'
             }
             
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_client.get(url, headers=headers, timeout=15, conditional=True)
             if response.status_code == 200:
                 data = response.json()
                 
-                # Enhanced testing keywords
-                testing_keywords = [
-                    'test', 'testing', 'qa', 'quality assurance', 'automation',
-                    'selenium', 'cypress', 'junit', 'pytest', 'tester', 'sdet',
-                    'quality engineer', 'test engineer', 'automation engineer',
-                    'functional testing', 'regression testing', 'api testing',
-                    'performance testing', 'manual testing', 'test automation',
-                    'quality analyst', 'test analyst', 'software testing'
-                ]
-                
                 for job in data[1:30]:  # Check more jobs
                     position = job.get('position', '').lower()
                     description = job.get('description', '').lower()
                     tags = [tag.lower() for tag in job.get('tags', [])]
                     
                     # Enhanced filtering
-                    is_testing = (
-                        any(keyword in position for keyword in testing_keywords) or
-                        any(keyword in description for keyword in testing_keywords) or
-                        any(keyword in tag for keyword in testing_keywords for tag in tags)
-                    )
+                    is_testing = filter_profiles.profile('testing').matches(title=position, description=description, tags=tags)
                     
                     if is_testing:
-                        job_id = f"remoteok_enhanced_{job.get('id', '')}"
+                        job_id = make_job_id('remoteok_enhanced', job.get('id'), job.get('url'), job.get('position'), job.get('company'))
                         
                         if job_id not in self.tracked_jobs:
                             job_data = {
@@ -116,10 +103,10 @@ class EnhancedRealTimeMonitor:
             
             for url in urls:
                 try:
-                    feed = feedparser.parse(url)
+                    feed = http_client.fetch_feed(url)
                     
                     for entry in feed.entries[:5]:  # Recent entries
-                        job_id = f"stackoverflow_{entry.get('id', '')}"
+                        job_id = make_job_id('stackoverflow', entry.get('id'), entry.get('link'), entry.get('title'))
                         
                         if job_id not in self.tracked_jobs:
                             job_data = {
@@ -157,18 +144,16 @@ class EnhancedRealTimeMonitor:
                 'https://weworkremotely.com/categories/remote-dev-ops-sysadmin-jobs.rss'
             ]
             
-            testing_keywords = ['test', 'qa', 'quality', 'automation', 'sdet']
-            
             for rss_url in rss_urls:
                 try:
-                    feed = feedparser.parse(rss_url)
+                    feed = http_client.fetch_feed(rss_url, limit=10, seen_ids=self.watermarks.seen_ids(rss_url))
                     
-                    for entry in feed.entries[:10]:
+                    for entry in self.watermarks.fresh(rss_url, feed.entries, entry_id, entry_published):
                         title = entry.get('title', '').lower()
                         description = entry.get('description', '').lower()
                         
-                        if any(keyword in title or keyword in description for keyword in testing_keywords):
-                            job_id = f"weworkremotely_{entry.get('id', '')}"
+                        if filter_profiles.profile('testing').matches(title=title, description=description):
+                            job_id = make_job_id('weworkremotely', entry.get('id'), entry.get('link'), entry.get('title'))
                             
                             if job_id not in self.tracked_jobs:
                                 job_data = {
@@ -262,7 +247,7 @@ class EnhancedRealTimeMonitor:
                 'disable_web_page_preview': False
             }
             
-            response = requests.post(telegram_url, data=data, timeout=10)
+            response = http_client.post(telegram_url, data=data, timeout=10)
             
             if response.status_code == 200:
                 print(f"📱 INSTANT ALERT #{self.scan_count} sent with {len(new_jobs)} jobs!")
@@ -290,29 +275,24 @@ class EnhancedRealTimeMonitor:
             self.check_github_jobs
         ]
         
-        # Check all sources concurrently
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            future_to_source = {executor.submit(source): source.__name__ for source in sources}
-            
-            for future in future_to_source:
-                try:
-                    jobs = future.result(timeout=20)
-                    
-                    for job in jobs:
-                        if job['id'] not in self.tracked_jobs:
-                            self.tracked_jobs[job['id']] = job
-                            all_new_jobs.append(job)
-                            
-                except Exception as e:
-                    source_name = future_to_source[future]
-                    print(f"❌ {source_name} error: {str(e)}")
+        # Check all sources concurrently and alert each source's new jobs as soon as it finishes
+        with alert_pipeline.AlertBatcher(self.send_instant_alert, rank=relevance.rank) as alerts:
+            for source, jobs in fetch_engine.iter_sources(sources, deadline=20):
+                if isinstance(jobs, Exception):
+                    print(f"❌ {source.__name__} error: {str(jobs)}")
+                    continue
+                
+                new_jobs = []
+                for job in jobs:
+                    if job['id'] not in self.tracked_jobs:
+                        self.tracked_jobs[job['id']] = job
+                        new_jobs.append(job)
+                alerts.add(new_jobs)
+                all_new_jobs.extend(new_jobs)
         
         if all_new_jobs:
             print(f"\n🎉 FOUND {len(all_new_jobs)} NEW REAL JOBS!")
             
-            # Send instant alert
-            self.send_instant_alert(all_new_jobs)
-            
             # Save jobs
             self.save_tracked_jobs()
             
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Streaming Feed Reader
+Incremental RSS/Atom parsing that builds one entry at a time with only the fields the
+monitors read, and stops feeding the parser once enough new entries have been seen
+"""
+
+import time
+import logging
+import calendar
+import datetime
+from email.utils import parsedate_to_datetime
+from xml.etree.ElementTree import XMLPullParser, ParseError
+
+import feedparser
+
+from watermarks import STOP_AFTER_SEEN
+
+# Bytes handed to the parser at a time; reading stops between chunks
+CHUNK_SIZE = 16 * 1024
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+DC_CREATOR = '{http://purl.org/dc/elements/1.1/}creator'
+CONTENT_ENCODED = '{http://purl.org/rss/1.0/modules/content/}encoded'
+
+# The entry fields the monitors read; nothing else is kept
+ENTRY_FIELDS = ('id', 'title', 'link', 'author', 'summary', 'description',
+                'published', 'published_parsed', 'updated', 'updated_parsed')
+
+
+def _struct_time(value, parse):
+    try:
+        moment = parse(value.strip())
+    except (TypeError, ValueError, IndexError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    # Same UTC struct_time feedparser hands back in *_parsed
+    return time.gmtime(calendar.timegm(moment.utctimetuple()))
+
+
+def _iso_date(value):
+    return datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _text(element, tag):
+    child = element.find(tag)
+    return (child.text or '').strip() if child is not None else None
+
+
+def _rss_entry(item):
+    entry = feedparser.FeedParserDict()
+    for field, value in (
+        ('title', _text(item, 'title')),
+        ('link', _text(item, 'link')),
+        ('id', _text(item, 'guid')),
+        ('author', _text(item, 'author') or _text(item, DC_CREATOR)),
+        ('description', _text(item, 'description')),
+        ('published', _text(item, 'pubDate')),
+    ):
+        if value:
+            entry[field] = value
+    summary = entry.get('description') or _text(item, CONTENT_ENCODED)
+    if summary:
+        entry['summary'] = summary
+    if entry.get('published'):
+        entry['published_parsed'] = _struct_time(entry['published'], parsedate_to_datetime)
+    return entry
+
+
+def _atom_entry(element):
+    entry = feedparser.FeedParserDict()
+    links = element.findall(ATOM + 'link')
+    link = next((link.get('href') for link in links if link.get('rel', 'alternate') == 'alternate'), None)
+    author = element.find(ATOM + 'author')
+    for field, value in (
+        ('title', _text(element, ATOM + 'title')),
+        ('link', link or (links[0].get('href') if links else None)),
+        ('id', _text(element, ATOM + 'id')),
+        ('author', _text(author, ATOM + 'name') if author is not None else None),
+        ('summary', _text(element, ATOM + 'summary') or _text(element, ATOM + 'content')),
+        ('published', _text(element, ATOM + 'published')),
+        ('updated', _text(element, ATOM + 'updated')),
+    ):
+        if value:
+            entry[field] = value
+    for field in ('published', 'updated'):
+        if entry.get(field):
+            entry[field + '_parsed'] = _struct_time(entry[field], _iso_date)
+    return entry
+
+
+def iter_entries(content, chunk_size=CHUNK_SIZE):
+    """Entries of an RSS or Atom document in document order, parsed as the bytes are fed in.
+    Stop iterating and the rest of the document is never parsed."""
+    parser = XMLPullParser(events=('end',))
+    for start in range(0, len(content), chunk_size):
+        parser.feed(content[start:start + chunk_size])
+        for event, element in parser.read_events():
+            if element.tag == 'item':
+                yield _rss_entry(element)
+            elif element.tag == ATOM + 'entry':
+                yield _atom_entry(element)
+            else:
+                continue
+            # Done with this entry; drop its subtree so memory stays flat
+            element.clear()
+
+
+def trimmed(entry):
+    """A feedparser entry cut down to ENTRY_FIELDS"""
+    return feedparser.FeedParserDict({field: entry[field] for field in ENTRY_FIELDS if field in entry})
+
+
+def read_feed(content, headers=None, limit=None, seen_ids=None, stop_after_seen=STOP_AFTER_SEEN):
+    """Parsed feed with at most limit entries, cut short after stop_after_seen consecutive
+    entries whose id or link is in seen_ids. Documents that aren't well-formed XML go to
+    feedparser, which is lenient."""
+    seen_ids = seen_ids or set()
+    entries = []
+    seen_run = 0
+    try:
+        for entry in iter_entries(content):
+            entries.append(entry)
+            if str(entry.get('id') or entry.get('link')) in seen_ids:
+                seen_run += 1
+                if seen_run >= stop_after_seen:
+                    break
+            else:
+                seen_run = 0
+            if limit is not None and len(entries) >= limit:
+                break
+    except ParseError as e:
+        if not entries:
+            parsed = feedparser.parse(content, response_headers=headers or {})
+            bozo_exception = parsed.get('bozo_exception') or e
+            # Parser exceptions don't always survive pickling; the message is what gets logged
+            return feedparser.FeedParserDict(entries=[trimmed(entry) for entry in parsed.entries[:limit]],
+                                             feed={}, bozo=1, bozo_exception=str(bozo_exception))
+        logging.warning(f"Feed cut short by malformed XML after {len(entries)} entries: {e}")
+        return feedparser.FeedParserDict(entries=entries, feed={}, bozo=1, bozo_exception=str(e))
+    return feedparser.FeedParserDict(entries=entries, feed={}, bozo=0)
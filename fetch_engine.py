@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Async Fetch Engine
+One background event loop where every HTTP request is a task, capped globally and per host
+"""
+
+import time
+import queue
+import asyncio
+import threading
+import contextvars
+import logging
+from functools import partial
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+import http_client
+import circuit_breaker
+import parse_pool
+import scan_deadline
+
+# Requests in flight across all sources, and against any single host
+MAX_CONCURRENCY = 32
+MAX_PER_HOST = 4
+
+# Source methods that coordinate their own fetches run here instead of a per-scan pool
+MAX_SOURCES = 16
+
+
+class FetchEngine:
+    """Persistent asyncio loop that runs blocking HTTP calls on the shared pooled session"""
+
+    def __init__(self, max_concurrency=MAX_CONCURRENCY, max_per_host=MAX_PER_HOST, max_sources=MAX_SOURCES):
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+        self._io_pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='fetch-io')
+        self._source_pool = ThreadPoolExecutor(max_workers=max_sources, thread_name_prefix='fetch-source')
+        self._host_limits = {}
+        self._global_limit = None
+        self._started = threading.Event()
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name='fetch-engine', daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self._global_limit = asyncio.Semaphore(self.max_concurrency)
+        self.loop.call_soon(self._started.set)
+        self.loop.run_forever()
+
+    def _host_limit(self, url):
+        host = urlsplit(url).hostname or ''
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_limits[host]
+
+    async def _limited(self, url, func):
+        # Carry the calling source's context into the io thread so its responses are credited to it
+        context = contextvars.copy_context()
+        async with self._global_limit:
+            async with self._host_limit(url):
+                return await self.loop.run_in_executor(self._io_pool, context.run, func)
+
+    async def fetch(self, url, method='GET', **kwargs):
+        """Coroutine: one HTTP request through the shared session"""
+        return await self._limited(url, partial(http_client.request, method, url, **kwargs))
+
+    async def fetch_feed(self, url, limit=None, seen_ids=None, **kwargs):
+        """Coroutine: download one RSS/Atom feed on an io thread, then stream-parse it in the parse
+        pool so the io thread is free for the next download"""
+        result = await self._limited(url, partial(http_client.download_feed, url, **kwargs))
+        if not isinstance(result, requests.Response):
+            return result
+        return await parse_pool.run_async(self.loop, parse_pool.parse_feed, result.content,
+                                          http_client.feed_headers(result), limit, seen_ids)
+
+    def run(self, coroutine, timeout=None):
+        """Run a coroutine on the engine loop from any thread and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def _gather(self, coroutines, timeout):
+        async def gather():
+            return await asyncio.gather(*coroutines, return_exceptions=True)
+        return self.run(gather(), timeout)
+
+    def fetch_all(self, requests, timeout=None):
+        """Fetch many (url, kwargs) pairs concurrently; results line up with the input, errors are returned not raised"""
+        return self._gather([self.fetch(url, **kwargs) for url, kwargs in requests], timeout)
+
+    def fetch_feeds(self, urls, timeout=None, limit=None, seen=None, **kwargs):
+        """Download and parse many feeds concurrently; results line up with the input.
+        Each feed stops after limit entries, or at ids already seen: seen(url) -> set of ids"""
+        return self._gather([
+            self.fetch_feed(url, limit=limit, seen_ids=seen(url) if seen else None, **kwargs) for url in urls
+        ], timeout)
+
+    async def _run_source(self, source, deadline):
+        breaker = circuit_breaker.source_breakers.get(circuit_breaker.source_name(source))
+        if not breaker.allow():
+            logging.info(f"⏭️ Skipping {breaker.name}: circuit open for {breaker.retry_in():.0f}s more")
+            return source, []
+
+        started = time.monotonic()
+        # The source thread inherits the scan deadline, so its own requests stop when it does
+        context = contextvars.copy_context()
+        try:
+            jobs, activity = await asyncio.wait_for(
+                self.loop.run_in_executor(self._source_pool, context.run, circuit_breaker.run_tracked, source),
+                scan_deadline.remaining())
+        except asyncio.TimeoutError:
+            breaker.record(False, time.monotonic() - started)
+            return source, scan_deadline.DeadlineExceeded(f"still running at the {deadline}s scan deadline")
+        except Exception as e:
+            breaker.record(False, time.monotonic() - started)
+            return source, e
+        # A source that returned nothing without a single usable response is dead or a stub
+        breaker.record(bool(jobs) or activity.responses > 0, time.monotonic() - started)
+        return source, jobs
+
+    def _stream_sources(self, sources, deadline):
+        results = queue.Queue()
+
+        async def report(index, source):
+            results.put((index, await self._run_source(source, deadline)))
+
+        async def run_all():
+            await asyncio.gather(*[report(index, source) for index, source in enumerate(sources)])
+
+        with scan_deadline.bounded(deadline):
+            asyncio.run_coroutine_threadsafe(run_all(), self.loop)
+        for _ in sources:
+            yield results.get()
+
+    def iter_sources(self, sources, deadline=None):
+        """Run blocking source methods side by side under one hard scan deadline and yield
+        (source, jobs or exception) pairs in completion order, each as soon as its source finishes.
+        Sources still running at the deadline are cut off at their next request.
+        Sources whose circuit is open are skipped and come back with no jobs."""
+        for index, result in self._stream_sources(sources, deadline):
+            yield result
+
+    def run_sources(self, sources, deadline=None):
+        """Same as iter_sources, but waits for every source and returns the pairs in input order"""
+        return [result for index, result in sorted(self._stream_sources(sources, deadline), key=lambda item: item[0])]
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+        self._io_pool.shutdown(wait=False)
+        self._source_pool.shutdown(wait=False)
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Process-wide fetch engine, started on first use"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = FetchEngine()
+                logging.info(f"⚡ Fetch engine started ({MAX_CONCURRENCY} concurrent, {MAX_PER_HOST} per host)")
+    return _engine
+
+
+def fetch_all(requests, timeout=None):
+    return get_engine().fetch_all(requests, timeout)
+
+
+def fetch_feeds(urls, timeout=None, limit=None, seen=None, **kwargs):
+    return get_engine().fetch_feeds(urls, timeout, limit=limit, seen=seen, **kwargs)
+
+
+def iter_sources(sources, deadline=None):
+    return get_engine().iter_sources(sources, deadline)
+
+
+def run_sources(sources, deadline=None):
+    return get_engine().run_sources(sources, deadline)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Filter Profiles
+Job filter criteria read from filter_profiles.json instead of keyword lists in each monitor.
+Each profile is compiled once into a single keyword automaton and judges a job in one pass
+over its fields.
+
+A profile is a set of keyword groups:
+    role         include (at least one include group must match), required (every one must
+                 match), exclude (none may match, unless its `unless` group did) or optional
+                 (decides nothing on its own, only referenced by `unless`)
+    fields       job fields the keywords count in: title, company, location, description, tags
+    whole_words  keywords must start and end on a word boundary; a trailing * leaves the end open
+    keywords     a list, or the name of a shared list under the file's top-level "keywords"
+"""
+
+import os
+import json
+import bisect
+import logging
+import threading
+
+import keyword_matcher
+
+PROFILES_FILE = os.environ.get('JOB_MONITOR_FILTER_PROFILES',
+                               os.path.join(os.path.dirname(os.path.abspath(__file__)), 'filter_profiles.json'))
+
+FIELDS = ('title', 'company', 'location', 'description', 'tags')
+ROLES = ('include', 'required', 'exclude', 'optional')
+
+# Joins a job's fields into one text; no keyword contains it, so no hit can span two fields
+FIELD_SEPARATOR = '\x00'
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+class FilterProfile:
+    """One profile's groups behind one automaton"""
+
+    def __init__(self, name, groups, keyword_lists=None):
+        self.name = name
+        self.groups = {}
+        self.open_ended = set()
+        keywords = {}
+        for group, spec in groups.items():
+            where = f"filter profile {name!r}, group {group!r}"
+            role = spec.get('role', 'include')
+            if role not in ROLES:
+                raise ValueError(f"{where}: role must be one of {', '.join(ROLES)}, not {role!r}")
+            fields = spec.get('fields', FIELDS)
+            unknown = sorted(set(fields) - set(FIELDS))
+            if unknown:
+                raise ValueError(f"{where}: unknown fields {unknown}")
+            unless = spec.get('unless')
+            if unless is not None and unless not in groups:
+                raise ValueError(f"{where}: unless names missing group {unless!r}")
+            words = spec.get('keywords')
+            if isinstance(words, str):
+                if words not in (keyword_lists or {}):
+                    raise ValueError(f"{where}: no keyword list named {words!r}")
+                words = keyword_lists[words]
+            if not words:
+                raise ValueError(f"{where}: no keywords")
+
+            keywords[group] = []
+            for keyword in words:
+                keyword = str(keyword).strip().lower()
+                if keyword.endswith('*'):
+                    keyword = keyword.rstrip('*')
+                    self.open_ended.add((group, keyword))
+                keywords[group].append(keyword)
+            self.groups[group] = {
+                'role': role,
+                'fields': frozenset(fields),
+                'whole_words': bool(spec.get('whole_words')),
+                'unless': unless,
+            }
+
+        # Only the fields some group reads are joined into the text that gets scanned
+        self.keywords = keywords
+        self.fields = tuple(field for field in FIELDS if any(field in spec['fields'] for spec in self.groups.values()))
+        self._matcher = keyword_matcher.KeywordMatcher(keywords)
+        self._include = {group for group, spec in self.groups.items() if spec['role'] == 'include'}
+        self._required = {group for group, spec in self.groups.items() if spec['role'] == 'required'}
+        self._excludes = {group: spec['unless'] for group, spec in self.groups.items() if spec['role'] == 'exclude'}
+
+    def _text(self, fields):
+        unknown = sorted(set(fields) - set(FIELDS))
+        if unknown:
+            raise TypeError(f"unknown job fields {unknown}")
+        parts = []
+        starts = []
+        position = 0
+        for field in self.fields:
+            value = fields.get(field) or ''
+            if isinstance(value, (list, tuple, set)):
+                value = ' '.join(str(item) for item in value)
+            value = str(value).lower()
+            parts.append(value)
+            starts.append(position)
+            position += len(value) + len(FIELD_SEPARATOR)
+        return FIELD_SEPARATOR.join(parts), starts
+
+    def _bounded(self, text, start, end, open_ended):
+        if start > 0 and _is_word_char(text[start - 1]):
+            return False
+        return open_ended or end == len(text) or not _is_word_char(text[end])
+
+    def _counts(self, group, field, text, start, end, keyword):
+        spec = self.groups[group]
+        if field not in spec['fields']:
+            return False
+        return not spec['whole_words'] or self._bounded(text, start, end, (group, keyword) in self.open_ended)
+
+    def _found(self, fields):
+        """Each group the first time one of its keywords turns up in its own fields"""
+        text, starts = self._text(fields)
+        found = set()
+        for start, end, keyword, names in self._matcher.spans(text):
+            pending = names - found
+            if not pending:
+                continue
+            field = self.fields[bisect.bisect_right(starts, start) - 1]
+            for group in pending:
+                if self._counts(group, field, text, start, end, keyword):
+                    found.add(group)
+                    yield group
+            if len(found) == len(self.groups):
+                return
+
+    def hits(self, **fields):
+        """(group, keyword, field) for every keyword occurrence that counts, in text order"""
+        text, starts = self._text(fields)
+        for start, end, keyword, names in self._matcher.spans(text):
+            field = self.fields[bisect.bisect_right(starts, start) - 1]
+            for group in names:
+                if self._counts(group, field, text, start, end, keyword):
+                    yield group, keyword, field
+
+    def explain(self, **fields):
+        """Every keyword that counted, by group, for debugging criteria"""
+        hits = {}
+        for group, keyword, field in self.hits(**fields):
+            hits.setdefault(group, set()).add(keyword)
+        return {group: sorted(keywords) for group, keywords in hits.items()}
+
+    def matched(self, **fields):
+        """Names of the groups that matched the job"""
+        return set(self._found(fields))
+
+    def decide(self, found):
+        """Whether a job whose matched groups are `found` passes"""
+        if self._include and not found & self._include:
+            return False
+        if not self._required <= found:
+            return False
+        return not any(group in found and (unless is None or unless not in found)
+                       for group, unless in self._excludes.items())
+
+    def matches(self, **fields):
+        """Whether the job passes, e.g. matches(title=..., description=..., tags=[...])"""
+        found = set()
+        for group in self._found(fields):
+            found.add(group)
+            if group in self._excludes and self._excludes[group] is None:
+                # Nothing later in the text can bring this job back
+                return False
+        return self.decide(found)
+
+
+def load_profiles(path=PROFILES_FILE):
+    """Every profile in a profile file, compiled"""
+    with open(path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    keyword_lists = spec.get('keywords', {})
+    return {name: FilterProfile(name, profile['groups'], keyword_lists)
+            for name, profile in spec['profiles'].items()}
+
+
+_profiles = None
+_profiles_lock = threading.Lock()
+
+
+def profiles():
+    """Process-wide profiles, loaded and compiled on first use"""
+    global _profiles
+    if _profiles is None:
+        with _profiles_lock:
+            if _profiles is None:
+                _profiles = load_profiles()
+                logging.info(f"🎯 Loaded {len(_profiles)} filter profiles from {PROFILES_FILE}")
+    return _profiles
+
+
+def set_profiles(loaded):
+    """Swap the process-wide profiles (tests, alternative criteria)"""
+    global _profiles
+    with _profiles_lock:
+        _profiles = loaded
+
+
+def profile(name):
+    """The compiled profile called name"""
+    loaded = profiles()
+    if name not in loaded:
+        raise KeyError(f"No filter profile {name!r} in {PROFILES_FILE} (have {', '.join(sorted(loaded))})")
+    return loaded[name]
@@ -4,14 +4,20 @@ GitHub Actions Compatible Job Monitor
 Single scan for real-time job alerts
 """
 
-import requests
-import json
 import datetime
 import time
 import os
 import logging
-from concurrent.futures import ThreadPoolExecutor
-import feedparser
+import http_client
+import fetch_engine
+import relevance
+import alert_pipeline
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id
+from job_dedup import NearDuplicateIndex
+from watermarks import Watermarks, watermark_path, reed_id, reed_posted, jooble_id, jooble_updated
+from pagination import reed_search, jooble_search
 
 # GitHub Actions logging
 logging.basicConfig(
@@ -32,16 +38,18 @@ class GitHubJobMonitor:
         self.tracked_jobs = {}
         self.load_tracked_jobs()
         
+        self.watermarks = Watermarks(watermark_path(self.jobs_file))
+        
+        # Fingerprints of recent jobs so reposts on other sources are not alerted twice
+        self.near_duplicates = NearDuplicateIndex()
+        self.near_duplicates.seed(reversed(self.tracked_jobs.recent(2000)))
+        
     def load_tracked_jobs(self):
-        try:
-            with open(self.jobs_file, 'r', encoding='utf-8') as f:
-                self.tracked_jobs = json.load(f)
-        except:
-            self.tracked_jobs = {}
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
-        with open(self.jobs_file, 'w', encoding='utf-8') as f:
-            json.dump(self.tracked_jobs, f, indent=2, ensure_ascii=False)
+        self.tracked_jobs.save()
+        self.watermarks.save()
     
     def send_telegram_alert(self, jobs):
         """Send Telegram alert for new jobs"""
@@ -69,7 +77,7 @@ class GitHubJobMonitor:
                 'parse_mode': 'Markdown'
             }
             
-            response = requests.post(url, data=data, timeout=10)
+            response = http_client.post(url, data=data, timeout=10)
             if response.status_code == 200:
                 logging.info(f"✅ Telegram alert sent for {len(jobs)} jobs")
                 return True
@@ -87,7 +95,7 @@ class GitHubJobMonitor:
             url = "https://remoteok.io/api"
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
             
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_client.get(url, headers=headers, timeout=15, conditional=True)
             if response.status_code != 200:
                 return []
             
@@ -97,28 +105,16 @@ class GitHubJobMonitor:
             
             # Skip first element (metadata)
             jobs = jobs_data[1:] if isinstance(jobs_data, list) and len(jobs_data) > 1 else []
+            jobs = [job for job in jobs if isinstance(job, dict)]
             
             new_jobs = []
-            for job in jobs:
-                if not isinstance(job, dict):
-                    continue
-                
+            for job in self.watermarks.fresh('remoteok', jobs, lambda job: job.get('id'), lambda job: job.get('epoch')):
                 # Check for testing keywords and experience
                 title = str(job.get('position', '')).lower()
                 description = str(job.get('description', '')).lower()
                 tags = [str(tag).lower() for tag in job.get('tags', [])]
                 
-                # Testing keywords
-                testing_keywords = ['test', 'qa', 'quality assurance', 'automation', 'selenium', 'cypress']
-                has_testing = any(keyword in title for keyword in testing_keywords) or \
-                             any(keyword in description for keyword in testing_keywords) or \
-                             any(keyword in ' '.join(tags) for keyword in testing_keywords)
-                
-                # Experience keywords for 2+ years
-                exp_keywords = ['2+ year', '2 year', 'experienced', 'senior', '3+ year', '4+ year', '5+ year']
-                has_experience = any(keyword in description for keyword in exp_keywords)
-                
-                if has_testing and has_experience:
+                if filter_profiles.profile('testing_2_plus_years').matches(title=title, description=description, tags=tags):
                     job_id = str(job.get('id', ''))
                     if job_id and job_id not in self.tracked_jobs:
                         new_job = {
@@ -145,7 +141,7 @@ class GitHubJobMonitor:
         """Scan Stack Overflow Jobs RSS feed"""
         try:
             url = "https://stackoverflow.com/jobs/feed"
-            feed = feedparser.parse(url)
+            feed = http_client.fetch_feed(url)
             
             new_jobs = []
             for entry in feed.entries[:20]:  # Check latest 20 jobs
@@ -153,9 +149,8 @@ class GitHubJobMonitor:
                 summary = entry.summary.lower() if hasattr(entry, 'summary') else ''
                 
                 # Check for testing keywords
-                testing_keywords = ['test', 'qa', 'quality', 'automation', 'selenium']
-                if any(keyword in title or keyword in summary for keyword in testing_keywords):
-                    job_id = f"so_{hash(entry.link)}"
+                if filter_profiles.profile('testing').matches(title=title, description=summary):
+                    job_id = make_job_id('so', None, entry.link)
                     
                     if job_id not in self.tracked_jobs:
                         new_job = {
@@ -188,17 +183,17 @@ class GitHubJobMonitor:
             ]
             
             new_jobs = []
-            for feed_url in feeds:
+            for feed in fetch_engine.fetch_feeds(feeds):
                 try:
-                    feed = feedparser.parse(feed_url)
+                    if isinstance(feed, Exception):
+                        raise feed
                     for entry in feed.entries[:10]:  # Check latest 10 from each feed
                         title = entry.title.lower()
                         summary = entry.summary.lower() if hasattr(entry, 'summary') else ''
                         
                         # Check for experience level
-                        exp_keywords = ['2+ year', '2 year', 'experienced', 'senior']
-                        if any(keyword in summary for keyword in exp_keywords):
-                            job_id = f"indeed_{hash(entry.link)}"
+                        if filter_profiles.profile('2_plus_years').matches(description=summary):
+                            job_id = make_job_id('indeed', None, entry.link)
                             
                             if job_id not in self.tracked_jobs:
                                 new_job = {
@@ -225,48 +220,25 @@ class GitHubJobMonitor:
     def scan_reed_uk(self):
         """Scan Reed.co.uk API for testing jobs"""
         try:
-            # Reed.co.uk API endpoint
-            base_url = "https://www.reed.co.uk/api/1.0/search"
-            
             # Search parameters for testing jobs
             params = {
                 'keywords': 'software testing OR qa automation OR test engineer',
                 'locationName': '',  # All locations
                 'distanceFromLocation': 50,
-                'permanent': 'true',
-                'resultsToTake': 20,
-                'resultsToSkip': 0
+                'permanent': 'true'
             }
             
-            # API authentication (Reed uses basic auth with API key as username)
-            auth = (self.reed_api_key, '')
             headers = {'User-Agent': 'JobMonitor/1.0'}
-            
-            response = requests.get(base_url, params=params, auth=auth, headers=headers, timeout=15)
-            
-            if response.status_code != 200:
-                logging.error(f"❌ Reed API failed: {response.status_code}")
-                return []
-            
-            data = response.json()
-            jobs_data = data.get('results', [])
+            jobs_data = reed_search(self.reed_api_key, params, headers)
             
             new_jobs = []
-            for job in jobs_data:
+            for job in self.watermarks.fresh('reed', jobs_data, reed_id, reed_posted, ordered=False):
                 # Check for testing keywords and experience
                 title = str(job.get('jobTitle', '')).lower()
                 description = str(job.get('jobDescription', '')).lower()
                 
-                # Testing keywords
-                testing_keywords = ['test', 'qa', 'quality assurance', 'automation', 'selenium', 'cypress']
-                has_testing = any(keyword in title or keyword in description for keyword in testing_keywords)
-                
-                # Experience keywords for 2+ years
-                exp_keywords = ['2+ year', '2 year', 'experienced', 'senior', '3+ year', '4+ year', '5+ year']
-                has_experience = any(keyword in description for keyword in exp_keywords)
-                
-                if has_testing and has_experience:
-                    job_id = f"reed_{job.get('jobId', '')}"
+                if filter_profiles.profile('testing_2_plus_years').matches(title=title, description=description):
+                    job_id = make_job_id('reed', job.get('jobId'), job.get('jobUrl'), job.get('jobTitle'), job.get('employerName'))
                     
                     if job_id not in self.tracked_jobs:
                         # Format salary
@@ -303,9 +275,6 @@ class GitHubJobMonitor:
     def scan_jooble(self):
         """Scan Jooble API for testing jobs worldwide"""
         try:
-            # Jooble API endpoint
-            base_url = f"https://jooble.org/api/{self.jooble_api_key}"
-            
             # Search parameters for testing jobs
             search_params = {
                 'keywords': 'software testing QA automation test engineer',
@@ -323,32 +292,17 @@ class GitHubJobMonitor:
                 'User-Agent': 'JobMonitor/1.0'
             }
             
-            response = requests.post(base_url, json=search_params, headers=headers, timeout=15)
-            
-            if response.status_code != 200:
-                logging.error(f"❌ Jooble API failed: {response.status_code}")
-                return []
-            
-            data = response.json()
-            jobs_data = data.get('jobs', [])
+            jobs_data = jooble_search(self.jooble_api_key, search_params, headers)
             
             new_jobs = []
-            for job in jobs_data[:20]:  # Process up to 20 jobs
+            for job in self.watermarks.fresh('jooble', jobs_data, jooble_id, jooble_updated, ordered=False):
                 # Check for testing keywords and experience
                 title = str(job.get('title', '')).lower()
                 snippet = str(job.get('snippet', '')).lower()
                 company = str(job.get('company', ''))
                 
-                # Testing keywords
-                testing_keywords = ['test', 'qa', 'quality assurance', 'automation', 'selenium', 'cypress', 'junit', 'testng']
-                has_testing = any(keyword in title or keyword in snippet for keyword in testing_keywords)
-                
-                # Experience keywords for 2+ years
-                exp_keywords = ['2+ year', '2 year', 'experienced', 'senior', '3+ year', '4+ year', '5+ year', 'experience']
-                has_experience = any(keyword in snippet for keyword in exp_keywords)
-                
-                if has_testing and has_experience:
-                    job_id = f"jooble_{hash(job.get('link', ''))}"
+                if filter_profiles.profile('testing_2_plus_or_experience').matches(title=title, description=snippet):
+                    job_id = make_job_id('jooble', job.get('id'), job.get('link'), job.get('title'), job.get('company'))
                     
                     if job_id not in self.tracked_jobs:
                         # Format salary if available
@@ -383,21 +337,23 @@ class GitHubJobMonitor:
         all_new_jobs = []
         
         # Scan all sources concurrently (including Reed.co.uk and Jooble)
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [
-                executor.submit(self.scan_remoteok),
-                executor.submit(self.scan_stackoverflow),
-                executor.submit(self.scan_indeed_rss),
-                executor.submit(self.scan_reed_uk),
-                executor.submit(self.scan_jooble)
-            ]
-            
-            for future in futures:
-                try:
-                    jobs = future.result(timeout=30)
-                    all_new_jobs.extend(jobs)
-                except Exception as e:
-                    logging.error(f"Scan error: {str(e)}")
+        sources = [
+            self.scan_remoteok,
+            self.scan_stackoverflow,
+            self.scan_indeed_rss,
+            self.scan_reed_uk,
+            self.scan_jooble
+        ]
+        
+        # Alert each source's new jobs as soon as it finishes, collapsing postings already seen on another source
+        with alert_pipeline.AlertBatcher(self.send_telegram_alert, rank=relevance.rank) as alerts:
+            for source, jobs in fetch_engine.iter_sources(sources, deadline=30):
+                if isinstance(jobs, Exception):
+                    logging.error(f"Scan error: {str(jobs)}")
+                    continue
+                new_jobs = self.near_duplicates.collapse(jobs, self.tracked_jobs)
+                alerts.add(new_jobs)
+                all_new_jobs.extend(new_jobs)
         
         # Send alerts if new jobs found
         if all_new_jobs:
@@ -406,9 +362,6 @@ class GitHubJobMonitor:
             # Save tracked jobs
             self.save_tracked_jobs()
             
-            # Send Telegram alert
-            self.send_telegram_alert(all_new_jobs)
-            
             # Log success
             logging.info(f"✅ GitHub Actions scan complete: {len(all_new_jobs)} jobs processed")
             
@@ -430,6 +383,10 @@ if __name__ == "__main__":
             print(f"✅ SUCCESS! Found {new_jobs} new testing jobs!")
         else:
             print("ℹ️ No new jobs in this scan - monitoring continues...")
+        
+        # Flush the job store and watermarks before the workflow commits them
+        monitor.tracked_jobs.close()
+        monitor.watermarks.save()
             
     except Exception as e:
         logging.error(f"❌ Monitor error: {str(e)}")
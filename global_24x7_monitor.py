@@ -4,8 +4,6 @@
 Monitors Indeed + Multiple Job Portals Worldwide with Immediate Telegram Alerts
 """
 
-import requests
-import json
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -13,12 +11,18 @@ import datetime
 import time
 import os
 import threading
-from concurrent.futures import ThreadPoolExecutor
-import feedparser
-from bs4 import BeautifulSoup
 import random
 from urllib.parse import quote, urljoin
 import schedule
+import http_client
+import fetch_engine
+import relevance
+import alert_pipeline
+import indeed_cards
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id, stable_digest
+from watermarks import Watermarks, watermark_path, entry_id, entry_published
 
 class Global24x7JobMonitor:
     def __init__(self, email_config, telegram_config):
@@ -26,6 +30,7 @@ class Global24x7JobMonitor:
         self.telegram_config = telegram_config
         self.jobs_file = "global_24x7_jobs.json"
         self.load_tracked_jobs()
+        self.watermarks = Watermarks(watermark_path(self.jobs_file))
         self.alert_count = 0
         self.running = True
         
@@ -45,17 +50,13 @@ class Global24x7JobMonitor:
         ]
         
     def load_tracked_jobs(self):
-        """Load previously tracked jobs from file"""
-        try:
-            with open(self.jobs_file, 'r') as f:
-                self.tracked_jobs = json.load(f)
-        except FileNotFoundError:
-            self.tracked_jobs = {}
+        """Load previously tracked jobs from the job store"""
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
-        """Save tracked jobs to file"""
-        with open(self.jobs_file, 'w') as f:
-            json.dump(self.tracked_jobs, f, indent=2)
+        """Save newly tracked jobs to the job store"""
+        self.tracked_jobs.save()
+        self.watermarks.save()
     
     def get_random_headers(self):
         """Get randomized headers for web scraping"""
@@ -107,34 +108,38 @@ class Global24x7JobMonitor:
         try:
             print("🌍 Scanning Indeed Globally...")
             
-            for country, domain in indeed_domains.items():
-                for query in testing_queries[:2]:  # Use first 2 queries per country
-                    try:
-                        url = f"https://{domain}/jobs?q={query}&sort=date&limit=10"
-                        headers = self.get_random_headers()
-                        
-                        # Random delay to avoid blocking
-                        time.sleep(random.uniform(2, 5))
-                        
-                        response = requests.get(url, headers=headers, timeout=15)
-                        
-                        if response.status_code == 200:
-                            soup = BeautifulSoup(response.content, 'html.parser')
-                            
-                            # Look for job cards
-                            job_cards = soup.find_all(['div', 'article'], attrs={'data-jk': True}) or \
-                                       soup.find_all('div', class_=lambda x: x and 'job' in x.lower())
-                            
-                            for card in job_cards[:5]:  # Limit per search
-                                job_data = self.extract_indeed_job(card, country, domain)
-                                if job_data and self.is_valid_testing_job(job_data):
-                                    jobs.append(job_data)
-                                    
-                        time.sleep(random.uniform(3, 7))  # Delay between requests
-                        
-                    except Exception as e:
-                        print(f"⚠️ Indeed {country} error: {str(e)}")
-                        continue
+            # First 2 queries per country, all fetched at once (per-host limits replace the old sleeps)
+            searches = [
+                (country, domain, f"https://{domain}/jobs?q={query}&sort=date&limit=10")
+                for country, domain in indeed_domains.items()
+                for query in testing_queries[:2]
+            ]
+            responses = fetch_engine.fetch_all(
+                [(url, {'headers': self.get_random_headers(), 'timeout': 15}) for country, domain, url in searches]
+            )
+            
+            pages = []
+            for (country, domain, url), response in zip(searches, responses):
+                if isinstance(response, Exception):
+                    print(f"⚠️ Indeed {country} error: {str(response)}")
+                elif response.status_code == 200:
+                    pages.append((country, domain, response))
+            
+            # Pages are parsed side by side in the parse pool: embedded job JSON, or the
+            # job-card region when the page has none; limited per search
+            parsed = indeed_cards.extract_all([
+                (response.content, 5, domain) for country, domain, response in pages
+            ])
+            
+            for (country, domain, response), cards in zip(pages, parsed):
+                if isinstance(cards, Exception):
+                    print(f"⚠️ Indeed {country} error: {str(cards)}")
+                    continue
+                
+                for card in cards:
+                    job_data = self.extract_indeed_job(card, country, domain)
+                    if job_data and self.is_valid_testing_job(job_data):
+                        jobs.append(job_data)
                         
             print(f"✅ Indeed Global: {len(jobs)} testing jobs found")
             
@@ -144,29 +149,13 @@ class Global24x7JobMonitor:
         return jobs
     
     def extract_indeed_job(self, card, country, domain):
-        """Extract job data from Indeed card"""
+        """Build job data from an extracted Indeed card"""
         try:
-            # Extract title
-            title_elem = card.find('h2') or card.find('a', attrs={'data-jk': True})
-            title = title_elem.get_text().strip() if title_elem else "N/A"
-            
-            # Extract company
-            company_elem = card.find('span', class_=lambda x: x and 'company' in x.lower()) or \
-                          card.find('div', class_=lambda x: x and 'company' in x.lower())
-            company = company_elem.get_text().strip() if company_elem else "N/A"
-            
-            # Extract location
-            location_elem = card.find('div', attrs={'data-testid': 'job-location'}) or \
-                           card.find('span', class_=lambda x: x and 'location' in x.lower())
-            location = location_elem.get_text().strip() if location_elem else f"{country}"
-            
-            # Extract job ID
-            job_id = card.get('data-jk') or f"indeed_{country}_{random.randint(10000, 99999)}"
-            
-            # Extract description
-            snippet_elem = card.find('div', class_=lambda x: x and 'snippet' in x.lower()) or \
-                          card.find('div', class_=lambda x: x and 'summary' in x.lower())
-            snippet = snippet_elem.get_text().strip() if snippet_elem else "Software testing position"
+            title = card['title'] or "N/A"
+            company = card['company'] or "N/A"
+            location = card['location'] or f"{country}"
+            job_id = card['job_key'] or stable_digest(title, company, location)
+            snippet = card['snippet'] or "Software testing position"
             
             # Build URL
             job_url = f"https://{domain}/viewjob?jk={job_id}"
@@ -181,7 +170,7 @@ class Global24x7JobMonitor:
                 'country': country,
                 'source': f'Indeed {country}',
                 'date_found': datetime.datetime.now().isoformat(),
-                'salary': 'Not specified'
+                'salary': card.get('salary') or 'Not specified'
             }
             
         except Exception as e:
@@ -197,14 +186,14 @@ class Global24x7JobMonitor:
             url = "https://remoteok.io/api"
             headers = self.get_random_headers()
             
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_client.get(url, headers=headers, timeout=15, conditional=True)
             if response.status_code == 200:
                 data = response.json()
                 
                 for job in data[1:30]:  # Check first 30 jobs
                     if self.is_valid_testing_job_api(job):
                         job_data = {
-                            'id': f"remoteok_global_{job.get('id', '')}",
+                            'id': make_job_id('remoteok_global', job.get('id'), job.get('url'), job.get('position'), job.get('company')),
                             'title': job.get('position', 'N/A'),
                             'company': job.get('company', 'N/A'),
                             'location': 'Remote (Global)',
@@ -283,19 +272,18 @@ class Global24x7JobMonitor:
                 'https://weworkremotely.com/categories/remote-dev-ops-sysadmin-jobs.rss'
             ]
             
-            testing_keywords = ['test', 'qa', 'quality', 'automation', 'sdet']
-            
-            for rss_url in rss_urls:
+            for rss_url, feed in zip(rss_urls, fetch_engine.fetch_feeds(rss_urls, limit=8, seen=self.watermarks.seen_ids)):
                 try:
-                    feed = feedparser.parse(rss_url)
+                    if isinstance(feed, Exception):
+                        raise feed
                     
-                    for entry in feed.entries[:8]:
+                    for entry in self.watermarks.fresh(rss_url, feed.entries, entry_id, entry_published):
                         title = entry.get('title', '').lower()
                         description = entry.get('description', '').lower()
                         
-                        if any(keyword in title or keyword in description for keyword in testing_keywords):
+                        if filter_profiles.profile('testing').matches(title=title, description=description):
                             job_data = {
-                                'id': f"weworkremotely_{entry.get('id', random.randint(10000, 99999))}",
+                                'id': make_job_id('weworkremotely', entry.get('id'), entry.get('link'), entry.get('title')),
                                 'title': entry.get('title', 'N/A'),
                                 'company': 'Various Companies',
                                 'location': 'Remote (Global)',
@@ -330,13 +318,14 @@ class Global24x7JobMonitor:
                 'https://stackoverflow.com/jobs/feed?q=qa+automation'
             ]
             
-            for feed_url in feeds:
+            for feed in fetch_engine.fetch_feeds(feeds):
                 try:
-                    feed = feedparser.parse(feed_url)
+                    if isinstance(feed, Exception):
+                        raise feed
                     
                     for entry in feed.entries[:5]:
                         job_data = {
-                            'id': f"stackoverflow_{entry.get('id', random.randint(10000, 99999))}",
+                            'id': make_job_id('stackoverflow', entry.get('id'), entry.get('link'), entry.get('title')),
                             'title': entry.get('title', 'N/A'),
                             'company': entry.get('author', 'N/A'),
                             'location': 'Various',
@@ -429,30 +418,8 @@ class Global24x7JobMonitor:
         title = job_data.get('title', '').lower()
         snippet = job_data.get('snippet', '').lower()
         
-        # Testing keywords
-        testing_keywords = [
-            'test', 'testing', 'qa', 'quality assurance', 'automation',
-            'selenium', 'cypress', 'junit', 'pytest', 'tester', 'sdet',
-            'quality engineer', 'test engineer', 'automation engineer',
-            'test analyst', 'qa analyst', 'software testing'
-        ]
-        
-        # Experience keywords (2+ years)
-        experience_keywords = [
-            '2 year', '3 year', '4 year', '5 year', '6 year', '7 year',
-            '2+', '3+', '4+', '5+', '2-3', '3-4', '4-5', '5-6',
-            'experienced', 'senior', 'mid-level', 'intermediate',
-            'minimum 2', 'at least 2', '2 or more'
-        ]
-        
-        # Must have testing keywords
-        has_testing = any(keyword in title or keyword in snippet for keyword in testing_keywords)
-        
-        # Should have experience indicators (or be open to mid-level)
-        has_experience = any(keyword in snippet for keyword in experience_keywords) or \
-                        ('junior' not in snippet and 'entry' not in snippet and 'graduate' not in snippet)
-        
-        return has_testing and has_experience
+        # Testing role with experience indicators, or at least not a junior one
+        return filter_profiles.profile('testing_not_junior').matches(title=title, description=snippet)
     
     def is_valid_testing_job_api(self, job_api_data):
         """Check if API job data is valid testing position"""
@@ -460,13 +427,8 @@ class Global24x7JobMonitor:
         description = job_api_data.get('description', '').lower()
         tags = [tag.lower() for tag in job_api_data.get('tags', [])]
         
-        testing_keywords = [
-            'test', 'testing', 'qa', 'quality', 'automation', 'selenium',
-            'cypress', 'junit', 'pytest', 'tester', 'sdet'
-        ]
-        
-        return any(keyword in position or keyword in description or keyword in tag 
-                  for keyword in testing_keywords for tag in tags)
+        # Untagged jobs never pass, as before
+        return bool(tags) and filter_profiles.profile('testing').matches(title=position, description=description, tags=tags)
     
     def send_immediate_alert(self, new_jobs):
         """Send immediate Telegram alert for new jobs"""
@@ -522,7 +484,7 @@ class Global24x7JobMonitor:
                 'disable_web_page_preview': False
             }
             
-            response = requests.post(telegram_url, data=data, timeout=10)
+            response = http_client.post(telegram_url, data=data, timeout=10)
             
             if response.status_code == 200:
                 print(f"📱 URGENT ALERT #{self.alert_count} sent with {len(new_jobs)} jobs!")
@@ -544,22 +506,20 @@ class Global24x7JobMonitor:
         
         all_new_jobs = []
         
-        # Run all sources concurrently for speed
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            future_to_source = {executor.submit(source): source.__name__ for source in self.global_sources}
-            
-            for future in future_to_source:
-                try:
-                    jobs = future.result(timeout=45)  # 45 second timeout per source
-                    
-                    for job in jobs:
-                        if job['id'] not in self.tracked_jobs:
-                            self.tracked_jobs[job['id']] = job
-                            all_new_jobs.append(job)
-                            
-                except Exception as e:
-                    source_name = future_to_source[future]
-                    print(f"❌ {source_name} timeout/error: {str(e)}")
+        # Run all sources concurrently and alert each source's new jobs the moment it finishes
+        with alert_pipeline.AlertBatcher(self.send_immediate_alert, rank=relevance.rank) as alerts:
+            for source, jobs in fetch_engine.iter_sources(self.global_sources, deadline=45):  # Hard 45 second deadline for the whole scan
+                if isinstance(jobs, Exception):
+                    print(f"❌ {source.__name__} timeout/error: {str(jobs)}")
+                    continue
+                
+                new_jobs = []
+                for job in jobs:
+                    if job['id'] not in self.tracked_jobs:
+                        self.tracked_jobs[job['id']] = job
+                        new_jobs.append(job)
+                alerts.add(new_jobs)
+                all_new_jobs.extend(new_jobs)
         
         scan_duration = (datetime.datetime.now() - scan_start).seconds
         
@@ -567,9 +527,6 @@ class Global24x7JobMonitor:
             print(f"\n🎉 URGENT: {len(all_new_jobs)} NEW JOBS FOUND!")
             print(f"⚡ Scan completed in {scan_duration} seconds")
             
-            # Send immediate alert
-            self.send_immediate_alert(all_new_jobs)
-            
             # Save jobs
             self.save_tracked_jobs()
             
@@ -4,7 +4,6 @@ GLOBAL 24/7 REAL-TIME Job Monitor
 Worldwide coverage with immediate alerts for software testing jobs (2+ years experience)
 """
 
-import requests
 import json
 import smtplib
 from email.mime.text import MIMEText
@@ -13,10 +12,18 @@ import datetime
 import time
 import os
 import threading
-from concurrent.futures import ThreadPoolExecutor
-import feedparser
 import schedule
 import logging
+import http_client
+import fetch_engine
+import relevance
+import job_classifier
+import alert_pipeline
+import remoteok_source
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id
+from watermarks import Watermarks, watermark_path, entry_id, entry_published
 
 # Configure logging
 logging.basicConfig(
@@ -35,21 +42,20 @@ class Global24x7JobMonitor:
         self.gemini_config = gemini_config
         self.jobs_file = "global_24x7_jobs.json"
         self.load_tracked_jobs()
+        # Scores new jobs locally; Gemini is only asked about the ones it is unsure of
+        self.classifier = job_classifier.train(self.tracked_jobs.values())
+        self.watermarks = Watermarks(watermark_path(self.jobs_file))
         self.scan_count = 0
         self.total_jobs_found = 0
         
     def load_tracked_jobs(self):
-        """Load previously tracked jobs from file"""
-        try:
-            with open(self.jobs_file, 'r') as f:
-                self.tracked_jobs = json.load(f)
-        except FileNotFoundError:
-            self.tracked_jobs = {}
+        """Load previously tracked jobs from the job store"""
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
-        """Save tracked jobs to file"""
-        with open(self.jobs_file, 'w') as f:
-            json.dump(self.tracked_jobs, f, indent=2)
+        """Save newly tracked jobs to the job store"""
+        self.tracked_jobs.save()
+        self.watermarks.save()
     
     def check_remoteok_global(self):
         """Enhanced RemoteOK with global coverage"""
@@ -67,49 +73,38 @@ class Global24x7JobMonitor:
                 'quality assurance'
             ]
             
+            feed = remoteok_source.get_feed()
+            
             for term in search_terms:
                 try:
-                    url = f"https://remoteok.io/api?tag={term}"
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                        'Accept': 'application/json'
-                    }
-                    
-                    response = requests.get(url, headers=headers, timeout=10)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
+                    for job in feed.by_tag(term)[:10]:  # Top 10 per term
+                        if not job or not isinstance(job, dict):
+                            continue
+                            
+                        job_id = make_job_id('remoteok', job.get('id'), job.get('url'), job.get('position'), job.get('company'))
                         
-                        for job in data[1:11]:  # Skip legal notice, get top 10
-                            if not job or not isinstance(job, dict):
-                                continue
-                                
-                            job_id = f"remoteok_{job.get('id', '')}"
+                        if job_id not in self.tracked_jobs:
+                            # Check for 2+ years experience requirement
+                            description = str(job.get('description', '')).lower()
+                            tags = str(job.get('tags', [])).lower()
                             
-                            if job_id not in self.tracked_jobs:
-                                # Check for 2+ years experience requirement
-                                description = str(job.get('description', '')).lower()
-                                tags = str(job.get('tags', [])).lower()
-                                
-                                experience_indicators = ['2+ years', '2-', 'junior', 'mid-level', 'experienced']
-                                
-                                job_data = {
-                                    'id': job_id,
-                                    'title': job.get('position', 'N/A'),
-                                    'company': job.get('company', 'N/A'),
-                                    'location': job.get('location', 'Remote'),
-                                    'salary': job.get('salary_max', 'Not specified'),
-                                    'snippet': job.get('description', 'N/A')[:300],
-                                    'url': job.get('url', ''),
-                                    'source': 'RemoteOK Global',
-                                    'date_found': datetime.datetime.now().isoformat(),
-                                    'posted_date': job.get('date', 'Recent'),
-                                    'tags': job.get('tags', []),
-                                    'search_term': term
-                                }
-                                jobs.append(job_data)
-                    
-                    time.sleep(1)  # Rate limiting
+                            experience_indicators = ['2+ years', '2-', 'junior', 'mid-level', 'experienced']
+                            
+                            job_data = {
+                                'id': job_id,
+                                'title': job.get('position', 'N/A'),
+                                'company': job.get('company', 'N/A'),
+                                'location': job.get('location', 'Remote'),
+                                'salary': job.get('salary_max', 'Not specified'),
+                                'snippet': job.get('description', 'N/A')[:300],
+                                'url': job.get('url', ''),
+                                'source': 'RemoteOK Global',
+                                'date_found': datetime.datetime.now().isoformat(),
+                                'posted_date': job.get('date', 'Recent'),
+                                'tags': job.get('tags', []),
+                                'search_term': term
+                            }
+                            jobs.append(job_data)
                     
                 except Exception as e:
                     logging.warning(f"RemoteOK term {term} error: {str(e)}")
@@ -137,10 +132,10 @@ class Global24x7JobMonitor:
             
             for feed_url in indeed_feeds:
                 try:
-                    feed = feedparser.parse(feed_url)
+                    feed = http_client.fetch_feed(feed_url)
                     
                     for entry in feed.entries[:5]:
-                        job_id = f"indeed_global_{entry.get('id', '')}"
+                        job_id = make_job_id('indeed_global', entry.get('id'), entry.get('link'), entry.get('title'))
                         
                         if job_id not in self.tracked_jobs:
                             job_data = {
@@ -182,10 +177,10 @@ class Global24x7JobMonitor:
             for term in search_terms:
                 try:
                     url = f'https://stackoverflow.com/jobs/feed?q={term}&r=true'
-                    feed = feedparser.parse(url)
+                    feed = http_client.fetch_feed(url)
                     
                     for entry in feed.entries[:3]:
-                        job_id = f"stackoverflow_global_{entry.get('id', '')}"
+                        job_id = make_job_id('stackoverflow_global', entry.get('id'), entry.get('link'), entry.get('title'))
                         
                         if job_id not in self.tracked_jobs:
                             job_data = {
@@ -225,18 +220,16 @@ class Global24x7JobMonitor:
                 'https://weworkremotely.com/remote-jobs.rss'
             ]
             
-            testing_keywords = ['test', 'qa', 'quality', 'automation', 'sdet', '2+ years', 'junior', 'mid-level']
-            
             for rss_url in rss_urls:
                 try:
-                    feed = feedparser.parse(rss_url)
+                    feed = http_client.fetch_feed(rss_url, limit=8, seen_ids=self.watermarks.seen_ids(rss_url))
                     
-                    for entry in feed.entries[:8]:
+                    for entry in self.watermarks.fresh(rss_url, feed.entries, entry_id, entry_published):
                         title = entry.get('title', '').lower()
                         description = entry.get('description', '').lower()
                         
-                        if any(keyword in title or keyword in description for keyword in testing_keywords):
-                            job_id = f"weworkremotely_global_{entry.get('id', '')}"
+                        if filter_profiles.profile('testing').matches(title=title, description=description):
+                            job_id = make_job_id('weworkremotely_global', entry.get('id'), entry.get('link'), entry.get('title'))
                             
                             if job_id not in self.tracked_jobs:
                                 job_data = {
@@ -369,10 +362,12 @@ class Global24x7JobMonitor:
                 if job.get('salary') and job['salary'] != 'Not specified':
                     alert_message += f"💰 **Salary**: {job['salary']}\n"
                 
-                # Gemini analysis if available
+                # Gemini analysis if available, else the local classifier's score
                 if job.get('gemini_analysis'):
                     analysis = job['gemini_analysis']
                     alert_message += f"🤖 **AI Score**: {analysis.get('relevance_score', 'N/A')}/10\n"
+                elif job.get('ai_score'):
+                    alert_message += f"🤖 **AI Score**: {job['ai_score']}/10\n"
                 
                 alert_message += f"🔗 [**APPLY IMMEDIATELY**]({job['url']})\n\n"
             
@@ -392,7 +387,7 @@ class Global24x7JobMonitor:
                 'disable_web_page_preview': False
             }
             
-            response = requests.post(telegram_url, data=data, timeout=10)
+            response = http_client.post(telegram_url, data=data, timeout=10)
             
             if response.status_code == 200:
                 logging.info(f"📱 GLOBAL ALERT #{self.scan_count} sent with {len(new_jobs)} jobs!")
@@ -422,34 +417,28 @@ class Global24x7JobMonitor:
             self.check_glassdoor_api
         ]
         
-        # Concurrent scanning
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            future_to_source = {executor.submit(source): source.__name__ for source in sources}
-            
-            for future in future_to_source:
-                try:
-                    jobs = future.result(timeout=30)
-                    
-                    for job in jobs:
-                        if job['id'] not in self.tracked_jobs:
-                            # Optional Gemini analysis
-                            if self.gemini_config:
-                                job = self.analyze_job_with_gemini(job)
-                            
-                            self.tracked_jobs[job['id']] = job
-                            all_new_jobs.append(job)
-                            
-                except Exception as e:
-                    source_name = future_to_source[future]
-                    logging.error(f"❌ {source_name} error: {str(e)}")
+        # Concurrent scanning; each source's new jobs are alerted as soon as it finishes
+        with alert_pipeline.AlertBatcher(self.send_24x7_alert, rank=relevance.rank) as alerts:
+            for source, jobs in fetch_engine.iter_sources(sources, deadline=30):
+                if isinstance(jobs, Exception):
+                    logging.error(f"❌ {source.__name__} error: {str(jobs)}")
+                    continue
+                
+                new_jobs = []
+                for job in jobs:
+                    if job['id'] not in self.tracked_jobs:
+                        # Local relevance score; Gemini only for jobs the classifier is unsure about
+                        job = self.classifier.classify(job, self.analyze_job_with_gemini if self.gemini_config else None)
+                        
+                        self.tracked_jobs[job['id']] = job
+                        new_jobs.append(job)
+                alerts.add(new_jobs)
+                all_new_jobs.extend(new_jobs)
         
         if all_new_jobs:
             self.total_jobs_found += len(all_new_jobs)
             logging.info(f"\n🎉 FOUND {len(all_new_jobs)} NEW GLOBAL JOBS!")
             
-            # Send instant alert
-            self.send_24x7_alert(all_new_jobs)
-            
             # Save jobs
             self.save_tracked_jobs()
             
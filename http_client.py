@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Client
+One pooled keep-alive session per process, used by every scan method and Telegram sender
+"""
+
+import time
+import threading
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+
+import circuit_breaker
+import parse_pool
+import rate_limit
+import response_cache
+import scan_deadline
+
+# Connect fails fast; the read timeout is whatever the caller passes
+CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 15
+
+# Hosts kept warm (job boards, feeds, Telegram) and sockets per host.
+# Per-host size covers the fetch engine's per-host limit plus calls made outside it.
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 8
+
+FEED_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    'Accept': 'application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8'
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class ValidatorCache:
+    """ETag / Last-Modified per URL, replayed as If-None-Match / If-Modified-Since"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._validators = {}
+        self.not_modified = 0
+
+    def headers_for(self, key):
+        with self._lock:
+            etag, last_modified = self._validators.get(key, (None, None))
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def update(self, key, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            with self._lock:
+                self._validators[key] = (etag, last_modified)
+
+    def clear(self):
+        with self._lock:
+            self._validators = {}
+
+
+validators = ValidatorCache()
+
+
+def cache_key(url, params=None):
+    """Full request URL including query params"""
+    if not params:
+        return url
+    return requests.Request('GET', url, params=params).prepare().url
+
+
+def get_session():
+    """Process-wide requests.Session with per-host connection pools"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def split_timeout(timeout):
+    """Turn a single read timeout into a (connect, read) pair"""
+    if timeout is None:
+        timeout = DEFAULT_READ_TIMEOUT
+    if isinstance(timeout, (tuple, list)):
+        return tuple(timeout)
+    return (min(CONNECT_TIMEOUT, timeout), timeout)
+
+
+def request(method, url, timeout=None, conditional=False, **kwargs):
+    """Send a request through the response cache and circuit breakers; conditional GETs come back as 304 when nothing changed"""
+    cache = response_cache.get_cache()
+    ttl = response_cache.ttl_for(url)
+    key = None
+    if ttl:
+        key = response_cache.request_key(method, url, kwargs.get('params'), kwargs.get('data'), kwargs.get('json'))
+        cached = cache.load(key, url, ttl)
+        if cached is not None:
+            cache.hits += 1
+            circuit_breaker.mark_data()
+            # Replays always return the body so every offline scan does the full parse
+            if conditional and not cache.offline and cache.already_served(key, cached):
+                validators.not_modified += 1
+                return response_cache.not_modified_response(url)
+            cache.mark_served(key, cached.stored_at)
+            return cached
+        cache.misses += 1
+    if cache.offline:
+        raise response_cache.OfflineMiss(f"No recorded response: {method} {url}")
+
+    scan_deadline.check(f"{method} {url}")
+    breaker = circuit_breaker.for_url(url)
+    if breaker is not None and not breaker.allow():
+        raise circuit_breaker.CircuitOpen(f"{breaker.name} skipped for {breaker.retry_in():.0f}s more")
+    started = time.monotonic()
+    try:
+        response = _send(method, url, timeout, conditional, **kwargs)
+    except Exception:
+        if breaker is not None:
+            left = scan_deadline.remaining()
+            if left is not None and left <= 0:
+                # Cut off by our own scan deadline - says nothing about the endpoint
+                breaker.abandon()
+            else:
+                breaker.record(False, time.monotonic() - started)
+        raise
+    ok = not circuit_breaker.is_failure_status(response.status_code)
+    if breaker is not None:
+        breaker.record(ok, time.monotonic() - started)
+    if ok:
+        circuit_breaker.mark_data()
+
+    if key and response.status_code == 200:
+        cache.store(key, response)
+    elif key and response.status_code == 304:
+        cache.touch(key)
+    return response
+
+
+def _send(method, url, timeout, conditional, **kwargs):
+    # Only real network requests spend rate-limit tokens; cache hits are free
+    rate_limit.wait(url)
+    scan_deadline.check(f"{method} {url}")
+    timeout = scan_deadline.cap_timeout(split_timeout(timeout))
+    if not conditional or method != 'GET':
+        return _deliver(method, url, timeout, **kwargs)
+
+    key = cache_key(url, kwargs.get('params'))
+    headers = dict(kwargs.pop('headers', None) or {})
+    headers.update(validators.headers_for(key))
+
+    response = _deliver(method, url, timeout, headers=headers, **kwargs)
+    if response.status_code == 304:
+        validators.not_modified += 1
+        logging.debug(f"304 Not Modified: {key}")
+    elif response.status_code == 200:
+        validators.update(key, response)
+    return response
+
+
+def _deliver(method, url, timeout, **kwargs):
+    # Inside a scan the body is streamed so a slow download stops at the deadline
+    if scan_deadline.remaining() is None or kwargs.get('stream'):
+        return get_session().request(method, url, timeout=timeout, **kwargs)
+    response = get_session().request(method, url, timeout=timeout, stream=True, **kwargs)
+    return scan_deadline.read_body(response)
+
+
+def get(url, timeout=None, **kwargs):
+    return request('GET', url, timeout=timeout, **kwargs)
+
+
+def post(url, timeout=None, **kwargs):
+    return request('POST', url, timeout=timeout, **kwargs)
+
+
+def download_feed(url, timeout=None, headers=None, conditional=True):
+    """Download an RSS/Atom feed over the shared session. Returns the response, or the parsed
+    (empty) feed directly when there is nothing to parse"""
+    import feedparser
+
+    try:
+        response = get(url, timeout=timeout, headers=headers or FEED_HEADERS, conditional=conditional)
+    except requests.RequestException as e:
+        # Same shape feedparser returns for an unreachable URL
+        return feedparser.FeedParserDict(entries=[], feed={}, bozo=1, bozo_exception=e)
+    if response.status_code == 304:
+        # Unchanged since the last poll - nothing to parse or filter
+        return feedparser.FeedParserDict(entries=[], feed={}, bozo=0, status=304)
+    return response
+
+
+def feed_headers(response):
+    return {key.lower(): value for key, value in response.headers.items()}
+
+
+def fetch_feed(url, timeout=None, headers=None, conditional=True, limit=None, seen_ids=None):
+    """Download an RSS/Atom feed over the shared session and stream-parse it in the parse pool,
+    stopping after limit entries or once it runs into entries in seen_ids"""
+    result = download_feed(url, timeout=timeout, headers=headers, conditional=conditional)
+    if not isinstance(result, requests.Response):
+        return result
+    return parse_pool.run(parse_pool.parse_feed, result.content, feed_headers(result), limit, seen_ids)
+
+
+def close():
+    """Drop pooled connections"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
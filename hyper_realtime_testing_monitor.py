@@ -4,15 +4,19 @@ HYPER-AGGRESSIVE REAL-TIME Testing Job Monitor
 Ultra-fast scanning every 30 seconds for immediate testing job alerts
 """
 
-import requests
-import json
 import datetime
 import time
 import os
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import feedparser
 import logging
+import http_client
+import fetch_engine
+import relevance
+import alert_pipeline
+import remoteok_source
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id
 
 # Ultra-aggressive logging
 logging.basicConfig(
@@ -36,14 +40,6 @@ class HyperRealtimeTestingMonitor:
         self.scan_count = 0
         self.total_alerts_sent = 0
         
-        # Ultra-specific testing keywords
-        self.testing_keywords = [
-            'qa', 'testing', 'test engineer', 'quality assurance', 
-            'automation', 'sdet', 'quality engineer', 'test analyst',
-            'software testing', 'qa engineer', 'test automation',
-            'quality analyst', 'testing specialist', 'qa analyst'
-        ]
-        
         # Experience level indicators
         self.experience_terms = [
             '2+ years', '2-4 years', 'junior', 'mid-level', 'experienced',
@@ -51,28 +47,15 @@ class HyperRealtimeTestingMonitor:
         ]
         
     def load_tracked_jobs(self):
-        try:
-            with open(self.jobs_file, 'r') as f:
-                self.tracked_jobs = json.load(f)
-        except FileNotFoundError:
-            self.tracked_jobs = {}
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
-        with open(self.jobs_file, 'w') as f:
-            json.dump(self.tracked_jobs, f, indent=2)
+        self.tracked_jobs.save()
     
     def is_testing_job(self, title, description):
         """Ultra-specific testing job detection"""
-        text = f"{title} {description}".lower()
-        
-        # Must contain testing keywords
-        has_testing_keyword = any(keyword in text for keyword in self.testing_keywords)
-        
-        # Exclude non-testing roles
-        exclusions = ['sales', 'marketing', 'business', 'finance', 'hr', 'accounting']
-        has_exclusion = any(excl in text for excl in exclusions)
-        
-        return has_testing_keyword and not has_exclusion
+        # Must contain testing keywords and not be a sales, business or support role
+        return filter_profiles.profile('testing_roles').matches(title=title, description=description)
     
     def check_remoteok_hyperaggressive(self):
         """Hyper-aggressive RemoteOK scanning for testing jobs"""
@@ -81,62 +64,50 @@ class HyperRealtimeTestingMonitor:
         try:
             logging.info("🔥 HYPER-AGGRESSIVE RemoteOK scan...")
             
-            # Direct testing-focused searches
-            search_urls = [
-                "https://remoteok.io/api?tag=qa",
-                "https://remoteok.io/api?tag=testing", 
-                "https://remoteok.io/api?tag=automation",
-                "https://remoteok.io/api?tag=sdet",
-                "https://remoteok.io/api?tag=quality",
-                "https://remoteok.io/api?search=test+engineer",
-                "https://remoteok.io/api?search=qa+engineer",
-                "https://remoteok.io/api?search=software+testing"
+            # Direct testing-focused views
+            feed = remoteok_source.get_feed()
+            views = [
+                feed.by_tag('qa'),
+                feed.by_tag('testing'),
+                feed.by_tag('automation'),
+                feed.by_tag('sdet'),
+                feed.by_tag('quality'),
+                feed.search('test engineer'),
+                feed.search('qa engineer'),
+                feed.search('software testing')
             ]
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'application/json',
-                'Cache-Control': 'no-cache'
-            }
-            
-            for url in search_urls:
+            for view in views:
                 try:
-                    response = requests.get(url, headers=headers, timeout=10)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
+                    for job in view[:10]:  # Top 10 per view
+                        if not job or not isinstance(job, dict):
+                            continue
                         
-                        for job in data[1:11]:  # Skip legal notice, get top 10
-                            if not job or not isinstance(job, dict):
-                                continue
-                            
-                            title = job.get('position', '')
-                            description = job.get('description', '')
+                        title = job.get('position', '')
+                        description = job.get('description', '')
+                        
+                        # Ultra-specific testing job filter
+                        if self.is_testing_job(title, description):
+                            job_id = make_job_id('remoteok_hyper', job.get('id'), job.get('url'), job.get('position'), job.get('company'))
                             
-                            # Ultra-specific testing job filter
-                            if self.is_testing_job(title, description):
-                                job_id = f"remoteok_hyper_{job.get('id', len(jobs))}"
-                                
-                                if job_id not in self.tracked_jobs:
-                                    job_entry = {
-                                        'id': job_id,
-                                        'title': title,
-                                        'company': job.get('company', 'N/A'),
-                                        'location': job.get('location', 'Remote'),
-                                        'salary': self.format_salary(job.get('salary_min'), job.get('salary_max')),
-                                        'description': description[:500],
-                                        'url': f"https://remoteok.io/remote-jobs/{job.get('slug', '')}",
-                                        'source': 'RemoteOK Testing',
-                                        'date_found': datetime.datetime.now().isoformat(),
-                                        'tags': job.get('tags', []),
-                                        'relevance': 'HIGH - Testing specific'
-                                    }
-                                    jobs.append(job_entry)
-                    
-                    time.sleep(0.5)  # Minimal delay
-                    
+                            if job_id not in self.tracked_jobs:
+                                job_entry = {
+                                    'id': job_id,
+                                    'title': title,
+                                    'company': job.get('company', 'N/A'),
+                                    'location': job.get('location', 'Remote'),
+                                    'salary': self.format_salary(job.get('salary_min'), job.get('salary_max')),
+                                    'description': description[:500],
+                                    'url': f"https://remoteok.io/remote-jobs/{job.get('slug', '')}",
+                                    'source': 'RemoteOK Testing',
+                                    'published': job.get('date'),
+                                    'date_found': datetime.datetime.now().isoformat(),
+                                    'tags': job.get('tags', [])
+                                }
+                                jobs.append(job_entry)
+                
                 except Exception as e:
-                    logging.warning(f"RemoteOK URL error: {e}")
+                    logging.warning(f"RemoteOK view error: {e}")
             
             logging.info(f"🎯 RemoteOK: {len(jobs)} TESTING jobs found")
             
@@ -165,14 +136,14 @@ class HyperRealtimeTestingMonitor:
             
             for search_url in indeed_searches:
                 try:
-                    feed = feedparser.parse(search_url)
+                    feed = http_client.fetch_feed(search_url)
                     
                     for entry in feed.entries[:5]:  # Recent entries only
                         title = entry.get('title', '')
                         description = entry.get('summary', '')
                         
                         if self.is_testing_job(title, description):
-                            job_id = f"indeed_hyper_{entry.get('id', len(jobs))}"
+                            job_id = make_job_id('indeed_hyper', entry.get('id'), entry.get('link'), entry.get('title'))
                             
                             if job_id not in self.tracked_jobs:
                                 job_entry = {
@@ -184,13 +155,11 @@ class HyperRealtimeTestingMonitor:
                                     'description': description[:500],
                                     'url': entry.get('link', ''),
                                     'source': 'Indeed Testing',
-                                    'date_found': datetime.datetime.now().isoformat(),
-                                    'relevance': 'HIGH - Testing specific'
+                                    'published': entry.get('published'),
+                                    'date_found': datetime.datetime.now().isoformat()
                                 }
                                 jobs.append(job_entry)
                     
-                    time.sleep(0.5)
-                    
                 except Exception as e:
                     logging.warning(f"Indeed search error: {e}")
             
@@ -222,14 +191,14 @@ class HyperRealtimeTestingMonitor:
             for search in so_searches:
                 try:
                     url = f'https://stackoverflow.com/jobs/feed?q={search}&r=true&sort=i'
-                    feed = feedparser.parse(url)
+                    feed = http_client.fetch_feed(url)
                     
                     for entry in feed.entries[:3]:
                         title = entry.get('title', '')
                         description = entry.get('summary', '')
                         
                         if self.is_testing_job(title, description):
-                            job_id = f"stackoverflow_hyper_{entry.get('id', len(jobs))}"
+                            job_id = make_job_id('stackoverflow_hyper', entry.get('id'), entry.get('link'), entry.get('title'))
                             
                             if job_id not in self.tracked_jobs:
                                 job_entry = {
@@ -241,13 +210,11 @@ class HyperRealtimeTestingMonitor:
                                     'description': description[:500],
                                     'url': entry.get('link', ''),
                                     'source': 'Stack Overflow Testing',
-                                    'date_found': datetime.datetime.now().isoformat(),
-                                    'relevance': 'HIGH - Developer-focused testing'
+                                    'published': entry.get('published'),
+                                    'date_found': datetime.datetime.now().isoformat()
                                 }
                                 jobs.append(job_entry)
                     
-                    time.sleep(0.5)
-                    
                 except Exception as e:
                     logging.warning(f"Stack Overflow search error: {e}")
             
@@ -287,14 +254,14 @@ class HyperRealtimeTestingMonitor:
             alert_message += f"📧 **For**: kalyogyogi@gmail.com\n"
             alert_message += f"🎯 **Experience**: 2+ years software testing\n\n"
             
-            # Show each testing job
+            # Show the most relevant testing jobs (the batch arrives ranked)
             for i, job in enumerate(testing_jobs[:3], 1):
                 alert_message += f"**🎯 {i}. {job['title']}**\n"
                 alert_message += f"🏢 **Company**: {job['company']}\n"
                 alert_message += f"📍 **Location**: {job['location']}\n"
                 alert_message += f"💰 **Salary**: {job['salary']}\n"
                 alert_message += f"🌐 **Source**: {job['source']}\n"
-                alert_message += f"⭐ **Relevance**: {job['relevance']}\n"
+                alert_message += f"⭐ **Relevance**: {job.get('relevance_score', 'N/A')}/10\n"
                 alert_message += f"🔗 [**APPLY IMMEDIATELY**]({job['url']})\n\n"
             
             if len(testing_jobs) > 3:
@@ -314,7 +281,7 @@ class HyperRealtimeTestingMonitor:
                 'disable_notification': False  # Ensure notification sound
             }
             
-            response = requests.post(url, data=data, timeout=10)
+            response = http_client.post(url, data=data, timeout=10)
             
             if response.status_code == 200:
                 logging.info(f"🚨 INSTANT TESTING ALERT #{self.total_alerts_sent} SENT! ({len(testing_jobs)} jobs)")
@@ -342,28 +309,24 @@ class HyperRealtimeTestingMonitor:
             self.check_stackoverflow_testing
         ]
         
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            future_to_source = {executor.submit(source): source.__name__ for source in sources}
-            
-            for future in as_completed(future_to_source, timeout=25):
-                try:
-                    jobs = future.result(timeout=15)
-                    
-                    for job in jobs:
-                        if job['id'] not in self.tracked_jobs:
-                            self.tracked_jobs[job['id']] = job
-                            all_testing_jobs.append(job)
-                            
-                except Exception as e:
-                    source_name = future_to_source[future]
-                    logging.warning(f"{source_name} timeout/error: {e}")
+        # INSTANT alert for testing jobs: each source's finds go out as soon as it finishes
+        with alert_pipeline.AlertBatcher(self.send_instant_testing_alert, rank=relevance.rank) as alerts:
+            for source, jobs in fetch_engine.iter_sources(sources, deadline=25):
+                if isinstance(jobs, Exception):
+                    logging.warning(f"{source.__name__} timeout/error: {jobs}")
+                    continue
+                
+                new_jobs = []
+                for job in jobs:
+                    if job['id'] not in self.tracked_jobs:
+                        self.tracked_jobs[job['id']] = job
+                        new_jobs.append(job)
+                alerts.add(new_jobs)
+                all_testing_jobs.extend(new_jobs)
         
         if all_testing_jobs:
             logging.info(f"🎉 FOUND {len(all_testing_jobs)} NEW TESTING JOBS!")
             
-            # INSTANT alert for testing jobs
-            self.send_instant_testing_alert(all_testing_jobs)
-            
             # Save immediately
             self.save_tracked_jobs()
             
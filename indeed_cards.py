@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Indeed Card Extraction
+Job records straight from the JSON Indeed embeds in its results pages; otherwise an lxml
+parse of just the job-card region, with every selector compiled to XPath once at import
+and the winning one remembered per domain
+"""
+
+import re
+import json
+import codecs
+import logging
+import threading
+from html import unescape
+
+from lxml import etree, html
+
+import parse_pool
+
+# Results pages assign the job list to this provider slot in an inline script
+EMBEDDED_MARKER = b'window.mosaic.providerData["mosaic-provider-jobcards"]'
+
+_TAGS = re.compile(r'<[^>]+>')
+
+# Bytes kept either side of the first and last job key; a card's markup is a few KB
+CARD_MARGIN = 16384
+
+# The page's <meta charset> sits in its head, which card_region cuts off
+_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([A-Za-z0-9_-]+)', re.IGNORECASE)
+HEAD_BYTES = 4096
+
+_UPPER = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_LOWER = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def _has_class(name):
+    """XPath test for a whole class token, like CSS .name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _class_mentions(word):
+    """XPath test for a class attribute containing word in any case"""
+    return f"contains(translate(@class, '{_UPPER}', '{_LOWER}'), '{word}')"
+
+
+# Card containers, tried in order until one matches (the old soup.select fallbacks)
+CARD_PATHS = [
+    ('div[data-jk]', etree.XPath("//div[@data-jk] | //article[@data-jk]")),
+    ('.job_seen_beacon', etree.XPath(f"//*[{_has_class('job_seen_beacon')}]")),
+    ('.result', etree.XPath(f"//*[{_has_class('result')}]")),
+    ('.slider_item', etree.XPath(f"//*[{_has_class('slider_container')}]//*[{_has_class('slider_item')}]")),
+    # Last resort: the innermost div with 'job' in its class that still holds a job link
+    ('div[class*=job]', etree.XPath(
+        f"//div[{_class_mentions('job')}][.//a[@data-jk]][not(.//div[{_class_mentions('job')}][.//a[@data-jk]])]")),
+]
+
+JOB_KEY = etree.XPath("(@data-jk | .//a[@data-jk]/@data-jk)[1]")
+
+# Each field takes the first path that yields non-empty text
+FIELD_PATHS = {
+    'title': [
+        ('h2.jobTitle span[title]', etree.XPath(f".//h2[{_has_class('jobTitle')} or @data-testid='job-title']//span/@title")),
+        ('[data-testid=job-title]', etree.XPath(".//*[@data-testid='job-title']")),
+        ('.jobTitle', etree.XPath(f".//*[{_has_class('jobTitle')}]")),
+        ('h2', etree.XPath(".//h2")),
+        ('a[data-jk]', etree.XPath(".//a[@data-jk]")),
+    ],
+    'company': [
+        ('[data-testid=company-name]', etree.XPath(".//*[@data-testid='company-name']")),
+        ('.companyName', etree.XPath(f".//*[{_has_class('companyName')}]")),
+        ('[class*=company]', etree.XPath(f".//span[{_class_mentions('company')}] | .//div[{_class_mentions('company')}]")),
+    ],
+    'location': [
+        ('[data-testid=job-location]', etree.XPath(".//*[@data-testid='job-location' or @data-testid='text-location']")),
+        ('.companyLocation', etree.XPath(f".//*[{_has_class('locationsContainer')} or {_has_class('companyLocation')}]")),
+        ('[class*=location]', etree.XPath(f".//*[{_class_mentions('location')}]")),
+    ],
+    'snippet': [
+        ('[data-testid=job-snippet]', etree.XPath(".//*[@data-testid='job-snippet']")),
+        ('.job-snippet', etree.XPath(f".//*[{_has_class('job-snippet')} or {_has_class('jobSnippet')}]")),
+        ('div[class*=snippet]', etree.XPath(f".//div[{_class_mentions('snippet')} or {_class_mentions('summary')}]")),
+        ('ul', etree.XPath(".//ul")),
+    ],
+}
+
+HEADINGS = etree.XPath("//h1 | //h2 | //h3")
+
+
+class SelectorCache:
+    """Which card and field selector last worked on each Indeed domain. The winner is tried
+    first; the rest of the list is only walked on a miss, and misses are counted so a
+    layout change shows up in the stats"""
+
+    def __init__(self, winners=None):
+        self._lock = threading.Lock()
+        self._winners = dict(winners or {})
+        self.stats = {}
+
+    def first(self, domain, slot, paths, evaluate):
+        """(label, result) of the first path whose evaluate(path) is truthy, cached winner first"""
+        key = (domain, slot)
+        winner = self._winners.get(key)
+        if winner is not None:
+            result = evaluate(paths[winner][1])
+            if result:
+                self._count(key, 'hits')
+                return paths[winner][0], result
+
+        self._count(key, 'misses')
+        for index, (label, path) in enumerate(paths):
+            if index == winner:
+                continue
+            result = evaluate(path)
+            if result:
+                if winner is not None:
+                    logging.info(f"🔄 {domain or 'indeed'} {slot}: '{paths[winner][0]}' stopped matching, now '{label}'")
+                with self._lock:
+                    self._winners[key] = index
+                return label, result
+        return None, None
+
+    def winners(self):
+        with self._lock:
+            return dict(self._winners)
+
+    def state(self):
+        """Winners and counts, picklable, to hand back from a parse-pool worker"""
+        with self._lock:
+            return {'winners': dict(self._winners), 'stats': {key: dict(counts) for key, counts in self.stats.items()}}
+
+    def merge(self, state):
+        """Fold in what a worker's cache learned"""
+        with self._lock:
+            self._winners.update(state['winners'])
+            for key, counts in state['stats'].items():
+                totals = self.stats.setdefault(key, {'hits': 0, 'misses': 0})
+                for outcome, count in counts.items():
+                    totals[outcome] += count
+
+    def _count(self, key, outcome):
+        with self._lock:
+            counts = self.stats.setdefault(key, {'hits': 0, 'misses': 0})
+            counts[outcome] += 1
+
+    def hit_rate(self, domain):
+        """Share of lookups on a domain answered by the cached selector"""
+        with self._lock:
+            counts = [counts for (stats_domain, slot), counts in self.stats.items() if stats_domain == domain]
+        hits = sum(count['hits'] for count in counts)
+        total = hits + sum(count['misses'] for count in counts)
+        return hits / total if total else None
+
+    def summary(self):
+        """One line per domain and selector slot: the current winner and its hit/miss counts"""
+        with self._lock:
+            items = sorted(self.stats.items())
+            winners = dict(self._winners)
+        lines = []
+        for (domain, slot), counts in items:
+            paths = CARD_PATHS if slot == 'cards' else FIELD_PATHS[slot]
+            label = paths[winners[(domain, slot)]][0] if (domain, slot) in winners else 'none'
+            lines.append(f"{domain or 'indeed'} {slot}: {label} ({counts['hits']} hits, {counts['misses']} misses)")
+        return lines
+
+
+selector_cache = SelectorCache()
+
+
+def card_region(content):
+    """The slice of the page that holds the job cards, or the whole page when no job key is found"""
+    first = content.find(b'data-jk=')
+    if first < 0:
+        return content
+    last = content.rfind(b'data-jk=')
+    return content[max(0, first - CARD_MARGIN):last + CARD_MARGIN]
+
+
+def page_encoding(content):
+    """Charset the page declares in its head, utf-8 when it declares none we know"""
+    match = _CHARSET.search(content[:HEAD_BYTES])
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode('ascii')).name
+        except LookupError:
+            pass
+    return 'utf-8'
+
+
+def parse(content):
+    """lxml tree of the card region; content is the raw response body"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+        encoding = 'utf-8'
+    else:
+        encoding = page_encoding(content)
+    # Told the encoding up front, lxml doesn't fall back to latin-1 for a region with no <meta>
+    parser = html.HTMLParser(encoding=encoding)
+    return html.fromstring(card_region(content) or b'<html></html>', parser=parser)
+
+
+def find_cards(root, domain='', cache=None):
+    """(card elements, selector that found them)"""
+    cache = cache or selector_cache
+    label, cards = cache.first(domain, 'cards', CARD_PATHS, lambda path: path(root))
+    return cards or [], label
+
+
+def _text(result):
+    if isinstance(result, str):
+        return result.strip()
+    return result.text_content().strip()
+
+
+def _first_text(card):
+    def evaluate(path):
+        for result in path(card):
+            text = _text(result)
+            if text:
+                return text
+        return None
+    return evaluate
+
+
+def card_field(card, field, domain='', cache=None):
+    cache = cache or selector_cache
+    label, text = cache.first(domain, field, FIELD_PATHS[field], _first_text(card))
+    return text
+
+
+def card_fields(card, domain='', cache=None):
+    """Job key, title, company, location and snippet of one card; missing fields are None"""
+    job_key = JOB_KEY(card)
+    fields = {field: card_field(card, field, domain, cache) for field in FIELD_PATHS}
+    fields['job_key'] = str(job_key[0]) if job_key else None
+    return fields
+
+
+def extract_cards(content, limit=None, domain='', cache=None):
+    """Field dicts for the job cards on a results page from the given Indeed domain"""
+    cards, label = find_cards(parse(content), domain, cache)
+    return [card_fields(card, domain, cache) for card in cards[:limit]]
+
+
+def _plain(snippet):
+    """Embedded snippets are HTML lists; flatten to the text a card would show"""
+    return ' '.join(unescape(_TAGS.sub(' ', snippet or '')).split()) or None
+
+
+def embedded_results(content):
+    """The raw result objects from the embedded job-card JSON, or None when the page has none"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    marker = content.find(EMBEDDED_MARKER)
+    if marker < 0:
+        return None
+    start = content.find(b'{', marker + len(EMBEDDED_MARKER))
+    if start < 0:
+        return None
+    try:
+        # raw_decode stops at the end of the object, so the rest of the page is never read
+        data, end = json.JSONDecoder().raw_decode(content[start:].decode(page_encoding(content), 'replace'))
+        return data['metaData']['mosaicProviderJobCardsModel']['results']
+    except (ValueError, KeyError, TypeError) as e:
+        logging.warning(f"Embedded Indeed job data unreadable: {e}")
+        return None
+
+
+def embedded_jobs(content, limit=None):
+    """Field dicts, shaped like extract_cards', decoded from the embedded job-card JSON, or None"""
+    results = embedded_results(content)
+    if results is None:
+        return None
+    jobs = []
+    for result in results[:limit]:
+        if not isinstance(result, dict) or not result.get('jobkey'):
+            continue
+        jobs.append({
+            'job_key': str(result['jobkey']),
+            'title': result.get('displayTitle') or result.get('title') or None,
+            'company': result.get('company') or result.get('truncatedCompany') or None,
+            'location': result.get('formattedLocation') or None,
+            'snippet': _plain(result.get('snippet')),
+            'salary': (result.get('salarySnippet') or {}).get('text') or None,
+        })
+    return jobs
+
+
+def extract_jobs(content, limit=None, domain='', cache=None):
+    """Field dicts for a results page: embedded JSON when present, the DOM cards otherwise"""
+    jobs = embedded_jobs(content, limit)
+    if jobs is not None:
+        return jobs
+    return extract_cards(content, limit, domain, cache)
+
+
+def extract_jobs_in_worker(content, limit=None, domain='', winners=None):
+    """extract_jobs for the parse pool: starts from the parent's winning selectors and returns
+    (jobs, cache state), since a worker's own selector_cache never reaches the parent"""
+    cache = SelectorCache(winners)
+    return extract_jobs(content, limit, domain, cache), cache.state()
+
+
+def extract_all(pages):
+    """extract_jobs for each (content, limit, domain) side by side in the parse pool; results
+    line up with pages, errors are returned not raised, and the selectors the workers
+    settled on are merged into selector_cache"""
+    winners = selector_cache.winners()
+    results = parse_pool.parse_all(extract_jobs_in_worker, [page + (winners,) for page in pages])
+    jobs = []
+    for result in results:
+        if isinstance(result, Exception):
+            jobs.append(result)
+            continue
+        page_jobs, state = result
+        selector_cache.merge(state)
+        jobs.append(page_jobs)
+    return jobs
+
+
+def page_headings(content, limit=5):
+    """First few headings on the page, for debugging pages with no cards"""
+    return [_text(heading)[:100] for heading in HEADINGS(parse(content))[:limit]]
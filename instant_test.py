@@ -4,7 +4,7 @@ INSTANT JOB MONITOR TEST
 Works immediately without complex setup
 """
 
-import requests
+import http_client
 import json
 import datetime
 
@@ -24,7 +24,7 @@ def instant_test():
             url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
             data = {'chat_id': chat_id, 'text': message}
             
-            response = requests.post(url, data=data, timeout=10)
+            response = http_client.post(url, data=data, timeout=10)
             return response.status_code == 200
         except:
             return False
@@ -35,7 +35,7 @@ def instant_test():
             # Test RemoteOK
             url = "https://remoteok.io/api"
             headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_client.get(url, headers=headers, timeout=10)
             
             remoteok_ok = response.status_code == 200 and len(response.json()) > 1
             
@@ -45,7 +45,7 @@ def instant_test():
             reed_params = {'keywords': 'software testing', 'resultsToTake': 1}
             reed_auth = (reed_api_key, '')
             
-            reed_response = requests.get(reed_url, params=reed_params, auth=reed_auth, timeout=10)
+            reed_response = http_client.get(reed_url, params=reed_params, auth=reed_auth, timeout=10)
             reed_ok = reed_response.status_code == 200
             
             # Test Jooble
@@ -54,7 +54,7 @@ def instant_test():
             jooble_params = {'keywords': 'software testing', 'location': '', 'page': '1'}
             jooble_headers = {'Content-Type': 'application/json'}
             
-            jooble_response = requests.post(jooble_url, json=jooble_params, headers=jooble_headers, timeout=10)
+            jooble_response = http_client.post(jooble_url, json=jooble_params, headers=jooble_headers, timeout=10)
             jooble_ok = jooble_response.status_code == 200
             
             return remoteok_ok and reed_ok and jooble_ok
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Job Classifier
+Offline naive Bayes relevance model trained from a monitor's tracked-job history. New jobs
+are scored locally in microseconds; only the ones it is unsure about go on to Gemini, and
+Gemini's answers are learned for the next job.
+"""
+
+import re
+import math
+import zlib
+import logging
+import threading
+
+import numpy as np
+
+import filter_profiles
+from relevance import job_fields
+
+# Hashed feature space; collisions between the few thousand tokens job ads use are rare
+FEATURE_BITS = 15
+
+# Laplace smoothing for token counts
+ALPHA = 1.0
+
+# Stored scores (1-10) that count as a relevant or irrelevant label; 5 is left out as a shrug
+RELEVANT_SCORE = 6
+IRRELEVANT_SCORE = 4
+
+# A Gemini label outweighs a label inferred from the filter profile
+GEMINI_LABEL_WEIGHT = 3.0
+
+# Jobs without a stored score are labelled by whether they pass this profile; it asks what
+# Gemini is asked (is this a testing role?), and many stored jobs have no description to
+# find an experience requirement in
+HISTORY_PROFILE = 'testing_roles'
+
+# Probability beyond which the local answer stands without asking Gemini
+CONFIDENCE = 0.9
+
+# Each class needs this many examples before the model answers on its own
+MIN_CLASS_EXAMPLES = 5
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def tokens(job):
+    """Distinct tokens of a job; title words get their own features, they say more"""
+    fields = job_fields(job)
+    tags = fields['tags']
+    if isinstance(tags, (list, tuple, set)):
+        tags = ' '.join(str(tag) for tag in tags)
+    title = TOKEN_PATTERN.findall(str(fields['title']).lower())
+    body = TOKEN_PATTERN.findall(f"{fields['description']} {tags}".lower())
+    return {'title:' + token for token in title} | set(title) | set(body)
+
+
+def stored_label(job):
+    """1 or 0 from a score Gemini gave the job earlier, None when there isn't a usable one"""
+    if job.get('ai_source') == 'local':
+        # Our own guesses aren't evidence
+        return None
+    analysis = job.get('gemini_analysis')
+    if isinstance(analysis, dict):
+        if analysis.get('is_testing_role') is False:
+            return 0
+        score = analysis.get('relevance_score')
+    else:
+        score = job.get('ai_score')
+    try:
+        score = float(score)
+    except (TypeError, ValueError):
+        return None
+    if score >= RELEVANT_SCORE:
+        return 1
+    if score <= IRRELEVANT_SCORE:
+        return 0
+    return None
+
+
+class JobClassifier:
+    """Naive Bayes over hashed title/description/tag tokens"""
+
+    def __init__(self, feature_bits=FEATURE_BITS, alpha=ALPHA, confidence=CONFIDENCE):
+        self.size = 1 << feature_bits
+        self.alpha = alpha
+        self.confidence = confidence
+        self.counts = np.zeros((2, self.size))
+        self.documents = np.zeros(2)
+        self._lock = threading.Lock()
+        self._weights = None
+        self._bias = 0.0
+        self.answered = 0
+        self.asked = 0
+
+    def features(self, job):
+        return np.fromiter((zlib.crc32(token.encode()) & (self.size - 1) for token in tokens(job)), dtype=np.int64)
+
+    def learn(self, job, label, weight=1.0):
+        """Add one labelled job (1 relevant, 0 not)"""
+        features = np.unique(self.features(job))
+        with self._lock:
+            self.counts[label, features] += weight
+            self.documents[label] += weight
+            self._weights = None
+
+    def fit(self, jobs, profile=None):
+        """Learn from tracked-job history: Gemini labels where stored, the filter profile elsewhere"""
+        profile = profile or filter_profiles.profile(HISTORY_PROFILE)
+        learned = 0
+        for job in jobs:
+            if not isinstance(job, dict):
+                continue
+            label = stored_label(job)
+            weight = GEMINI_LABEL_WEIGHT
+            if label is None:
+                label = int(profile.matches(**job_fields(job)))
+                weight = 1.0
+            self.learn(job, label, weight)
+            learned += 1
+        return learned
+
+    @property
+    def trained(self):
+        return bool(np.all(self.documents >= MIN_CLASS_EXAMPLES))
+
+    def _model(self):
+        with self._lock:
+            if self._weights is None:
+                # Multinomial naive Bayes over each job's distinct tokens: log-odds each token adds
+                seen = self.counts.sum(axis=0) > 0
+                vocabulary = max(int(seen.sum()), 1)
+                totals = self.counts.sum(axis=1)
+                token_log = np.log(self.counts + self.alpha) - np.log(totals + self.alpha * vocabulary)[:, None]
+                self._weights = token_log[1] - token_log[0]
+                # Buckets no training job hit are no evidence either way
+                self._weights[~seen] = 0.0
+                self._bias = math.log((self.documents[1] + 1) / (self.documents[0] + 1))
+            return self._weights, self._bias
+
+    def probability(self, job):
+        """P(relevant) for one job, or None until both classes have enough examples"""
+        if not self.trained:
+            return None
+        weights, bias = self._model()
+        log_odds = bias + float(weights[np.unique(self.features(job))].sum())
+        return 1 / (1 + math.exp(-max(min(log_odds, 50), -50)))
+
+    def score(self, job):
+        """(1-10 score, confident) for one job; (None, False) while untrained"""
+        probability = self.probability(job)
+        if probability is None:
+            return None, False
+        confident = probability >= self.confidence or probability <= 1 - self.confidence
+        return 1 + round(9 * probability), confident
+
+    def classify(self, job, ask=None):
+        """Fill in job['ai_score'] locally; only unsure jobs go to ask(job) (e.g. Gemini),
+        whose answer is then learned"""
+        score, confident = self.score(job)
+        if confident or ask is None:
+            if score is not None:
+                job['ai_score'] = score
+                job['ai_source'] = 'local'
+                self.answered += 1
+            return job
+
+        self.asked += 1
+        job = ask(job)
+        label = stored_label(job)
+        if label is not None:
+            self.learn(job, label, GEMINI_LABEL_WEIGHT)
+        return job
+
+
+def train(jobs):
+    """Classifier fitted on a monitor's tracked jobs"""
+    classifier = JobClassifier()
+    try:
+        learned = classifier.fit(jobs)
+        logging.info(f"🧠 Job classifier trained on {learned} tracked jobs")
+    except Exception as e:
+        # An empty model just defers every job to Gemini, as before
+        logging.warning(f"Job classifier not trained: {e}")
+    return classifier
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Job Detection
+SimHash fingerprints of title + company + location in a bounded LSH band index
+"""
+
+import re
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+COMPANY_SUFFIXES = {'ltd', 'limited', 'inc', 'llc', 'plc', 'gmbh', 'corp', 'corporation', 'co', 'group'}
+
+
+def normalize_text(text):
+    return ' '.join(re.findall(r'[a-z0-9+#]+', str(text or '').lower()))
+
+
+def normalize_company(company):
+    return ' '.join(word for word in normalize_text(company).split() if word not in COMPANY_SUFFIXES)
+
+
+def shingles(text, size=3):
+    """Character shingles of each word, so reordered or slightly reworded titles still overlap"""
+    for word in text.split():
+        padded = f" {word} "
+        if len(padded) <= size:
+            yield padded
+        for start in range(len(padded) - size + 1):
+            yield padded[start:start + size]
+
+
+def _feature_hash(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def simhash(weighted_features, bits=64):
+    totals = [0] * bits
+    for feature, weight in weighted_features:
+        value = _feature_hash(feature)
+        for bit in range(bits):
+            totals[bit] += weight if value >> bit & 1 else -weight
+    return sum(1 << bit for bit in range(bits) if totals[bit] > 0)
+
+
+def job_fingerprint(job):
+    """64-bit SimHash of a job's title, company and location, or None when all three are empty"""
+    features = []
+    features.extend((f"t:{gram}", 3) for gram in shingles(normalize_text(job.get('title'))))
+    features.extend((f"c:{gram}", 2) for gram in shingles(normalize_company(job.get('company'))))
+    features.extend((f"l:{gram}", 1) for gram in shingles(normalize_text(job.get('location'))))
+    if not features:
+        # Every featureless job would hash to 0 and look like a duplicate of every other
+        return None
+    return simhash(features)
+
+
+class NearDuplicateIndex:
+    """Recent job fingerprints, bucketed by 16-bit bands so lookups never scan the whole window"""
+
+    def __init__(self, max_jobs=5000, max_distance=3):
+        self.max_jobs = max_jobs
+        self.max_distance = max_distance
+        # Pigeonhole: two fingerprints within max_distance bits share at least one exact band
+        self.bands = max_distance + 1
+        self.band_bits = 64 // self.bands
+        self._lock = threading.Lock()
+        self._fingerprints = OrderedDict()
+        self._buckets = {}
+
+    def _band_keys(self, fingerprint):
+        mask = (1 << self.band_bits) - 1
+        return [(band, fingerprint >> (band * self.band_bits) & mask) for band in range(self.bands)]
+
+    def __len__(self):
+        return len(self._fingerprints)
+
+    def find(self, job, fingerprint=None):
+        """Id of an indexed job that is a near-duplicate of this one, or None"""
+        if fingerprint is None:
+            fingerprint = job_fingerprint(job)
+        if fingerprint is None:
+            return None
+        with self._lock:
+            for key in self._band_keys(fingerprint):
+                for job_id in self._buckets.get(key, ()):
+                    if job_id != job.get('id') and \
+                            bin(fingerprint ^ self._fingerprints[job_id]).count('1') <= self.max_distance:
+                        return job_id
+        return None
+
+    def add(self, job, fingerprint=None):
+        if fingerprint is None:
+            fingerprint = job_fingerprint(job)
+        if fingerprint is None:
+            return
+        job_id = job.get('id')
+        with self._lock:
+            if job_id in self._fingerprints:
+                return
+            self._fingerprints[job_id] = fingerprint
+            for key in self._band_keys(fingerprint):
+                self._buckets.setdefault(key, set()).add(job_id)
+
+            # Forget the oldest jobs once the window is full
+            while len(self._fingerprints) > self.max_jobs:
+                old_id, old_fingerprint = self._fingerprints.popitem(last=False)
+                for key in self._band_keys(old_fingerprint):
+                    bucket = self._buckets.get(key)
+                    if bucket:
+                        bucket.discard(old_id)
+                        if not bucket:
+                            del self._buckets[key]
+
+    def seed(self, jobs):
+        """Index already-tracked jobs, oldest first"""
+        for job in jobs:
+            if job.get('id'):
+                self.add(job)
+
+    def collapse(self, jobs, store=None):
+        """Drop near-duplicates of indexed jobs (or of each other) and index the rest"""
+        unique = []
+        for job in jobs:
+            fingerprint = job_fingerprint(job)
+            duplicate_of = self.find(job, fingerprint)
+            if duplicate_of:
+                logging.info(f"🔁 {job.get('source')} duplicate of {duplicate_of}: {job.get('title')}")
+                if store is not None:
+                    store.discard(job['id'])
+                continue
+            self.add(job, fingerprint)
+            unique.append(job)
+        return unique
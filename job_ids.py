@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Job ID Helpers
+Canonical URLs and stable digests so the same posting gets the same id in every process
+"""
+
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only track the click, never identify the job
+TRACKING_PARAMS = {
+    'ref', 'referrer', 'source', 'src', 'from', 'campaign', 'medium',
+    'fbclid', 'gclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid',
+    'trk', 'trackingid', 'tk', 'vjs', 'advn', 'adid', 'sid', 'sessionid',
+}
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url):
+    """Canonical form of a job URL: lowercase host, no tracking params, sorted query, no fragment"""
+    if not url:
+        return ''
+    url = url.strip()
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+def stable_digest(*parts, length=16):
+    """Hex digest of the given parts that is identical across processes and machines"""
+    text = '\x1f'.join(str(part or '').strip() for part in parts)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=length // 2).hexdigest()
+
+
+def make_job_id(prefix, native_id=None, url=None, *fallback):
+    """Source-prefixed job id: the source's own id, else a digest of the canonical URL, else of the fallback fields"""
+    if native_id not in (None, ''):
+        return f"{prefix}_{native_id}"
+    if url:
+        return f"{prefix}_{stable_digest(normalize_url(url))}"
+    return f"{prefix}_{stable_digest(*(str(field or '').lower() for field in fallback))}"
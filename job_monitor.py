@@ -1,14 +1,21 @@
 import requests
-from bs4 import BeautifulSoup
-import json
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import datetime
-import time
 import os
+import time
 from urllib.parse import urljoin, quote
 import random
+import http_client
+import scan_deadline
+import fetch_engine
+import indeed_cards
+import filter_profiles
+from job_store import open_job_store
+
+# First pause before asking a host that refused us again; doubles with every attempt
+RETRY_BACKOFF = 5
 
 class IndeedJobMonitor:
     def __init__(self, email_config, telegram_config=None):
@@ -19,17 +26,12 @@ class IndeedJobMonitor:
         self.load_tracked_jobs()
         
     def load_tracked_jobs(self):
-        """Load previously tracked jobs from file"""
-        try:
-            with open(self.jobs_file, 'r') as f:
-                self.tracked_jobs = json.load(f)
-        except FileNotFoundError:
-            self.tracked_jobs = {}
+        """Load previously tracked jobs from the job store"""
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
-        """Save tracked jobs to file"""
-        with open(self.jobs_file, 'w') as f:
-            json.dump(self.tracked_jobs, f, indent=2)
+        """Save newly tracked jobs to the job store"""
+        self.tracked_jobs.save()
     
     def build_search_url(self, country=""):
         """Build Indeed search URL for software testing jobs with 2-6 years experience"""
@@ -87,66 +89,60 @@ class IndeedJobMonitor:
         all_new_jobs = []
         
         print("⚠️  Note: Indeed actively blocks automated requests.")
-        print("🔄 Attempting to fetch jobs with anti-detection measures...")
+        print("🔄 Attempting to fetch jobs with per-domain rate limits...")
+        
+        # Every country is its own host with its own rate limit, so they are fetched side by side
+        urls = {country: self.build_search_url(country) for country in countries}
+        responses = {}
+        pending = list(countries)
+        max_retries = 3
+        for attempt in range(max_retries):
+            if attempt:
+                # A blocking host asked again within seconds only blocks us for longer
+                pause = RETRY_BACKOFF * 2 ** (attempt - 1) * random.uniform(1, 1.5)
+                left = scan_deadline.remaining()
+                if left is not None and left <= pause:
+                    break
+                print(f"⏳ Retrying {', '.join(pending)} in {pause:.0f}s...")
+                time.sleep(pause)
+            print(f"Searching jobs in {', '.join(pending)}...")
+            results = fetch_engine.fetch_all(
+                [(urls[country], {'headers': self.get_random_headers(), 'timeout': 15}) for country in pending]
+            )
+            retry = []
+            for country, result in zip(pending, results):
+                if isinstance(result, requests.exceptions.RequestException):
+                    print(f"🌐 Network error for {country}: {str(result)}")
+                    retry.append(country)
+                elif isinstance(result, Exception):
+                    print(f"Error scraping {country}: {str(result)}")
+                elif result.status_code == 200:
+                    print(f"✅ Successfully accessed {country}")
+                    responses[country] = result
+                elif result.status_code == 403:
+                    print(f"🚫 Access blocked for {country} (attempt {attempt + 1}/{max_retries})")
+                    retry.append(country)
+                else:
+                    print(f"❌ Status {result.status_code} for {country}")
+            pending = retry
+            if not pending:
+                break
+        
+        for country in pending:
+            print(f"❌ Failed to access {country} after {max_retries} attempts")
+        
+        # Every page is parsed side by side in the parse pool: embedded job JSON, or the
+        # job-card region when the page has none; first 10 per country
+        fetched = [country for country in countries if country in responses]
+        parsed = dict(zip(fetched, indeed_cards.extract_all([
+            (responses[country].content, 10, self.get_country_domain(country)) for country in fetched
+        ])))
         
-        for country in countries:
+        for country in fetched:
             try:
-                print(f"Searching jobs in {country}...")
-                url = self.build_search_url(country)
-                
-                # Random delay to avoid rate limiting
-                delay = random.uniform(3, 8)
-                print(f"⏱️  Waiting {delay:.1f} seconds before request...")
-                time.sleep(delay)
-                
-                headers = self.get_random_headers()
-                
-                # Use session for better connection handling
-                session = requests.Session()
-                session.headers.update(headers)
-                
-                # Try multiple times with different approaches
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        response = session.get(url, timeout=15)
-                        
-                        if response.status_code == 200:
-                            print(f"✅ Successfully accessed {country}")
-                            break
-                        elif response.status_code == 403:
-                            print(f"🚫 Access blocked for {country} (attempt {attempt + 1}/{max_retries})")
-                            if attempt < max_retries - 1:
-                                time.sleep(random.uniform(5, 10))
-                        else:
-                            print(f"❌ Status {response.status_code} for {country}")
-                            
-                    except requests.exceptions.RequestException as e:
-                        print(f"🌐 Network error for {country}: {str(e)}")
-                        if attempt < max_retries - 1:
-                            time.sleep(random.uniform(3, 6))
-                
-                if response.status_code != 200:
-                    print(f"❌ Failed to access {country} after {max_retries} attempts")
-                    continue
-                
-                # Parse the response
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Try multiple selectors for job cards
-                job_cards = []
-                selectors = [
-                    'div[data-jk]',
-                    '.job_seen_beacon',
-                    '.result',
-                    '.slider_container .slider_item',
-                    '[data-testid="job-title"]'
-                ]
-                
-                for selector in selectors:
-                    job_cards = soup.select(selector)
-                    if job_cards:
-                        break
+                job_cards = parsed[country]
+                if isinstance(job_cards, Exception):
+                    raise job_cards
                 
                 if not job_cards:
                     print(f"❌ No job cards found for {country}")
@@ -154,7 +150,7 @@ class IndeedJobMonitor:
                 
                 print(f"📋 Found {len(job_cards)} job cards in {country}")
                 
-                for card in job_cards[:10]:  # Limit to first 10 jobs per country
+                for card in job_cards:
                     job_data = self.extract_job_data(card, country)
                     if job_data and self.is_relevant_job(job_data):
                         job_id = job_data['id']
@@ -162,10 +158,6 @@ class IndeedJobMonitor:
                             self.tracked_jobs[job_id] = job_data
                             all_new_jobs.append(job_data)
                 
-                # Add longer delay between countries
-                if country != countries[-1]:  # Don't wait after the last country
-                    time.sleep(random.uniform(10, 20))
-                
             except Exception as e:
                 print(f"Error scraping {country}: {str(e)}")
                 continue
@@ -173,27 +165,13 @@ class IndeedJobMonitor:
         return all_new_jobs
     
     def extract_job_data(self, card, country):
-        """Extract job data from job card"""
+        """Build job data from an extracted job card"""
         try:
-            # Extract job title
-            title_elem = card.find('h2', class_='jobTitle') or card.find('a', {'data-jk': True})
-            title = title_elem.get_text().strip() if title_elem else "N/A"
-            
-            # Extract company name
-            company_elem = card.find('span', class_='companyName') or card.find('span', {'data-testid': 'company-name'})
-            company = company_elem.get_text().strip() if company_elem else "N/A"
-            
-            # Extract location
-            location_elem = card.find('div', {'data-testid': 'job-location'}) or card.find('span', class_='locationsContainer')
-            location = location_elem.get_text().strip() if location_elem else "N/A"
-            
-            # Extract job ID
-            job_link = card.find('a', {'data-jk': True})
-            job_id = job_link.get('data-jk') if job_link else None
-            
-            # Extract snippet/description
-            snippet_elem = card.find('div', class_='job-snippet') or card.find('ul')
-            snippet = snippet_elem.get_text().strip() if snippet_elem else "N/A"
+            title = card['title'] or "N/A"
+            company = card['company'] or "N/A"
+            location = card['location'] or "N/A"
+            job_id = card['job_key']
+            snippet = card['snippet'] or "N/A"
             
             # Build job URL
             job_url = f"https://{self.get_country_domain(country)}/viewjob?jk={job_id}" if job_id else "N/A"
@@ -231,25 +209,7 @@ class IndeedJobMonitor:
         title = job_data['title'].lower()
         snippet = job_data['snippet'].lower()
         
-        # Keywords that indicate software testing roles
-        testing_keywords = [
-            'test', 'testing', 'qa', 'quality assurance', 'automation',
-            'selenium', 'cypress', 'junit', 'pytest', 'tester'
-        ]
-        
-        # Experience keywords
-        experience_keywords = [
-            '2 year', '3 year', '4 year', '5 year', '6 year',
-            '2-3', '3-4', '4-5', '5-6', '2 to', '3 to', '4 to', '5 to'
-        ]
-        
-        # Check if job contains testing keywords
-        has_testing = any(keyword in title or keyword in snippet for keyword in testing_keywords)
-        
-        # Check if job mentions relevant experience level
-        has_experience = any(keyword in snippet for keyword in experience_keywords)
-        
-        return has_testing and has_experience
+        return filter_profiles.profile('testing_2_to_6_years').matches(title=title, description=snippet)
     
     def send_telegram_notification(self, new_jobs):
         """Send Telegram notification for new jobs"""
@@ -283,7 +243,7 @@ class IndeedJobMonitor:
                 'disable_web_page_preview': True
             }
             
-            response = requests.post(telegram_url, data=data, timeout=10)
+            response = http_client.post(telegram_url, data=data, timeout=10)
             
             if response.status_code == 200:
                 print(f"📱 Telegram notification sent successfully with {len(new_jobs)} jobs!")
@@ -1,8 +1,6 @@
 # Job Monitor - Alternative Approaches
 # This file contains alternative job monitoring methods that are more reliable than web scraping
 
-import requests
-import json
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -10,8 +8,11 @@ import datetime
 import time
 import os
 from urllib.parse import quote
-import feedparser
 import random
+import http_client
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id
 
 class AlternativeJobMonitor:
     def __init__(self, email_config, telegram_config=None):
@@ -21,17 +22,12 @@ class AlternativeJobMonitor:
         self.load_tracked_jobs()
         
     def load_tracked_jobs(self):
-        """Load previously tracked jobs from file"""
-        try:
-            with open(self.jobs_file, 'r') as f:
-                self.tracked_jobs = json.load(f)
-        except FileNotFoundError:
-            self.tracked_jobs = {}
+        """Load previously tracked jobs from the job store"""
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
-        """Save tracked jobs to file"""
-        with open(self.jobs_file, 'w') as f:
-            json.dump(self.tracked_jobs, f, indent=2)
+        """Save newly tracked jobs to the job store"""
+        self.tracked_jobs.save()
     
     def search_github_jobs(self):
         """Search GitHub Jobs API (if still available)"""
@@ -61,7 +57,7 @@ class AlternativeJobMonitor:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_client.get(url, headers=headers, timeout=10, conditional=True)
             if response.status_code == 200:
                 data = response.json()
                 
@@ -69,7 +65,7 @@ class AlternativeJobMonitor:
                 for job in data[1:]:  # Skip the first item (metadata)
                     if self.is_testing_job(job.get('position', ''), job.get('description', '')):
                         job_data = {
-                            'id': f"remoteok_{job.get('id', '')}",
+                            'id': make_job_id('remoteok', job.get('id'), job.get('url'), job.get('position'), job.get('company')),
                             'title': job.get('position', 'N/A'),
                             'company': job.get('company', 'N/A'),
                             'location': 'Remote',
@@ -110,12 +106,12 @@ class AlternativeJobMonitor:
             try:
                 print(f"🔍 Checking {feed_info['name']} RSS feed...")
                 
-                feed = feedparser.parse(feed_info['url'])
+                feed = http_client.fetch_feed(feed_info['url'])
                 
                 for entry in feed.entries[:20]:  # Limit to recent entries
                     if self.is_testing_job(entry.title, getattr(entry, 'summary', '')):
                         job_data = {
-                            'id': f"rss_{hash(entry.link)}",
+                            'id': make_job_id('rss', None, entry.link),
                             'title': entry.title,
                             'company': 'Various',
                             'location': 'Various',
@@ -139,13 +135,7 @@ class AlternativeJobMonitor:
         title_lower = title.lower()
         desc_lower = description.lower()
         
-        testing_keywords = [
-            'test', 'testing', 'qa', 'quality assurance', 'automation',
-            'selenium', 'cypress', 'junit', 'pytest', 'tester', 'sdet'
-        ]
-        
-        return any(keyword in title_lower or keyword in desc_lower 
-                  for keyword in testing_keywords)
+        return filter_profiles.profile('testing').matches(title=title_lower, description=desc_lower)
     
     def send_telegram_notification(self, new_jobs):
         """Send Telegram notification for new jobs"""
@@ -179,7 +169,7 @@ class AlternativeJobMonitor:
                 'disable_web_page_preview': True
             }
             
-            response = requests.post(telegram_url, data=data, timeout=10)
+            response = http_client.post(telegram_url, data=data, timeout=10)
             
             if response.status_code == 200:
                 print(f"📱 Telegram notification sent successfully with {len(new_jobs)} jobs!")
@@ -1,13 +1,14 @@
 import requests
-from bs4 import BeautifulSoup
-import json
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import datetime
-import time
 import os
 from urllib.parse import urljoin, quote
+import http_client
+import indeed_cards
+import filter_profiles
+from job_store import open_job_store
 
 class IndeedJobMonitor:
     def __init__(self, email_config=None, debug_mode=False):
@@ -18,17 +19,12 @@ class IndeedJobMonitor:
         self.load_tracked_jobs()
         
     def load_tracked_jobs(self):
-        """Load previously tracked jobs from file"""
-        try:
-            with open(self.jobs_file, 'r') as f:
-                self.tracked_jobs = json.load(f)
-        except FileNotFoundError:
-            self.tracked_jobs = {}
+        """Load previously tracked jobs from the job store"""
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
-        """Save tracked jobs to file"""
-        with open(self.jobs_file, 'w') as f:
-            json.dump(self.tracked_jobs, f, indent=2)
+        """Save newly tracked jobs to the job store"""
+        self.tracked_jobs.save()
     
     def build_search_url(self, country=""):
         """Build Indeed search URL for software testing jobs with 2-6 years experience"""
@@ -112,11 +108,7 @@ class IndeedJobMonitor:
                 if self.debug_mode:
                     print(f"📡 Making request to: {url}")
                 
-                # Add session for better connection handling
-                session = requests.Session()
-                session.headers.update(headers)
-                
-                response = session.get(url, timeout=15)
+                response = http_client.get(url, headers=headers, timeout=15)
                 
                 if self.debug_mode:
                     print(f"📊 Response status: {response.status_code}")
@@ -126,7 +118,7 @@ class IndeedJobMonitor:
                     # Try with a different search approach
                     alt_url = self.build_alternative_search_url(country)
                     if alt_url:
-                        response = session.get(alt_url, timeout=15)
+                        response = http_client.get(alt_url, headers=headers, timeout=15)
                         if self.debug_mode:
                             print(f"📊 Alternative URL response: {response.status_code}")
                 
@@ -136,33 +128,21 @@ class IndeedJobMonitor:
                     print(f"✅ Response status: {response.status_code}")
                     print(f"📄 Response size: {len(response.content)} bytes")
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Try multiple selectors for job cards
-                job_cards = []
-                selectors = [
-                    'div[data-jk]',
-                    '.job_seen_beacon',
-                    '.result',
-                    '.slider_container .slider_item',
-                    '[data-testid="job-title"]'
-                ]
-                
-                for selector in selectors:
-                    job_cards = soup.select(selector)
-                    if job_cards:
-                        if self.debug_mode:
-                            print(f"✅ Found {len(job_cards)} job cards using selector: {selector}")
-                        break
+                # Embedded job JSON first; parse the job-card region only when the page has none
+                domain = self.get_country_domain(country)
+                job_cards, selector = indeed_cards.embedded_jobs(response.content), 'embedded JSON'
+                if job_cards is None:
+                    job_cards, selector = indeed_cards.find_cards(indeed_cards.parse(response.content), domain)
+                if job_cards and self.debug_mode:
+                    print(f"✅ Found {len(job_cards)} job cards using selector: {selector}")
                 
                 if not job_cards:
                     if self.debug_mode:
                         print("❌ No job cards found with any selector")
                         # Print page structure for debugging
                         print("🔍 Page structure analysis:")
-                        titles = soup.find_all(['h1', 'h2', 'h3'])[:5]
-                        for title in titles:
-                            print(f"  Title: {title.get_text().strip()[:100]}")
+                        for title in indeed_cards.page_headings(response.content):
+                            print(f"  Title: {title}")
                     continue
                 
                 jobs_found = 0
@@ -170,7 +150,7 @@ class IndeedJobMonitor:
                     if self.debug_mode:
                         print(f"🔎 Processing job card {i+1}...")
                     
-                    job_data = self.extract_job_data(card, country)
+                    job_data = self.extract_job_data(card, country, domain)
                     if job_data:
                         if self.debug_mode:
                             print(f"📋 Extracted: {job_data['title']} at {job_data['company']}")
@@ -192,9 +172,6 @@ class IndeedJobMonitor:
                 
                 print(f"✅ Found {jobs_found} new relevant jobs in {country}")
                 
-                # Add delay between requests to be respectful
-                time.sleep(2)
-                
             except requests.exceptions.RequestException as e:
                 print(f"🌐 Network error scraping {country}: {str(e)}")
                 continue
@@ -205,92 +182,30 @@ class IndeedJobMonitor:
                     traceback.print_exc()
                 continue
         
+        if self.debug_mode:
+            # A climbing miss count means Indeed changed a layout
+            print("🧭 Selector cache:")
+            for line in indeed_cards.selector_cache.summary():
+                print(f"  {line}")
+        
         return all_new_jobs
     
-    def extract_job_data(self, card, country):
+    def extract_job_data(self, card, country, domain=''):
         """Extract job data from job card"""
         try:
-            # Extract job ID first (most reliable identifier)
-            job_id = None
-            if card.get('data-jk'):
-                job_id = card.get('data-jk')
-            else:
-                job_link = card.find('a', {'data-jk': True})
-                if job_link:
-                    job_id = job_link.get('data-jk')
+            fields = card if isinstance(card, dict) else indeed_cards.card_fields(card, domain)
             
+            # Job ID first (most reliable identifier)
+            job_id = fields['job_key']
             if not job_id:
                 if self.debug_mode:
                     print("❌ No job ID found in card")
                 return None
             
-            # Extract job title with multiple selectors
-            title = "N/A"
-            title_selectors = [
-                'h2[data-testid="job-title"] a span',
-                'h2 a[data-testid="job-title-link"] span',
-                '.jobTitle a span[title]',
-                'h2.jobTitle a span',
-                '[data-testid="job-title"]',
-                '.jobTitle',
-                'h2 a span'
-            ]
-            
-            for selector in title_selectors:
-                title_elem = card.select_one(selector)
-                if title_elem:
-                    title = title_elem.get('title') or title_elem.get_text().strip()
-                    if title and title != "N/A":
-                        break
-            
-            # Extract company name
-            company = "N/A"
-            company_selectors = [
-                '[data-testid="company-name"]',
-                '.companyName',
-                'span.companyName a',
-                'span.companyName span',
-                '[data-testid="company-name"] a'
-            ]
-            
-            for selector in company_selectors:
-                company_elem = card.select_one(selector)
-                if company_elem:
-                    company = company_elem.get_text().strip()
-                    if company and company != "N/A":
-                        break
-            
-            # Extract location
-            location = "N/A"
-            location_selectors = [
-                '[data-testid="job-location"]',
-                '.locationsContainer',
-                '.companyLocation',
-                '.location'
-            ]
-            
-            for selector in location_selectors:
-                location_elem = card.select_one(selector)
-                if location_elem:
-                    location = location_elem.get_text().strip()
-                    if location and location != "N/A":
-                        break
-            
-            # Extract snippet/description
-            snippet = "N/A"
-            snippet_selectors = [
-                '[data-testid="job-snippet"]',
-                '.job-snippet',
-                '.summary',
-                '.jobSnippet'
-            ]
-            
-            for selector in snippet_selectors:
-                snippet_elem = card.select_one(selector)
-                if snippet_elem:
-                    snippet = snippet_elem.get_text().strip()
-                    if snippet and snippet != "N/A":
-                        break
+            title = fields['title'] or "N/A"
+            company = fields['company'] or "N/A"
+            location = fields['location'] or "N/A"
+            snippet = fields['snippet'] or "N/A"
             
             # Build job URL
             job_url = f"https://{self.get_country_domain(country)}/viewjob?jk={job_id}"
@@ -336,35 +251,18 @@ class IndeedJobMonitor:
         title = job_data['title'].lower()
         snippet = job_data['snippet'].lower()
         
-        # Keywords that indicate software testing roles
-        testing_keywords = [
-            'test', 'testing', 'qa', 'quality assurance', 'automation',
-            'selenium', 'cypress', 'junit', 'pytest', 'tester', 'sdet'
-        ]
-        
-        # Experience keywords (more flexible)
-        experience_keywords = [
-            '2 year', '3 year', '4 year', '5 year', '6 year',
-            '2-3', '3-4', '4-5', '5-6', '2 to', '3 to', '4 to', '5 to',
-            '2+', '3+', '4+', '5+', 'junior', 'mid-level', 'intermediate'
-        ]
-        
-        # Check if job contains testing keywords
-        has_testing = any(keyword in title or keyword in snippet for keyword in testing_keywords)
-        
-        # Check if job mentions relevant experience level (more lenient for debugging)
-        has_experience = any(keyword in snippet for keyword in experience_keywords)
+        # Testing and experience groups of the shared profile, found in one pass
+        profile = filter_profiles.profile('testing_2_to_6_years')
+        found = profile.matched(title=title, description=snippet)
+        has_testing = 'testing' in found
+        has_experience = 'experience' in found
         
         if self.debug_mode:
             print(f"🔍 Relevance check for '{job_data['title'][:50]}...':")
             print(f"   Testing keywords found: {has_testing}")
             print(f"   Experience keywords found: {has_experience}")
-            if has_testing:
-                found_testing = [kw for kw in testing_keywords if kw in title or kw in snippet]
-                print(f"   Testing keywords: {found_testing}")
-            if has_experience:
-                found_exp = [kw for kw in experience_keywords if kw in snippet]
-                print(f"   Experience keywords: {found_exp}")
+            for group, keywords in profile.explain(title=title, description=snippet).items():
+                print(f"   {group.capitalize()} keywords: {keywords}")
         
         # For debugging, let's be more lenient - just need testing keywords
         return has_testing
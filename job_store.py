@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Tracked Job Store
+SQLite or append-only JSONL storage shared by all monitors - each scan only writes its new jobs
+"""
+
+import sqlite3
+import json
+import os
+import sys
+import glob
+import threading
+import logging
+from collections import deque
+
+from seen_index import SeenIndex
+
+
+class SQLiteJobStore:
+    """Dict-like tracked-job store backed by an indexed SQLite table"""
+
+    def __init__(self, db_path, legacy_json=None):
+        self.db_path = db_path
+        self.index_path = db_path + '.idx'
+        self._lock = threading.RLock()
+        self._pending = {}
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            'id TEXT PRIMARY KEY, '
+            'source TEXT, '
+            'found_at TEXT, '
+            'data TEXT NOT NULL)'
+        )
+        self.conn.commit()
+
+        # Only id hashes stay resident - payloads are read from the table on demand. The index
+        # is stamped with the last rowid it holds; rows past that (another monitor sharing
+        # the database may have written them) are read in on open and on every save
+        self._seen, self._indexed = SeenIndex.read(self.index_path)
+        if self._seen is None or self._indexed > self._stamp():
+            self._seen, self._indexed = SeenIndex(), 0
+        if self._catch_up():
+            self._write_index()
+
+        # One-shot migration from the old whole-file JSON format
+        if legacy_json and not len(self._seen) and os.path.exists(legacy_json):
+            migrate_json_file(self, legacy_json)
+
+    def _stamp(self):
+        return self.conn.execute('SELECT COALESCE(MAX(rowid), 0) FROM jobs').fetchone()[0]
+
+    def _catch_up(self):
+        """Index the rows written since the last one indexed; returns how many there were"""
+        rows = self.conn.execute('SELECT rowid, id FROM jobs WHERE rowid > ? ORDER BY rowid',
+                                 (self._indexed,)).fetchall()
+        self._seen.update(job_id for rowid, job_id in rows)
+        if rows:
+            self._indexed = rows[-1][0]
+        return len(rows)
+
+    def _write_index(self):
+        try:
+            self._seen.save(self.index_path, self._indexed)
+        except OSError as e:
+            logging.warning(f"Seen index not written: {e}")
+
+    def __contains__(self, job_id):
+        job_id = str(job_id)
+        with self._lock:
+            return job_id in self._pending or job_id in self._seen
+
+    def __setitem__(self, job_id, job):
+        job_id = str(job_id)
+        with self._lock:
+            if job_id not in self._seen:
+                self._pending[job_id] = job
+
+    def discard(self, job_id):
+        """Drop a job that has not been saved yet"""
+        with self._lock:
+            self._pending.pop(str(job_id), None)
+
+    def __getitem__(self, job_id):
+        job = self.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        return job
+
+    def get(self, job_id, default=None):
+        job_id = str(job_id)
+        with self._lock:
+            if job_id in self._pending:
+                return self._pending[job_id]
+            row = self.conn.execute('SELECT data FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def __len__(self):
+        with self._lock:
+            return len(self._seen) + len(self._pending)
+
+    def __iter__(self):
+        with self._lock:
+            ids = [row[0] for row in self.conn.execute('SELECT id FROM jobs ORDER BY rowid')]
+            ids.extend(self._pending)
+        return iter(ids)
+
+    def values(self):
+        """Iterate stored jobs in insertion order"""
+        with self._lock:
+            rows = self.conn.execute('SELECT data FROM jobs ORDER BY rowid').fetchall()
+            pending = list(self._pending.values())
+        for row in rows:
+            yield json.loads(row[0])
+        yield from pending
+
+    def recent(self, limit=200):
+        """Return the most recently stored jobs, newest first"""
+        with self._lock:
+            pending = list(self._pending.values())[::-1][:limit]
+            rows = self.conn.execute(
+                'SELECT data FROM jobs ORDER BY rowid DESC LIMIT ?', (limit - len(pending),)
+            ).fetchall()
+        return pending + [json.loads(row[0]) for row in rows]
+
+    def save(self):
+        """Insert only the jobs added since the last save"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            rows = [
+                (job_id, job.get('source'), job.get('date_found') or job.get('found_at') or job.get('posted'),
+                 json.dumps(job, ensure_ascii=False, separators=(',', ':')))
+                for job_id, job in self._pending.items()
+            ]
+            with self.conn:
+                self.conn.executemany(
+                    'INSERT OR IGNORE INTO jobs (id, source, found_at, data) VALUES (?, ?, ?, ?)', rows
+                )
+            saved = len(self._pending)
+            self._pending = {}
+
+            # Our rows and any another process wrote since; monitors rarely get to close(),
+            # so the index has to match the table after every save
+            self._catch_up()
+            self._write_index()
+            return saved
+
+    def close(self):
+        """Flush pending jobs and fold the WAL back into the main database file"""
+        with self._lock:
+            self.save()
+            self._write_index()
+            self.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            self.conn.close()
+
+
+class JournalJobStore:
+    """Dict-like tracked-job store kept as a JSONL snapshot plus an append-only journal"""
+
+    # Fold the journal into the snapshot once it grows past this size
+    COMPACT_THRESHOLD_BYTES = 256 * 1024
+
+    def __init__(self, snapshot_path, legacy_json=None, compact_threshold=None):
+        self.snapshot_path = snapshot_path
+        self.journal_path = os.path.splitext(snapshot_path)[0] + '.journal.jsonl'
+        self.compacting_path = self.journal_path + '.compacting'
+        self.index_path = snapshot_path + '.idx'
+        self.compact_threshold = compact_threshold or self.COMPACT_THRESHOLD_BYTES
+        self._lock = threading.RLock()
+        self._compactor = None
+        self._pending = {}
+        self._seen = None
+
+        # A compaction cut short by the process dying is finished before anything reads the files
+        if os.path.exists(self.compacting_path):
+            logging.info(f"🗜️ Finishing interrupted compaction of {self.compacting_path}")
+            self._write_snapshot()
+
+        # Only id hashes stay resident - payloads are streamed from the files on demand. The
+        # index is stamped with the file sizes it accounts for, which only this process's
+        # own writes move; any other change means another monitor wrote, and it is rebuilt
+        self._indexed = self._stamp()
+        self._seen = SeenIndex.load(self.index_path, self._indexed)
+        if self._seen is None:
+            self._reindex()
+            self._write_index()
+
+        # One-shot migration from the old whole-file JSON format
+        if legacy_json and not len(self._seen) and os.path.exists(legacy_json):
+            migrate_json_file(self, legacy_json)
+
+    def _open(self, path):
+        try:
+            return open(path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return None  # Not created yet, or just removed by a finished compaction
+
+    def _lines(self, f):
+        with f:
+            for line in f:
+                try:
+                    job_id, job = json.loads(line)
+                except ValueError:
+                    continue  # Torn final line from an interrupted append
+                yield job_id, job
+
+    def _read_lines(self, path):
+        f = self._open(path)
+        if f is not None:
+            yield from self._lines(f)
+
+    def _replay(self):
+        """Stream saved jobs: snapshot, then any interrupted compaction, then the live journal"""
+        # Opened together under the lock, so a compaction swapping files meanwhile can't hide jobs
+        with self._lock:
+            files = [self._open(path) for path in (self.snapshot_path, self.compacting_path, self.journal_path)]
+        seen = set()
+        try:
+            for f in files:
+                if f is None:
+                    continue
+                for job_id, job in self._lines(f):
+                    if job_id not in seen:
+                        seen.add(job_id)
+                        yield job_id, job
+        finally:
+            for f in files:
+                if f is not None:
+                    f.close()
+
+    def _stamp(self):
+        paths = (self.snapshot_path, self.compacting_path, self.journal_path)
+        return sum(os.path.getsize(path) for path in paths if os.path.exists(path))
+
+    def _reindex(self):
+        # Stamped before reading, so anything written meanwhile makes the next check rebuild again
+        self._indexed = self._stamp()
+        self._seen = SeenIndex.from_ids(job_id for job_id, job in self._replay())
+
+    def _changed(self, before):
+        """Account for a write of our own that found the files at stamp `before`"""
+        if before == self._indexed:
+            self._indexed = self._stamp()
+        else:
+            logging.info(f"🔁 {self.snapshot_path} was written by another process, re-indexing")
+            self._reindex()
+
+    def _write_index(self):
+        try:
+            self._seen.save(self.index_path, self._indexed)
+        except OSError as e:
+            logging.warning(f"Seen index not written: {e}")
+
+    def __contains__(self, job_id):
+        job_id = str(job_id)
+        with self._lock:
+            return job_id in self._pending or job_id in self._seen
+
+    def __setitem__(self, job_id, job):
+        job_id = str(job_id)
+        with self._lock:
+            if job_id not in self._seen:
+                self._pending[job_id] = job
+
+    def discard(self, job_id):
+        """Drop a job that has not been saved yet"""
+        with self._lock:
+            self._pending.pop(str(job_id), None)
+
+    def __getitem__(self, job_id):
+        job = self.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        return job
+
+    def get(self, job_id, default=None):
+        job_id = str(job_id)
+        with self._lock:
+            if job_id in self._pending:
+                return self._pending[job_id]
+            if job_id not in self._seen:
+                return default
+            for stored_id, job in self._replay():
+                if stored_id == job_id:
+                    return job
+        return default
+
+    def __len__(self):
+        with self._lock:
+            return len(self._seen) + len(self._pending)
+
+    def __iter__(self):
+        with self._lock:
+            ids = [job_id for job_id, job in self._replay()]
+            ids.extend(self._pending)
+        return iter(ids)
+
+    def values(self):
+        """Iterate stored jobs in insertion order"""
+        with self._lock:
+            pending = list(self._pending.values())
+        for job_id, job in self._replay():
+            yield job
+        yield from pending
+
+    def recent(self, limit=200):
+        """Return the most recently stored jobs, newest first"""
+        if limit <= 0:
+            return []
+        with self._lock:
+            jobs = deque(self.values(), maxlen=limit)
+        return list(jobs)[::-1]
+
+    def save(self):
+        """Append one compact line per job added since the last save"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            lines = ''.join(
+                json.dumps([job_id, job], ensure_ascii=False, separators=(',', ':')) + '\n'
+                for job_id, job in self._pending.items()
+            )
+            before = self._stamp()
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+            self._seen.update(self._pending)
+            saved = len(self._pending)
+            self._pending = {}
+            self._changed(before)
+
+            # Monitors rarely get to close(), so the index has to match the files after every save
+            self._write_index()
+            if os.path.getsize(self.journal_path) >= self.compact_threshold:
+                self.compact(background=True)
+            return saved
+
+    def compact(self, background=False):
+        """Fold the journal into a fresh snapshot"""
+        with self._lock:
+            if self._compactor and self._compactor.is_alive():
+                return
+            if not os.path.exists(self.journal_path) or os.path.exists(self.compacting_path):
+                return
+            # New appends go to a fresh journal while the old one is merged
+            os.replace(self.journal_path, self.compacting_path)
+
+        if background:
+            self._compactor = threading.Thread(target=self._write_snapshot, daemon=True)
+            self._compactor.start()
+        else:
+            self._write_snapshot()
+
+    def _write_snapshot(self):
+        try:
+            seen = set()
+            tmp_path = self.snapshot_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as out:
+                for path in (self.snapshot_path, self.compacting_path):
+                    for job_id, job in self._read_lines(path):
+                        if job_id not in seen:
+                            seen.add(job_id)
+                            out.write(json.dumps([job_id, job], ensure_ascii=False, separators=(',', ':')) + '\n')
+            # Readers open snapshot, compacting and journal under the lock, so they see both files or neither
+            with self._lock:
+                before = self._stamp()
+                os.replace(tmp_path, self.snapshot_path)
+                os.remove(self.compacting_path)
+                if self._seen is not None:
+                    self._changed(before)
+                    self._write_index()
+            logging.info(f"🗜️ Compacted {len(seen)} jobs into {self.snapshot_path}")
+        except Exception as e:
+            logging.error(f"Journal compaction error: {e}")
+
+    def close(self):
+        """Flush pending jobs and wait for any running compaction"""
+        self.save()
+        if self._compactor:
+            self._compactor.join()
+        self._write_index()
+
+
+def store_path_for(jobs_file, backend='sqlite'):
+    """Map a legacy *_jobs.json path to the path used by a storage backend"""
+    extension = '.jsonl' if backend == 'journal' else '.db'
+    return os.path.splitext(jobs_file)[0] + extension
+
+
+def store_backend():
+    """Storage backend chosen with JOB_STORE_BACKEND (sqlite or journal)"""
+    return os.environ.get('JOB_STORE_BACKEND', 'sqlite').lower()
+
+
+def open_job_store(jobs_file, backend=None):
+    """Open the tracked-job store for a monitor, migrating its legacy JSON file on first use"""
+    backend = backend or store_backend()
+    if backend == 'journal':
+        return JournalJobStore(store_path_for(jobs_file, backend), legacy_json=jobs_file)
+    return SQLiteJobStore(store_path_for(jobs_file, backend), legacy_json=jobs_file)
+
+
+def import_json_file(store, json_path):
+    """Import a legacy tracked-jobs JSON file into a store"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        jobs = json.load(f)
+    if not isinstance(jobs, dict):
+        raise ValueError(f"expected an object of jobs keyed by id, not {type(jobs).__name__}")
+
+    for job_id, job in jobs.items():
+        store[job_id] = job
+    return store.save()
+
+
+def migrate_json_file(store, json_path):
+    """Import a monitor's legacy JSON file on first open; an unreadable one leaves the store empty"""
+    try:
+        imported = import_json_file(store, json_path)
+    except (OSError, ValueError) as e:
+        # Same as the old load_tracked_jobs: start with no history rather than not at all
+        logging.error(f"❌ Could not import {json_path}, starting with no tracked jobs: {e}")
+        return 0
+    logging.info(f"📦 Imported {imported} jobs from {json_path}")
+    return imported
+
+
+def main():
+    """One-shot importer: [JOB_STORE_BACKEND=journal] python job_store.py [jobs.json ...]"""
+    paths = sys.argv[1:] or sorted(set(glob.glob('*_jobs.json') + glob.glob('tracked_jobs*.json')))
+
+    if not paths:
+        print("ℹ️ No legacy job files found")
+        return
+
+    backend = store_backend()
+    store_class = JournalJobStore if backend == 'journal' else SQLiteJobStore
+
+    for path in paths:
+        try:
+            target = store_path_for(path, backend)
+            store = store_class(target)
+            imported = import_json_file(store, path)
+            print(f"✅ {path} -> {target}: {imported} new jobs ({len(store)} total)")
+            store.close()
+        except Exception as e:
+            print(f"❌ {path}: {e}")
+
+
+if __name__ == "__main__":
+    main()
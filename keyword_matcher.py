@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Keyword Matcher
+Every keyword list a filter uses compiled into one Aho-Corasick automaton, so a single pass
+over a job's text finds all of them no matter how many keywords there are
+"""
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick missing: same answers from one substring search per keyword
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """Named keyword groups in one automaton. Matching is by substring and ignores case,
+    exactly like `keyword in text.lower()`"""
+
+    def __init__(self, groups):
+        groups_of = {}
+        for name, keywords in groups.items():
+            for keyword in keywords:
+                keyword = str(keyword).lower()
+                if keyword:
+                    groups_of.setdefault(keyword, set()).add(name)
+        # Keywords are numbered in this order; the automaton's values are the numbers
+        self.keywords = list(groups_of)
+        self._groups = [frozenset(groups_of[keyword]) for keyword in self.keywords]
+
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            self._automaton = ahocorasick.Automaton()
+            for number, keyword in enumerate(self.keywords):
+                self._automaton.add_word(keyword, number)
+            self._automaton.make_automaton()
+
+    def occurrences(self, text):
+        """(last index, keyword number) for every occurrence in one already-lowercased text, in
+        text order: by where each one ends, the longer first when two end together"""
+        if self._automaton is not None:
+            return self._automaton.iter(text)
+        found = []
+        for number, keyword in enumerate(self.keywords):
+            start = text.find(keyword)
+            while start != -1:
+                found.append((start + len(keyword) - 1, number))
+                start = text.find(keyword, start + 1)
+        found.sort(key=lambda hit: (hit[0], -len(self.keywords[hit[1]])))
+        return found
+
+    def spans(self, text):
+        """(start, end, keyword, groups) for every occurrence in one already-lowercased text, in text order"""
+        for last, number in self.occurrences(text):
+            keyword = self.keywords[number]
+            yield last + 1 - len(keyword), last + 1, keyword, self._groups[number]
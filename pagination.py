@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Paginated Search
+Walk an API's result pages a few at a time through the fetch engine, within a per-API page
+budget, until the results run out. Reed and Jooble rank results by relevance rather than
+date, so new jobs can sit on any page and every page up to the budget is read; the caller
+drops the ones seen before.
+"""
+
+import math
+import logging
+
+import fetch_engine
+
+REED_SEARCH_URL = "https://www.reed.co.uk/api/1.0/search"
+JOOBLE_API_URL = "https://jooble.org/api/{api_key}"
+
+# Results per page: Reed takes up to 100 via resultsToTake, Jooble returns a fixed 20
+REED_PAGE_SIZE = 100
+JOOBLE_PAGE_SIZE = 20
+
+# Pages one scan may spend from each API's daily request quota
+PAGE_BUDGETS = {
+    'reed': 4,
+    'jooble': 5,
+}
+DEFAULT_BUDGET = 3
+
+# Pages requested side by side once the first page shows there is more to read
+PAGES_IN_FLIGHT = 3
+
+
+def page_budget(api):
+    return PAGE_BUDGETS.get(api, DEFAULT_BUDGET)
+
+
+def fetch_pages(api, page_request, parse, page_size, budget=None):
+    """Items from successive pages, in page order.
+
+    page_request(page) -> (url, kwargs) for the zero-based page;
+    parse(response) -> (items, total results or None).
+    The first page is fetched alone - its total says how many pages there are - and
+    deeper pages follow PAGES_IN_FLIGHT at a time, so a scan costs one or two extra
+    round trips rather than one per page."""
+    budget = page_budget(api) if budget is None else budget
+    items = []
+    page = 0
+    last_page = budget
+    total = None
+    window = 1
+    while page < last_page:
+        pages = range(page, min(last_page, page + window))
+        responses = fetch_engine.fetch_all([page_request(number) for number in pages])
+        for number, response in zip(pages, responses):
+            if isinstance(response, Exception):
+                logging.error(f"❌ {api} page {number + 1} failed: {str(response)}")
+                return items
+            if response.status_code != 200:
+                logging.error(f"❌ {api} page {number + 1} failed: {response.status_code}")
+                return items
+
+            page_items, total = parse(response)
+            items.extend(page_items)
+            if total is not None:
+                last_page = min(last_page, math.ceil(total / page_size))
+            if len(page_items) < page_size:
+                return items
+        page = pages.stop
+        window = PAGES_IN_FLIGHT
+
+    if total is None or total > budget * page_size:
+        logging.info(f"📄 {api}: stopped at the {budget}-page budget with more results waiting")
+    return items
+
+
+def reed_search(api_key, params, headers=None, budget=None, url=REED_SEARCH_URL):
+    """Reed search results for params, every page within the budget"""
+    def page_request(page):
+        # Reed takes the API key as the basic-auth username
+        return url, {'params': dict(params, resultsToTake=REED_PAGE_SIZE, resultsToSkip=page * REED_PAGE_SIZE),
+                     'auth': (api_key, ''), 'headers': headers, 'timeout': 15}
+
+    def parse(response):
+        data = response.json()
+        return data.get('results', []), data.get('totalResults')
+    return fetch_pages('reed', page_request, parse, REED_PAGE_SIZE, budget)
+
+
+def jooble_search(api_key, params, headers=None, budget=None, url=JOOBLE_API_URL):
+    """Jooble search results for params, every page within the budget"""
+    def page_request(page):
+        return url.format(api_key=api_key), {'method': 'POST', 'json': dict(params, page=str(page + 1)),
+                                             'headers': headers, 'timeout': 15}
+
+    def parse(response):
+        data = response.json()
+        return data.get('jobs', []), data.get('totalCount')
+    return fetch_pages('jooble', page_request, parse, JOOBLE_PAGE_SIZE, budget)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Parse Pool
+Persistent worker processes for CPU-bound feed and results-page parsing, so parsing
+spreads across cores while the fetch engine's io threads keep downloading
+"""
+
+import os
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Workers are never forked from the threaded monitor process itself: a fork can copy a lock
+# some other thread is holding
+START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Bodies smaller than this parse faster in-thread than the round trip to a worker takes
+MIN_POOL_BYTES = 16 * 1024
+
+def parse_feed(content, headers=None, limit=None, seen_ids=None):
+    """Streaming parse of a feed, trimmed to the entry fields the monitors use (runs in a worker)"""
+    import feed_stream
+
+    return feed_stream.read_feed(content, headers, limit=limit, seen_ids=seen_ids)
+
+
+class ParsePool:
+    """Lazily started process pool; falls back to parsing in the calling thread when workers
+    can't be started or die"""
+
+    def __init__(self, max_workers=MAX_WORKERS, min_pool_bytes=MIN_POOL_BYTES):
+        self.max_workers = max_workers
+        self.min_pool_bytes = min_pool_bytes
+        self._lock = threading.Lock()
+        self._executor = None
+        self._disabled = max_workers < 1
+        self.pooled = 0
+        self.inline = 0
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None and not self._disabled:
+                try:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                         mp_context=multiprocessing.get_context(START_METHOD))
+                    logging.info(f"🧮 Parse pool started ({self.max_workers} workers)")
+                except (OSError, NotImplementedError, ValueError) as e:
+                    logging.warning(f"Parse pool unavailable, parsing in-thread: {e}")
+                    self._disabled = True
+            return self._executor
+
+    def _broken(self, e):
+        logging.warning(f"Parse pool broke, parsing in-thread: {e}")
+        with self._lock:
+            self._executor = None
+            self._disabled = True
+
+    def _use_pool(self, content):
+        return len(content or b'') >= self.min_pool_bytes and self._get_executor() is not None
+
+    def run(self, func, content, *args):
+        """func(content, *args) in a worker, blocking the calling thread until it's done"""
+        if self._use_pool(content):
+            try:
+                result = self._executor.submit(func, content, *args).result()
+                self.pooled += 1
+                return result
+            except (BrokenProcessPool, AttributeError) as e:
+                self._broken(e)
+        self.inline += 1
+        return func(content, *args)
+
+    async def run_async(self, loop, func, content, *args):
+        """Coroutine: func(content, *args) in a worker without holding an io thread"""
+        if self._use_pool(content):
+            try:
+                result = await loop.run_in_executor(self._executor, func, content, *args)
+                self.pooled += 1
+                return result
+            except (BrokenProcessPool, AttributeError) as e:
+                self._broken(e)
+        self.inline += 1
+        # Small bodies still stay off the event loop thread
+        return await loop.run_in_executor(None, func, content, *args)
+
+    def parse_all(self, func, calls):
+        """func(*call) for each call tuple, side by side; results line up with the input,
+        errors are returned not raised"""
+        pending = []
+        for call in calls:
+            if self._use_pool(call[0]):
+                try:
+                    pending.append((call, self._executor.submit(func, *call)))
+                    continue
+                except (BrokenProcessPool, RuntimeError, AttributeError) as e:
+                    self._broken(e)
+            pending.append((call, None))
+
+        results = []
+        for call, future in pending:
+            try:
+                if future is not None:
+                    try:
+                        results.append(future.result())
+                        self.pooled += 1
+                        continue
+                    except BrokenProcessPool as e:
+                        self._broken(e)
+                self.inline += 1
+                results.append(func(*call))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+pool = ParsePool()
+
+
+def run(func, content, *args):
+    return pool.run(func, content, *args)
+
+
+def run_async(loop, func, content, *args):
+    return pool.run_async(loop, func, content, *args)
+
+
+def parse_all(func, calls):
+    return pool.parse_all(func, calls)
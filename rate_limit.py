@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Per-Host Rate Limiter
+A token bucket for every host, so each Indeed country domain (and every other job board)
+is paced on its own instead of the whole scan sleeping between requests
+"""
+
+import time
+import logging
+import threading
+from urllib.parse import urlsplit
+
+import scan_deadline
+
+# (requests per second, burst) by site name; the name matches any label of the host,
+# so 'indeed' covers indeed.com, uk.indeed.com and indeed.co.uk with one bucket each
+HOST_RATES = {
+    'indeed': (0.5, 2),
+    'remoteok': (1.0, 3),
+    'reed': (2.0, 4),
+    'jooble': (2.0, 4),
+    'weworkremotely': (1.0, 3),
+    'stackoverflow': (1.0, 3),
+}
+
+
+class TokenBucket:
+    """Tokens refill at `rate` per second up to `capacity`; each request takes one"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return how long to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            # Negative balance: this caller's token arrives once the debt is repaid
+            return -self._tokens / self.rate
+
+
+class HostRateLimiter:
+    """Lazily created token bucket per hostname"""
+
+    def __init__(self, rates=None):
+        self.rates = HOST_RATES if rates is None else rates
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def rate_for(self, host):
+        labels = host.split('.')
+        for name, rate in self.rates.items():
+            if name in labels:
+                return rate
+        return None
+
+    def _bucket(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                rate = self.rate_for(host)
+                self._buckets[host] = TokenBucket(*rate) if rate else None
+            return self._buckets[host]
+
+    def wait(self, url):
+        """Block until this host may be requested again; unlisted hosts never wait"""
+        host = (urlsplit(url).hostname or '').lower()
+        bucket = self._bucket(host)
+        if bucket is None:
+            return 0
+        delay = bucket.reserve()
+        left = scan_deadline.remaining()
+        if left is not None and delay > left:
+            # Never sleep past the scan deadline; the request's own deadline check then gives up
+            delay = max(left, 0)
+        if delay > 0:
+            logging.debug(f"⏳ {host}: waiting {delay:.1f}s for rate limit")
+            self.waited += delay
+            time.sleep(delay)
+        return delay
+
+
+limiter = HostRateLimiter()
+
+
+def wait(url):
+    return limiter.wait(url)
@@ -4,8 +4,6 @@ REAL-TIME Job Monitor - Immediate Alerts for Real Jobs
 Monitors multiple job sources and sends instant notifications for new testing jobs
 """
 
-import requests
-import json
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -13,8 +11,14 @@ import datetime
 import time
 import os
 import threading
-from concurrent.futures import ThreadPoolExecutor
 import schedule
+import http_client
+import fetch_engine
+import relevance
+import alert_pipeline
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id
 
 class RealTimeJobMonitor:
     def __init__(self, email_config, telegram_config):
@@ -34,17 +38,12 @@ class RealTimeJobMonitor:
         ]
         
     def load_tracked_jobs(self):
-        """Load previously tracked jobs from file"""
-        try:
-            with open(self.jobs_file, 'r') as f:
-                self.tracked_jobs = json.load(f)
-        except FileNotFoundError:
-            self.tracked_jobs = {}
+        """Load previously tracked jobs from the job store"""
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
-        """Save tracked jobs to file"""
-        with open(self.jobs_file, 'w') as f:
-            json.dump(self.tracked_jobs, f, indent=2)
+        """Save newly tracked jobs to the job store"""
+        self.tracked_jobs.save()
     
     def check_remoteok(self):
         """Check RemoteOK API for latest jobs"""
@@ -57,7 +56,7 @@ class RealTimeJobMonitor:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_client.get(url, headers=headers, timeout=15, conditional=True)
             if response.status_code == 200:
                 data = response.json()
                 
@@ -66,7 +65,7 @@ class RealTimeJobMonitor:
                 
                 for job in data[1:50]:  # Check first 50 jobs
                     if self.is_testing_job(job.get('position', ''), job.get('description', '')):
-                        job_id = f"remoteok_{job.get('id', '')}"
+                        job_id = make_job_id('remoteok', job.get('id'), job.get('url'), job.get('position'), job.get('company'))
                         
                         if job_id not in self.tracked_jobs:
                             job_data = {
@@ -101,7 +100,7 @@ class RealTimeJobMonitor:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_client.get(url, headers=headers, timeout=15)
             if response.status_code == 200:
                 # Note: This would need HTML parsing for full implementation
                 # For now, using a simplified approach
@@ -162,30 +161,8 @@ class RealTimeJobMonitor:
         title_lower = title.lower()
         desc_lower = description.lower()
         
-        # Testing keywords
-        testing_keywords = [
-            'test', 'testing', 'qa', 'quality assurance', 'automation',
-            'selenium', 'cypress', 'junit', 'pytest', 'tester', 'sdet',
-            'quality engineer', 'test engineer', 'automation engineer',
-            'functional testing', 'regression testing', 'api testing',
-            'performance testing', 'load testing', 'test automation'
-        ]
-        
-        # Experience keywords (2-6 years)
-        experience_keywords = [
-            '2 year', '3 year', '4 year', '5 year', '6 year',
-            '2-3', '3-4', '4-5', '5-6', '2 to', '3 to', '4 to', '5 to',
-            'junior', 'mid-level', 'intermediate'
-        ]
-        
-        # Check if job contains testing keywords
-        has_testing = any(keyword in title_lower or keyword in desc_lower for keyword in testing_keywords)
-        
-        # Check if job mentions relevant experience level or is entry-mid level
-        has_experience = any(keyword in desc_lower for keyword in experience_keywords)
-        
-        # Also accept jobs without specific experience mention (they might be suitable)
-        return has_testing and (has_experience or 'senior' not in desc_lower)
+        # Testing role; senior ones only when they also mention a 2-6 year range
+        return filter_profiles.profile('testing_mid_level').matches(title=title_lower, description=desc_lower)
     
     def send_instant_telegram_alert(self, new_jobs):
         """Send instant Telegram alert for new jobs"""
@@ -222,7 +199,7 @@ class RealTimeJobMonitor:
                 'disable_web_page_preview': False
             }
             
-            response = requests.post(telegram_url, data=data, timeout=10)
+            response = http_client.post(telegram_url, data=data, timeout=10)
             
             if response.status_code == 200:
                 print(f"📱 INSTANT Telegram alert sent with {len(new_jobs)} jobs!")
@@ -314,27 +291,25 @@ class RealTimeJobMonitor:
         
         all_new_jobs = []
         
-        # Check all sources concurrently for speed
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_source = {executor.submit(source): source for source in self.job_sources}
-            
-            for future in future_to_source:
-                try:
-                    jobs = future.result(timeout=30)  # 30 second timeout per source
-                    
-                    for job in jobs:
-                        if job['id'] not in self.tracked_jobs:
-                            self.tracked_jobs[job['id']] = job
-                            all_new_jobs.append(job)
-                            
-                except Exception as e:
-                    print(f"❌ Source error: {str(e)}")
+        # Check all sources concurrently; Telegram alerts go out as each source finishes
+        with alert_pipeline.AlertBatcher(self.send_instant_telegram_alert, rank=relevance.rank) as alerts:
+            for source, jobs in fetch_engine.iter_sources(self.job_sources, deadline=30):  # Hard 30 second deadline for the whole scan
+                if isinstance(jobs, Exception):
+                    print(f"❌ Source error: {str(jobs)}")
+                    continue
+                
+                new_jobs = []
+                for job in jobs:
+                    if job['id'] not in self.tracked_jobs:
+                        self.tracked_jobs[job['id']] = job
+                        new_jobs.append(job)
+                alerts.add(new_jobs)
+                all_new_jobs.extend(new_jobs)
         
         if all_new_jobs:
             print(f"\n🎉 FOUND {len(all_new_jobs)} NEW REAL JOBS!")
             
-            # Send instant notifications
-            self.send_instant_telegram_alert(all_new_jobs)
+            # The detailed email stays a once-per-scan digest
             self.send_detailed_email(all_new_jobs)
             
             # Save to file
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Relevance Scoring
+A scan's new jobs scored together in one NumPy pass - TF-IDF weighted profile terms over
+title, description and tags, plus recency and whether a salary is given - so each alert
+lists its best matches first
+"""
+
+import time
+import datetime
+import itertools
+import threading
+from email.utils import parsedate_to_datetime
+
+import numpy as np
+
+import keyword_matcher
+import filter_profiles
+
+# Profile in filter_profiles.json whose groups are the scored terms
+SCORING_PROFILE = 'relevance'
+
+# A term in the title says more about the job than the same term in the description
+FIELD_WEIGHTS = {'title': 3.0, 'tags': 2.0, 'description': 1.0}
+GROUP_WEIGHTS = {'testing': 1.0, 'experience': 0.5}
+
+SCORED_FIELDS = ('title', 'description', 'tags')
+SEPARATOR = filter_profiles.FIELD_SEPARATOR
+ASCII_WORD = np.array([chr(code).isalnum() or chr(code) == '_' for code in range(128)], dtype=bool)
+
+# Share of the 0-10 score each signal contributes
+TERMS_WEIGHT = 0.7
+RECENCY_WEIGHT = 0.2
+SALARY_WEIGHT = 0.1
+
+# TF-IDF mass at which the term signal reaches ~63% of its ceiling
+TERMS_SCALE = 6.0
+
+# Age at which a job's recency signal has halved
+RECENCY_HALF_LIFE_HOURS = 24.0
+
+# Job fields saying when it was posted, most precise first
+TIME_FIELDS = ('epoch', 'published', 'posted', 'date_found')
+
+# Placeholders the monitors fill in when a board gives no salary
+NO_SALARY = {'', 'n/a', 'competitive', 'see posting', 'not specified', 'not disclosed', 'none'}
+
+
+def job_fields(job):
+    """The scored text of a job, whichever monitor built it"""
+    return {
+        'title': job.get('title') or job.get('position') or '',
+        'description': job.get('description') or job.get('snippet') or job.get('summary') or '',
+        'tags': job.get('tags') or [],
+    }
+
+
+def posted_at(job):
+    """Unix time the job was posted, or NaN when none of TIME_FIELDS can be read"""
+    for field in TIME_FIELDS:
+        value = job.get(field)
+        if not value:
+            continue
+        if isinstance(value, (int, float)):
+            return float(value)
+        value = str(value).strip()
+        try:
+            moment = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            try:
+                moment = parsedate_to_datetime(value)
+            except (TypeError, ValueError, IndexError):
+                continue
+        # Naive times are the monitors' own datetime.now() stamps, i.e. local time
+        return moment.timestamp()
+    return float('nan')
+
+
+def _lowered(value):
+    if isinstance(value, (list, tuple, set)):
+        value = ' '.join(str(item) for item in value)
+    return str(value or '').lower()
+
+
+def _word_chars(text):
+    """Boolean array: is text[i] a letter, digit or underscore"""
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    word = np.zeros(len(codes), dtype=bool)
+    ascii_chars = codes < 128
+    word[ascii_chars] = ASCII_WORD[codes[ascii_chars]]
+    others = np.unique(codes[~ascii_chars])
+    if len(others):
+        lookup = np.array([chr(code).isalnum() for code in others], dtype=bool)
+        word[~ascii_chars] = lookup[np.searchsorted(others, codes[~ascii_chars])]
+    return word
+
+
+def has_salary(job):
+    salary = str(job.get('salary') or '').strip().lower()
+    return salary not in NO_SALARY and any(char.isdigit() for char in salary)
+
+
+class RelevanceScorer:
+    """Scores batches of jobs against one profile's terms"""
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.columns = {}
+        for group, keywords in profile.keywords.items():
+            for keyword in keywords:
+                self.columns.setdefault((group, keyword), len(self.columns))
+        groups = [group for group, keyword in self.columns]
+        self.term_weights = np.array([GROUP_WEIGHTS.get(group, 1.0) for group in groups])
+        self.field_weights = np.array([FIELD_WEIGHTS[field] for field in SCORED_FIELDS])
+
+        # Per column: the scored fields it counts in, and its word-boundary rules
+        self.in_field = np.array([[field in profile.groups[group]['fields'] for field in SCORED_FIELDS]
+                                  for group in groups], dtype=bool).reshape(len(groups), len(SCORED_FIELDS))
+        self.whole_words = np.array([profile.groups[group]['whole_words'] for group in groups], dtype=bool)
+        self.open_ended = np.array([column in profile.open_ended for column in self.columns], dtype=bool)
+
+        # The matcher numbers the keywords, so a batch's hits come back as integers
+        self._matcher = keyword_matcher.KeywordMatcher({'terms': [keyword for group, keyword in self.columns]})
+        self.keywords = self._matcher.keywords
+        self.keyword_lengths = np.array([len(keyword) for keyword in self.keywords], dtype=np.int64)
+        columns_of = [[] for keyword in self.keywords]
+        number = {keyword: i for i, keyword in enumerate(self.keywords)}
+        for (group, keyword), column in self.columns.items():
+            columns_of[number[keyword]].append(column)
+        self.column_counts = np.array([len(columns) for columns in columns_of], dtype=np.int64)
+        self.column_starts = np.concatenate(([0], np.cumsum(self.column_counts)[:-1]))
+        self.keyword_columns = np.array([column for columns in columns_of for column in columns], dtype=np.int64)
+
+    def term_counts(self, jobs):
+        """Field-weighted occurrences, one row per job and one column per term"""
+        # Every scored field of every job in one text; the separator keeps hits inside their field
+        segments = []
+        for job in jobs:
+            fields = job_fields(job)
+            segments.extend(_lowered(fields[field]) for field in SCORED_FIELDS)
+        text = SEPARATOR.join(segments)
+        segment_starts = np.cumsum([0] + [len(segment) + len(SEPARATOR) for segment in segments[:-1]])
+
+        found = np.fromiter(itertools.chain.from_iterable(self._matcher.occurrences(text)), dtype=np.int64).reshape(-1, 2)
+        keyword = found[:, 1]
+        ends = found[:, 0] + 1
+        starts = ends - self.keyword_lengths[keyword]
+        segment = np.searchsorted(segment_starts, starts, side='right') - 1
+        row, field = np.divmod(segment, len(SCORED_FIELDS))
+
+        # Same word boundaries as the profile, checked for every hit at once
+        word = _word_chars(text)
+        left_clear = (starts == 0) | ~word[np.maximum(starts - 1, 0)]
+        right_clear = (ends == len(text)) | ~word[np.minimum(ends, len(text) - 1)]
+
+        # A keyword shared by several groups counts once in each of their columns
+        repeats = self.column_counts[keyword]
+        hit = np.repeat(np.arange(len(keyword)), repeats)
+        offset = np.arange(len(hit)) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        column = self.keyword_columns[self.column_starts[keyword[hit]] + offset]
+        counts = self.in_field[column, field[hit]] & (
+            ~self.whole_words[column] | (left_clear[hit] & (self.open_ended[column] | right_clear[hit])))
+        return self._bincount(len(jobs), row[hit][counts], column[counts], self.field_weights[field[hit][counts]])
+
+    def _bincount(self, rows, row, column, weights):
+        width = len(self.columns)
+        cells = np.asarray(row, dtype=np.int64) * width + np.asarray(column, dtype=np.int64)
+        counts = np.bincount(cells, weights=np.asarray(weights, dtype=float), minlength=rows * width)
+        return counts.reshape(rows, width)
+
+    def scores(self, jobs, now=None):
+        """0-10 relevance of every job, computed for the batch at once"""
+        if not jobs:
+            return np.zeros(0)
+        now = time.time() if now is None else now
+
+        # Terms every candidate shares (the "qa" in a QA feed) tell them apart less than rare ones
+        counts = self.term_counts(jobs)
+        document_frequency = np.count_nonzero(counts, axis=0)
+        idf = np.log((1 + len(jobs)) / (1 + document_frequency)) + 1
+        terms = 1 - np.exp(-(np.log1p(counts) @ (idf * self.term_weights)) / TERMS_SCALE)
+
+        ages = (now - np.array([posted_at(job) for job in jobs])) / 3600
+        recency = np.where(np.isnan(ages), 0.5, np.exp2(-np.clip(ages, 0, None) / RECENCY_HALF_LIFE_HOURS))
+
+        salary = np.array([has_salary(job) for job in jobs], dtype=float)
+        return 10 * (TERMS_WEIGHT * terms + RECENCY_WEIGHT * recency + SALARY_WEIGHT * salary)
+
+
+_scorer = None
+_scorer_lock = threading.Lock()
+
+
+def get_scorer():
+    """Process-wide scorer over the shared relevance profile, built on first use"""
+    global _scorer
+    if _scorer is None:
+        with _scorer_lock:
+            if _scorer is None:
+                _scorer = RelevanceScorer(filter_profiles.profile(SCORING_PROFILE))
+    return _scorer
+
+
+def rank(jobs, now=None):
+    """Jobs best first, each with its relevance_score (0-10) filled in"""
+    jobs = list(jobs)
+    scores = get_scorer().scores(jobs, now)
+    for job, score in zip(jobs, scores):
+        job['relevance_score'] = round(float(score), 1)
+    # Stable, so equally relevant jobs keep the order they were found in
+    return [jobs[i] for i in np.argsort(-scores, kind='stable')]
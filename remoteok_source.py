@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+RemoteOK Source
+Fetch the full RemoteOK feed once per cycle and answer tag/search views from memory
+"""
+
+import re
+import time
+import threading
+import logging
+
+import http_client
+
+FEED_URL = "https://remoteok.io/api"
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json'
+}
+
+
+def normalize_tag(tag):
+    """'Quality Assurance', 'quality-assurance' and 'quality_assurance' are the same tag"""
+    return re.sub(r'[\s_\-+]+', ' ', str(tag).strip().lower())
+
+
+class RemoteOKFeed:
+    """In-memory snapshot of the RemoteOK feed, indexed by tag"""
+
+    # Scan loops run every 10-30 seconds; one download serves every view within a cycle
+    MAX_AGE_SECONDS = 10
+
+    def __init__(self, max_age=None, timeout=15):
+        self.max_age = self.MAX_AGE_SECONDS if max_age is None else max_age
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._jobs = []
+        self._by_tag = {}
+        self._fetched_at = 0
+        self.fetch_count = 0
+
+    def refresh(self, force=False):
+        """Download the feed unless the snapshot is still fresh"""
+        with self._lock:
+            if not force and self._fetched_at and time.time() - self._fetched_at < self.max_age:
+                return
+            # Stamp before fetching so a failing feed is retried once per cycle, not once per view
+            self._fetched_at = time.time()
+            self.fetch_count += 1
+            response = http_client.get(FEED_URL, headers=HEADERS, timeout=self.timeout, conditional=True)
+
+            if response.status_code == 304:
+                return  # Unchanged; keep the current snapshot
+            if response.status_code != 200:
+                logging.warning(f"RemoteOK feed status {response.status_code}")
+                return
+            self._index(response.json())
+
+    def _index(self, data):
+        # First element of the feed is the legal notice
+        jobs = [job for job in data if isinstance(job, dict) and job.get('id')]
+        by_tag = {}
+        for job in jobs:
+            for tag in job.get('tags') or []:
+                by_tag.setdefault(normalize_tag(tag), []).append(job)
+        self._jobs = jobs
+        self._by_tag = by_tag
+
+    def jobs(self):
+        """Every job in the current snapshot, newest first"""
+        self.refresh()
+        return list(self._jobs)
+
+    def by_tag(self, tag):
+        """Same jobs /api?tag=<tag> returns, taken from the snapshot"""
+        self.refresh()
+        return list(self._by_tag.get(normalize_tag(tag), []))
+
+    def search(self, query):
+        """Same jobs /api?search=<query> returns: every word appears in the position, tags, company or description"""
+        self.refresh()
+        words = normalize_tag(query).split()
+        matches = []
+        for job in self._jobs:
+            text = ' '.join([
+                str(job.get('position', '')),
+                ' '.join(str(tag) for tag in job.get('tags') or []),
+                str(job.get('company', '')),
+                str(job.get('description', ''))
+            ]).lower()
+            if all(word in text for word in words):
+                matches.append(job)
+        return matches
+
+
+_feed = None
+_feed_lock = threading.Lock()
+
+
+def get_feed():
+    """Process-wide RemoteOK snapshot shared by every scan method, so every tag view comes from one download"""
+    global _feed
+    if _feed is None:
+        with _feed_lock:
+            if _feed is None:
+                _feed = RemoteOKFeed()
+    return _feed
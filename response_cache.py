@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+HTTP Response Cache
+Job board responses stored on disk for a short per-source TTL, shared by every monitor process
+and replayed without the network in --offline mode
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import hashlib
+import logging
+import tempfile
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+CACHE_DIR = os.environ.get('JOB_MONITOR_CACHE_DIR', '.http_cache')
+
+# `python <monitor>.py --offline` replays recorded responses instead of touching the network
+OFFLINE = '--offline' in sys.argv or os.environ.get('JOB_MONITOR_OFFLINE') == '1'
+
+# Seconds a response may be reused, by host suffix. Hosts not listed (Telegram, Gemini) are never cached.
+SOURCE_TTLS = {
+    'remoteok.io': 30,
+    'indeed.com': 60,
+    'reed.co.uk': 60,
+    'jooble.org': 60,
+    'weworkremotely.com': 120,
+    'stackoverflow.com': 120,
+}
+
+# Entries untouched for this long are deleted when the cache is opened
+MAX_ENTRY_AGE = 7 * 24 * 3600
+
+# Only these headers are replayed; the body is stored already decoded
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Date')
+
+
+class OfflineMiss(requests.ConnectionError):
+    """No recorded response for a request made in --offline mode"""
+
+
+def ttl_for(url):
+    host = (urlsplit(url).hostname or '').lower()
+    for suffix, ttl in SOURCE_TTLS.items():
+        if host == suffix or host.endswith('.' + suffix):
+            return ttl
+    return 0
+
+
+def request_key(method, url, params=None, data=None, json_body=None):
+    """sha256 of method + full URL + body"""
+    if params:
+        url = requests.Request('GET', url, params=params).prepare().url
+    if json_body is not None:
+        body = json.dumps(json_body, sort_keys=True)
+    elif isinstance(data, dict):
+        body = json.dumps(data, sort_keys=True)
+    else:
+        body = data or ''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    return hashlib.sha256(method.upper().encode('utf-8') + b'\n' + url.encode('utf-8') + b'\n' + body).hexdigest()
+
+
+def not_modified_response(url):
+    response = requests.Response()
+    response.status_code = 304
+    response._content = b''
+    response.url = url
+    response.from_cache = True
+    return response
+
+
+class ResponseCache:
+    """One zlib-compressed file per request: a JSON header line followed by the body"""
+
+    def __init__(self, directory=CACHE_DIR, offline=OFFLINE):
+        self.directory = directory
+        self.offline = offline
+        self._lock = threading.Lock()
+        # Entry timestamps already handed to this process, so a repeat conditional GET becomes a 304
+        self._served = {}
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        if not offline:
+            self.prune()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.z")
+
+    def load(self, key, url, ttl):
+        """Cached response for this key if it is younger than ttl (any age when offline), else None"""
+        path = self._path(key)
+        try:
+            stored_at = os.path.getmtime(path)
+            if not self.offline and time.time() - stored_at >= ttl:
+                return None
+            with open(path, 'rb') as f:
+                raw = zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            return None
+
+        header, _, content = raw.partition(b'\n')
+        try:
+            header = json.loads(header)
+            status, headers = header['status'], CaseInsensitiveDict(header['headers'])
+        except (ValueError, KeyError, TypeError):
+            # Corrupt entry: a miss, and the next 200 overwrites it
+            return None
+        response = requests.Response()
+        response.status_code = status
+        response.headers = headers
+        response._content = content
+        response.url = url
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        response.stored_at = stored_at
+        return response
+
+    def store(self, key, response):
+        header = {
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers}
+        }
+        raw = json.dumps(header).encode('utf-8') + b'\n' + response.content
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(raw, 6))
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logging.debug(f"Response cache write failed: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self.mark_served(key, os.path.getmtime(self._path(key)))
+
+    def touch(self, key):
+        """The server confirmed the body is unchanged; restart its TTL"""
+        try:
+            os.utime(self._path(key))
+            self.mark_served(key, os.path.getmtime(self._path(key)))
+        except OSError:
+            pass
+
+    def mark_served(self, key, stored_at):
+        with self._lock:
+            self._served[key] = stored_at
+
+    def already_served(self, key, response):
+        with self._lock:
+            return self._served.get(key) == response.stored_at
+
+    def prune(self, max_age=MAX_ENTRY_AGE):
+        cutoff = time.time() - max_age
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Process-wide response cache, opened on first use"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+                if _cache.offline:
+                    logging.info(f"📼 Offline mode: replaying recorded responses from {_cache.directory}")
+    return _cache
+
+
+def set_cache(cache):
+    """Swap the process-wide cache (tests, benchmarks)"""
+    global _cache
+    with _cache_lock:
+        _cache = cache
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Scan Deadlines
+A hard wall-clock limit for one scan, visible to every request the scan's sources make,
+so a source that overruns is cut off at the network instead of hanging a worker
+"""
+
+import time
+import contextvars
+from contextlib import contextmanager
+
+import requests
+
+# Body chunk size when a download has to watch the clock
+CHUNK_SIZE = 64 * 1024
+
+_deadline = contextvars.ContextVar('scan_deadline', default=None)
+
+
+class DeadlineExceeded(requests.Timeout):
+    """The scan this request belongs to is out of time"""
+
+
+@contextmanager
+def bounded(seconds):
+    """Everything run inside (and every fetch it hands to the engine) must finish within `seconds`"""
+    token = _deadline.set(None if seconds is None else time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining():
+    """Seconds left in the current scan, or None outside a scan"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check(what='request'):
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded(f"Scan deadline passed before {what}")
+
+
+def cap_timeout(timeout):
+    """Shrink a (connect, read) timeout pair to the time left in the scan"""
+    left = remaining()
+    if left is None:
+        return timeout
+    left = max(left, 0.01)
+    return (min(timeout[0], left), min(timeout[1], left))
+
+
+def read_body(response):
+    """Download a streamed body in chunks, giving up once the scan is out of time"""
+    chunks = []
+    try:
+        for chunk in response.iter_content(CHUNK_SIZE):
+            chunks.append(chunk)
+            check(f"finishing {response.url}")
+    except DeadlineExceeded:
+        response.close()
+        raise
+    response._content = b''.join(chunks)
+    response._content_consumed = True
+    return response
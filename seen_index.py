@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Seen-ID Index
+Sorted array of 64-bit job-id hashes - about 8 bytes per tracked job, loads straight from disk
+"""
+
+import os
+import heapq
+import struct
+import hashlib
+from array import array
+from bisect import bisect_left
+
+
+def hash_job_id(job_id):
+    """Stable 64-bit digest of a job id"""
+    digest = hashlib.blake2b(str(job_id).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class SeenIndex:
+    """Membership-only set of job ids kept as sorted 64-bit hashes"""
+
+    # New hashes sit in a small set until this many have built up, then get merged in
+    MERGE_THRESHOLD = 4096
+    HEADER = struct.Struct('<Q')
+
+    def __init__(self, hashes=()):
+        self._sorted = array('Q', sorted(set(hashes)))
+        self._recent = set()
+
+    @classmethod
+    def from_ids(cls, job_ids):
+        return cls(hash_job_id(job_id) for job_id in job_ids)
+
+    @classmethod
+    def read(cls, path):
+        """(index, stamp it was saved with), or (None, None) if it is missing or unreadable"""
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(cls.HEADER.size)
+                if len(header) != cls.HEADER.size:
+                    return None, None
+                count = (os.fstat(f.fileno()).st_size - cls.HEADER.size) // 8
+                index = cls()
+                index._sorted.fromfile(f, count)
+        except (OSError, EOFError):
+            return None, None
+        return index, cls.HEADER.unpack(header)[0]
+
+    @classmethod
+    def load(cls, path, stamp):
+        """Load a saved index, or None if it is missing or was written for a different stamp"""
+        index, saved_stamp = cls.read(path)
+        return index if saved_stamp == stamp else None
+
+    def _contains_hash(self, value):
+        if value in self._recent:
+            return True
+        position = bisect_left(self._sorted, value)
+        return position < len(self._sorted) and self._sorted[position] == value
+
+    def __contains__(self, job_id):
+        return self._contains_hash(hash_job_id(job_id))
+
+    def __len__(self):
+        return len(self._sorted) + len(self._recent)
+
+    def add(self, job_id):
+        value = hash_job_id(job_id)
+        if not self._contains_hash(value):
+            self._recent.add(value)
+            if len(self._recent) >= self.MERGE_THRESHOLD:
+                self.merge()
+
+    def update(self, job_ids):
+        for job_id in job_ids:
+            self.add(job_id)
+
+    def merge(self):
+        """Fold recently added hashes into the sorted array"""
+        if self._recent:
+            self._sorted = array('Q', heapq.merge(self._sorted, sorted(self._recent)))
+            self._recent = set()
+
+    def save(self, path, stamp):
+        """Write the index atomically, tagged with a stamp describing the data it covers"""
+        self.merge()
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(self.HEADER.pack(stamp))
+            self._sorted.tofile(f)
+        os.replace(tmp_path, path)
@@ -4,8 +4,6 @@
 Runs as background service - TRUE 24/7 operation
 """
 
-import requests
-import json
 import datetime
 import time
 import os
@@ -13,7 +11,10 @@ import threading
 import logging
 import sys
 from concurrent.futures import ThreadPoolExecutor
-import feedparser
+import http_client
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id
 
 # Service-level logging
 logging.basicConfig(
@@ -42,16 +43,11 @@ class Service24x7Monitor:
         self.send_service_start_alert()
         
     def load_tracked_jobs(self):
-        try:
-            with open(self.jobs_file, 'r', encoding='utf-8') as f:
-                self.tracked_jobs = json.load(f)
-        except:
-            self.tracked_jobs = {}
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
         try:
-            with open(self.jobs_file, 'w', encoding='utf-8') as f:
-                json.dump(self.tracked_jobs, f, indent=2, ensure_ascii=False)
+            self.tracked_jobs.save()
         except Exception as e:
             logging.error(f"Save error: {e}")
     
@@ -89,7 +85,7 @@ class Service24x7Monitor:
                     'disable_web_page_preview': True
                 }
                 
-                response = requests.post(url, data=data, timeout=15)
+                response = http_client.post(url, data=data, timeout=15)
                 if response.status_code == 200:
                     return True
                 else:
@@ -110,7 +106,7 @@ class Service24x7Monitor:
             url = "https://remoteok.io/api?tag=qa"
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
             
-            response = requests.get(url, headers=headers, timeout=5)
+            response = http_client.get(url, headers=headers, timeout=5, conditional=True)
             if response.status_code == 200:
                 data = response.json()
                 
@@ -121,9 +117,8 @@ class Service24x7Monitor:
                     title = str(job.get('position', '')).lower()
                     
                     # Ultra-specific testing filter
-                    testing_keywords = ['qa', 'test', 'quality', 'automation', 'sdet']
-                    if any(keyword in title for keyword in testing_keywords):
-                        job_id = f"service_remoteok_{job.get('id', len(all_jobs))}"
+                    if filter_profiles.profile('testing').matches(title=title):
+                        job_id = make_job_id('service_remoteok', job.get('id'), job.get('url'), job.get('position'), job.get('company'))
                         
                         if job_id not in self.tracked_jobs:
                             salary = 'Competitive'
@@ -148,14 +143,13 @@ class Service24x7Monitor:
         # Ultra-fast Indeed scan
         try:
             feed_url = 'https://www.indeed.com/rss?q=qa+engineer&sort=date'
-            feed = feedparser.parse(feed_url)
+            feed = http_client.fetch_feed(feed_url)
             
             for entry in feed.entries[:5]:  # Top 5
                 title = str(entry.get('title', '')).lower()
                 
-                testing_keywords = ['qa', 'test', 'quality', 'automation', 'sdet']
-                if any(keyword in title for keyword in testing_keywords):
-                    job_id = f"service_indeed_{entry.get('id', len(all_jobs))}"
+                if filter_profiles.profile('testing').matches(title=title):
+                    job_id = make_job_id('service_indeed', entry.get('id'), entry.get('link'), entry.get('title'))
                     
                     if job_id not in self.tracked_jobs:
                         job_entry = {
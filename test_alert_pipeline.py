@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Quick test of streaming alert dispatch
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import alert_pipeline
+from fetch_engine import FetchEngine
+
+
+def test_batches_inside_the_window_are_coalesced():
+    sent = []
+    batcher = alert_pipeline.AlertBatcher(sent.append, window=0.1)
+    batcher.add([{'id': 'a'}])
+    batcher.add([])
+    batcher.add([{'id': 'b'}])
+    time.sleep(0.2)
+    batcher.add([{'id': 'c'}])
+    batcher.flush()
+    assert sent == [[{'id': 'a'}, {'id': 'b'}], [{'id': 'c'}]]
+
+
+def test_fast_source_is_alerted_before_slow_source_finishes():
+    engine = FetchEngine()
+    sent_at = {}
+
+    def fast_source():
+        return [{'id': 'fast'}]
+
+    def slow_source():
+        time.sleep(0.6)
+        return [{'id': 'slow'}]
+
+    def send(jobs):
+        for job in jobs:
+            sent_at[job['id']] = time.time()
+
+    try:
+        started = time.time()
+        with alert_pipeline.AlertBatcher(send, window=0.05) as alerts:
+            order = []
+            for source, jobs in engine.iter_sources([slow_source, fast_source], deadline=5):
+                order.append(source)
+                alerts.add(jobs)
+        assert order == [fast_source, slow_source]
+        assert sent_at['fast'] - started < 0.3
+        assert sent_at['slow'] - started >= 0.6
+    finally:
+        engine.close()
+
+
+if __name__ == "__main__":
+    print("📨 TESTING STREAMING ALERTS")
+    print("=" * 50)
+    test_batches_inside_the_window_are_coalesced()
+    print("✅ Batches inside the window share one alert")
+    test_fast_source_is_alerted_before_slow_source_finishes()
+    print("✅ Fast sources are alerted without waiting for slow ones")
+    print("\n✅ Streaming alert test complete!")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Quick test of per-URL and per-source circuit breakers
+"""
+
+import os
+import sys
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import http_client
+import fetch_engine
+import circuit_breaker
+
+
+class Handler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        Handler.hits += 1
+        status = 404 if self.path.startswith('/jobs/feed') else 200
+        self.send_response(status)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'[]')
+
+    def log_message(self, *args):
+        pass
+
+
+def test_breaker_opens_backs_off_and_recovers():
+    breaker = circuit_breaker.CircuitBreaker('feed', failure_threshold=2, base_cooldown=0.05)
+    breaker.record(False)
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.state == 'open' and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()        # One half-open probe...
+    assert not breaker.allow()    # ...and only one
+    breaker.record(False)
+    assert breaker.state == 'open' and breaker.retry_in() > 0.05  # Cool-down doubled
+
+    time.sleep(0.11)
+    assert breaker.allow()
+    breaker.record(True, 0.2)
+    assert breaker.state == 'closed' and breaker.trips == 0
+    assert breaker.health < 1.0
+
+
+def test_only_job_boards_have_breakers():
+    # Alerts and AI calls are never skipped, however often they fail
+    assert circuit_breaker.for_url('https://api.telegram.org/bot123:SECRET/sendMessage') is None
+    assert circuit_breaker.for_url('https://generativelanguage.googleapis.com/v1/models') is None
+    # Keys further down the path stay out of breaker names and their log lines
+    assert circuit_breaker.url_key('https://jooble.org/api/SECRET') == 'jooble.org/api'
+    assert circuit_breaker.url_key('https://stackoverflow.com/jobs/feed?q=qa') == 'stackoverflow.com/jobs'
+    assert circuit_breaker.for_url('https://uk.indeed.com/jobs?q=qa') is not None
+
+
+def test_dead_url_and_stub_source_are_skipped():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    original = circuit_breaker.source_breakers, circuit_breaker.JOB_BOARDS
+    circuit_breaker.source_breakers = circuit_breaker.BreakerRegistry()
+    # The local test server stands in for a job board
+    circuit_breaker.JOB_BOARDS = original[1] + ('127',)
+    try:
+        # Every query against the dead endpoint shares one breaker
+        Handler.hits = 0
+        for term in ['qa', 'sdet', 'testing']:
+            assert http_client.get(f"{base}/jobs/feed?q={term}", timeout=5).status_code == 404
+        try:
+            http_client.get(f"{base}/jobs/feed?q=automation", timeout=5)
+            assert False, "open circuit still reached the network"
+        except circuit_breaker.CircuitOpen:
+            pass
+        assert Handler.hits == 3
+
+        def stub_source():
+            return []
+
+        def live_source():
+            # Fetches made through the engine's io threads still count for this source
+            fetch_engine.fetch_all([(f"{base}/api", {'timeout': 5})])
+            return []
+
+        for scan in range(3):
+            fetch_engine.run_sources([stub_source, live_source], deadline=5)
+        assert circuit_breaker.source_breakers.get(circuit_breaker.source_name(stub_source)).state == 'open'
+        assert circuit_breaker.source_breakers.get(circuit_breaker.source_name(live_source)).state == 'closed'
+
+        hits = Handler.hits
+        assert fetch_engine.run_sources([stub_source], deadline=5) == [(stub_source, [])]
+        assert Handler.hits == hits
+    finally:
+        circuit_breaker.source_breakers, circuit_breaker.JOB_BOARDS = original
+        server.shutdown()
+        http_client.close()
+
+
+if __name__ == "__main__":
+    print("🔴 TESTING CIRCUIT BREAKERS")
+    print("=" * 50)
+    test_breaker_opens_backs_off_and_recovers()
+    print("✅ Breaker opens, backs off and recovers")
+    test_only_job_boards_have_breakers()
+    print("✅ Only job boards have breakers")
+    test_dead_url_and_stub_source_are_skipped()
+    print("✅ Dead URLs and stub sources are skipped")
+    print("\n✅ Circuit breaker test complete!")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Quick test of the streaming feed reader
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import feed_stream
+
+ITEM = '''<item><title>QA Engineer {n}</title><link>https://weworkremotely.com/jobs/{n}</link>
+<guid>https://weworkremotely.com/jobs/{n}</guid><pubDate>Mon, 04 Mar 2024 10:{n:02d}:00 +0000</pubDate>
+<dc:creator>Acme</dc:creator><description>&lt;p&gt;3+ years Selenium&lt;/p&gt;</description></item>'''
+
+
+def rss(ids, tail=''):
+    items = ''.join(ITEM.format(n=n) for n in ids)
+    return (f'<?xml version="1.0"?><rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+            f'<channel><title>WWR</title>{items}{tail}</channel></rss>').encode()
+
+
+def test_rss_entries_carry_the_fields_monitors_read():
+    feed = feed_stream.read_feed(rss([5, 4]))
+    entry = feed.entries[0]
+    assert entry.title == 'QA Engineer 5' and entry.link == 'https://weworkremotely.com/jobs/5'
+    assert entry.get('id') == 'https://weworkremotely.com/jobs/5'
+    assert entry.get('author') == 'Acme'
+    assert entry.summary == '<p>3+ years Selenium</p>'
+    assert tuple(entry.published_parsed)[:6] == (2024, 3, 4, 10, 5, 0)
+    assert feed.bozo == 0
+
+
+class TrackedBytes(bytes):
+    """Bytes that remember how far into them anyone has sliced"""
+    read_to = 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            TrackedBytes.read_to = max(TrackedBytes.read_to, min(index.stop, len(self)))
+        return bytes.__getitem__(self, index)
+
+
+def test_reading_stops_before_the_rest_of_the_feed_is_parsed():
+    page = TrackedBytes(rss(range(59, 49, -1), tail=''.join(ITEM.format(n=n) for n in range(49, 0, -1)) * 10))
+    seen = {f'https://weworkremotely.com/jobs/{n}' for n in range(50, 56)}
+
+    TrackedBytes.read_to = 0
+    feed = feed_stream.read_feed(page, seen_ids=seen, stop_after_seen=3)
+    assert [entry.title for entry in feed.entries][:4] == ['QA Engineer 59', 'QA Engineer 58', 'QA Engineer 57', 'QA Engineer 56']
+    assert len(feed.entries) == 7 and feed.bozo == 0
+    assert TrackedBytes.read_to <= feed_stream.CHUNK_SIZE < len(page) / 5
+
+    feed = feed_stream.read_feed(page, limit=2)
+    assert len(feed.entries) == 2
+
+
+def test_atom_entries():
+    page = b'''<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Jobs</title>
+      <entry><title>SDET</title><id>tag:jobs,1</id><link rel="alternate" href="https://example.com/1"/>
+      <updated>2024-03-04T10:00:00Z</updated><summary>Cypress</summary><author><name>Beta</name></author></entry>
+    </feed>'''
+    entry = feed_stream.read_feed(page).entries[0]
+    assert (entry.title, entry.link, entry.get('id'), entry.get('author'), entry.summary) == \
+        ('SDET', 'https://example.com/1', 'tag:jobs,1', 'Beta', 'Cypress')
+    assert tuple(entry.updated_parsed)[:4] == (2024, 3, 4, 10)
+
+
+def test_malformed_feeds_fall_back_to_feedparser():
+    page = b'<rss><channel><item><title>Tester &amp Analyst</title><link>https://example.com/2</link></item></channel></rss>'
+    feed = feed_stream.read_feed(page)
+    assert feed.bozo == 1
+    assert feed.entries[0].link == 'https://example.com/2'
+    assert set(feed.entries[0]) <= set(feed_stream.ENTRY_FIELDS)
+
+
+if __name__ == "__main__":
+    print("📰 TESTING STREAMING FEED READER")
+    print("=" * 50)
+    test_rss_entries_carry_the_fields_monitors_read()
+    print("✅ RSS entries carry the fields monitors read")
+    test_reading_stops_before_the_rest_of_the_feed_is_parsed()
+    print("✅ Reading stops before the rest of the feed is parsed")
+    test_atom_entries()
+    print("✅ Atom entries are read")
+    test_malformed_feeds_fall_back_to_feedparser()
+    print("✅ Malformed feeds fall back to feedparser")
+    print("\n✅ Streaming feed reader test complete!")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Quick test of the async fetch engine against a local slow server
+"""
+
+import os
+import sys
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+import http_client
+import scan_deadline
+from fetch_engine import FetchEngine
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(2 if self.path == '/hang' else 0.3)
+        body = self.path.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_requests_overlap_within_host_limit():
+    server, base = start_server()
+    engine = FetchEngine(max_concurrency=16, max_per_host=4)
+    try:
+        started = time.time()
+        results = engine.fetch_all([(f"{base}/job/{n}", {'timeout': 5}) for n in range(8)])
+        elapsed = time.time() - started
+
+        assert [response.text for response in results] == [f"/job/{n}" for n in range(8)]
+        # Two waves of four instead of eight sequential requests
+        assert elapsed < 1.5
+    finally:
+        engine.close()
+        server.shutdown()
+
+
+def test_sources_run_side_by_side_and_errors_are_returned():
+    engine = FetchEngine()
+
+    def slow_source():
+        time.sleep(0.3)
+        return ['job']
+
+    def broken_source():
+        raise ValueError("boom")
+
+    try:
+        started = time.time()
+        results = engine.run_sources([slow_source, slow_source, broken_source])
+        assert time.time() - started < 0.6
+        assert results[0] == (slow_source, ['job'])
+        assert isinstance(results[2][1], ValueError)
+    finally:
+        engine.close()
+
+
+def test_deadline_keeps_finished_sources_and_cuts_off_stragglers():
+    server, base = start_server()
+    engine = FetchEngine()
+    outcome = []
+
+    def quick_source():
+        return ['quick']
+
+    def hung_source():
+        try:
+            http_client.get(f"{base}/hang", timeout=10)
+        except requests.Timeout as e:
+            outcome.append(e)
+        time.sleep(0.5)
+        return ['late']
+
+    try:
+        started = time.time()
+        results = engine.run_sources([quick_source, hung_source], deadline=0.5)
+        assert time.time() - started < 1.0
+        assert results[0] == (quick_source, ['quick'])
+        assert isinstance(results[1][1], scan_deadline.DeadlineExceeded)
+
+        # The straggler's own request was cut off at the deadline, not after its 10s timeout
+        while not outcome and time.time() - started < 1.0:
+            time.sleep(0.02)
+        assert outcome
+    finally:
+        engine.close()
+        server.shutdown()
+        http_client.close()
+
+
+if __name__ == "__main__":
+    print("⚡ TESTING FETCH ENGINE")
+    print("=" * 50)
+    test_requests_overlap_within_host_limit()
+    print("✅ Requests run concurrently within host limits")
+    test_sources_run_side_by_side_and_errors_are_returned()
+    print("✅ Sources run side by side")
+    test_deadline_keeps_finished_sources_and_cuts_off_stragglers()
+    print("✅ Scan deadline keeps finished sources and cuts off stragglers")
+    print("\n✅ Fetch engine test complete!")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Quick test of the declarative filter profiles
+"""
+
+import os
+import sys
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+import keyword_matcher
+import filter_profiles
+
+SPEC = {
+    'keywords': {'testing': ['test*', 'qa', 'quality assurance', 'sdet*']},
+    'profiles': {
+        'qa': {
+            'groups': {
+                'testing': {'role': 'include', 'fields': ['title', 'tags'], 'whole_words': True, 'keywords': 'testing'},
+                'experience': {'role': 'required', 'fields': ['description'], 'whole_words': True, 'keywords': ['2+ year*', 'senior']},
+                'other_roles': {'role': 'exclude', 'fields': ['title'], 'whole_words': True, 'keywords': ['sales', 'hr']},
+            }
+        },
+        'not_junior': {
+            'groups': {
+                'testing': {'keywords': ['qa']},
+                'experience': {'role': 'optional', 'fields': ['description'], 'keywords': ['3 year']},
+                'junior': {'role': 'exclude', 'fields': ['description'], 'unless': 'experience', 'keywords': ['junior']},
+            }
+        },
+    },
+}
+
+
+def write_spec(spec):
+    handle, path = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(handle, 'w') as f:
+        json.dump(spec, f)
+    return path
+
+
+def check_profiles():
+    path = write_spec(SPEC)
+    try:
+        profiles = filter_profiles.load_profiles(path)
+    finally:
+        os.remove(path)
+    qa = profiles['qa']
+
+    assert qa.matches(title='Senior QA Engineer', description='You have 2+ years of Cypress')
+    # Word boundaries: "latest" isn't "test", "aqua" isn't "qa", "three" isn't "hr"
+    assert not qa.matches(title='Latest Aqua Engineer', description='2+ years')
+    assert qa.matches(title='Test Lead for three teams', description='2+ years')
+    # A trailing * leaves the end open: "testing", "tester"
+    assert qa.matches(title='Software Tester', description='senior role')
+    # Field scoping: testing words in the description and experience in the title don't count
+    assert not qa.matches(title='Backend Developer', description='we test a lot, 2+ years')
+    assert not qa.matches(title='QA Engineer 2+ years', description='')
+    assert qa.matches(title='Engineer', tags=['python', 'qa'], description='senior')
+    assert not qa.matches(title='QA Sales Lead', description='senior')
+    assert qa.explain(title='SDET / QA', description='Senior, 2+ years') == \
+        {'testing': ['qa', 'sdet'], 'experience': ['2+ year', 'senior']}
+
+    not_junior = profiles['not_junior']
+    assert not_junior.matches(title='QA Analyst', description='mid role')
+    assert not not_junior.matches(title='QA Analyst', description='junior role')
+    assert not_junior.matches(title='QA Analyst', description='junior or 3 years')
+    # Nothing matches across two fields
+    assert not not_junior.matches(title='Q', company='A')
+
+    with pytest.raises(TypeError):
+        qa.matches(titel='QA')
+
+
+def test_profiles_with_automaton():
+    assert keyword_matcher.ahocorasick is not None, "pyahocorasick is listed in requirements.txt"
+    check_profiles()
+
+
+def test_profiles_without_pyahocorasick():
+    original = keyword_matcher.ahocorasick
+    keyword_matcher.ahocorasick = None
+    try:
+        check_profiles()
+    finally:
+        keyword_matcher.ahocorasick = original
+
+
+def test_bad_profiles_fail_at_load():
+    for group in ({'role': 'maybe', 'keywords': ['qa']},
+                  {'fields': ['salary'], 'keywords': ['qa']},
+                  {'keywords': 'missing_list'},
+                  {'role': 'exclude', 'unless': 'nobody', 'keywords': ['hr']},
+                  {'keywords': []}):
+        path = write_spec({'profiles': {'broken': {'groups': {'group': group}}}})
+        try:
+            with pytest.raises(ValueError):
+                filter_profiles.load_profiles(path)
+        finally:
+            os.remove(path)
+
+
+def test_shipped_profiles_load():
+    profiles = filter_profiles.load_profiles()
+    assert profiles['testing_2_plus_years'].matches(title='QA Automation Engineer', description='3+ years of Selenium')
+    assert not profiles['testing_2_plus_years'].matches(title='QA Automation Engineer', description='Selenium')
+    # job_monitor only takes an explicit 2-6 year range
+    assert profiles['testing_2_to_6_years'].matches(title='QA Engineer', description='3 to 5 years of Selenium')
+    assert not profiles['testing_2_to_6_years'].matches(title='QA Engineer', description='Senior, 7 years')
+    # Jooble snippets are short: any mention of experience will do
+    assert profiles['testing_2_plus_or_experience'].matches(title='QA Engineer', description='Cypress experience')
+    assert not profiles['testing_2_plus_years'].matches(title='QA Engineer', description='Cypress experience')
+    assert profiles['2_plus_years'].matches(description='senior role')
+    assert profiles['testing_roles'].matches(title='SDET', description='Work with our sales team')
+    assert not profiles['testing_roles'].matches(title='Sales Engineer, Test Equipment', description='')
+
+
+if __name__ == "__main__":
+    print("🎯 TESTING FILTER PROFILES")
+    print("=" * 50)
+    test_profiles_with_automaton()
+    print("✅ Groups, word boundaries and field scopes decide in one pass")
+    test_profiles_without_pyahocorasick()
+    print("✅ Same answers without pyahocorasick")
+    test_bad_profiles_fail_at_load()
+    print("✅ Bad profiles fail when loaded")
+    test_shipped_profiles_load()
+    print("✅ Shipped filter_profiles.json loads")
+    print("\n✅ Filter profiles test complete!")
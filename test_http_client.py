@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Quick test of the shared HTTP client
+"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import http_client
+
+
+def test_timeouts_are_split():
+    assert http_client.split_timeout(15) == (http_client.CONNECT_TIMEOUT, 15)
+    assert http_client.split_timeout(3) == (3, 3)
+    assert http_client.split_timeout((2, 30)) == (2, 30)
+    assert http_client.split_timeout(None) == (http_client.CONNECT_TIMEOUT, http_client.DEFAULT_READ_TIMEOUT)
+
+
+def test_session_is_shared_and_pooled():
+    session = http_client.get_session()
+    assert http_client.get_session() is session
+
+    adapter = session.get_adapter('https://remoteok.io/api')
+    assert adapter is session.get_adapter('https://api.telegram.org/')
+    assert adapter._pool_maxsize == http_client.POOL_MAXSIZE
+    http_client.close()
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    feed = b"<rss><channel><item><title>QA Engineer</title><link>https://example.com/1</link></item></channel></rss>"
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('Content-Length', str(len(self.feed)))
+        self.end_headers()
+        self.wfile.write(self.feed)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_unchanged_feed_is_not_parsed_again():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/feed.rss"
+    try:
+        http_client.validators.clear()
+        first = http_client.fetch_feed(url, timeout=5)
+        assert len(first.entries) == 1
+
+        not_modified = http_client.validators.not_modified
+        second = http_client.fetch_feed(url, timeout=5)
+        assert second.status == 304 and second.entries == []
+        assert http_client.validators.not_modified == not_modified + 1
+
+        # Plain GETs never send validators
+        assert http_client.get(url, timeout=5).status_code == 200
+    finally:
+        server.shutdown()
+        http_client.close()
+
+
+if __name__ == "__main__":
+    print("🌐 TESTING SHARED HTTP CLIENT")
+    print("=" * 50)
+    test_timeouts_are_split()
+    print("✅ Connect/read timeouts split")
+    test_session_is_shared_and_pooled()
+    print("✅ One pooled session per process")
+    test_unchanged_feed_is_not_parsed_again()
+    print("✅ Conditional GET skips unchanged feeds")
+    print("\n✅ HTTP client test complete!")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Quick test of lxml Indeed card extraction
+"""
+
+import os
+import sys
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import indeed_cards
+
+CARD = '''
+<li><div class="cardOutline"><div class="job_seen_beacon">
+  <h2 class="jobTitle css-1psdjh5"><a data-jk="{key}" href="/rc/clk?jk={key}"><span title="{title}">{title}</span></a></h2>
+  <span data-testid="company-name">Acme Testing Ltd</span>
+  <div data-testid="text-location">London</div>
+  <div class="css-9446fg"><ul><li>3+ years of Selenium automation experience</li></ul></div>
+</div></div></li>
+'''
+
+
+def results_page(count, filler=200000):
+    """Results page shaped like Indeed's: a big inline script either side of the card list"""
+    script = '<script>window.mosaic = "' + 'x' * filler + '";</script>'
+    cards = ''.join(CARD.format(key=f"abc{n:03d}", title=f"QA Engineer {n}") for n in range(count))
+    return (f'<html><head><title>Jobs</title>{script}</head><body><h1>QA jobs</h1>'
+            f'<ul class="jobsearch-ResultsList">{cards}</ul>{script}</body></html>').encode()
+
+
+def test_modern_cards_are_extracted():
+    cards = indeed_cards.extract_cards(results_page(15), limit=10)
+    assert len(cards) == 10
+    assert cards[0] == {
+        'job_key': 'abc000',
+        'title': 'QA Engineer 0',
+        'company': 'Acme Testing Ltd',
+        'location': 'London',
+        'snippet': '3+ years of Selenium automation experience',
+    }
+
+
+def test_only_the_card_region_is_parsed():
+    page = results_page(3)
+    region = indeed_cards.card_region(page)
+    assert len(region) < len(page) / 4
+    assert region.count(b'data-jk=') == 3
+
+
+def test_non_ascii_cards_keep_the_page_charset():
+    # The <meta charset> is cut off with the head, far above the card region
+    for charset in ('utf-8', 'windows-1252'):
+        head = f'<html><head><meta charset="{charset}"><script>var x = "{"x" * 50000}";</script></head><body>'
+        card = '<div data-jk="de1"><h2 class="jobTitle">Softwaretester für Qualität</h2>' \
+               '<span data-testid="company-name">Müller GmbH</span><div data-testid="text-location">Köln</div></div>'
+        page = (head + card + '</body></html>').encode(charset)
+        cards = indeed_cards.extract_cards(page, domain='de.indeed.com')
+        assert (cards[0]['title'], cards[0]['company'], cards[0]['location']) == \
+            ('Softwaretester für Qualität', 'Müller GmbH', 'Köln'), charset
+    # Pages that declare nothing are read as utf-8, which Indeed serves
+    assert indeed_cards.page_encoding(b'<html><body><div data-jk="x">') == 'utf-8'
+
+
+def test_legacy_cards_fall_back_to_class_selectors():
+    page = b'''<html><body>
+      <div class="result" data-jk="old1"><h2 class="jobTitle">Test Analyst</h2>
+        <span class="companyName">Old Co</span><span class="location">Leeds</span>
+        <div class="summary">2 years manual testing</div></div>
+    </body></html>'''
+    cards = indeed_cards.extract_cards(page)
+    assert [(card['job_key'], card['title'], card['company'], card['location'], card['snippet']) for card in cards] == \
+        [('old1', 'Test Analyst', 'Old Co', 'Leeds', '2 years manual testing')]
+
+
+def test_page_without_cards():
+    page = b'<html><body><h1>Verify you are human</h1></body></html>'
+    assert indeed_cards.extract_cards(page) == []
+    assert indeed_cards.page_headings(page) == ['Verify you are human']
+
+
+def test_selector_cache_learns_each_domain():
+    cache = indeed_cards.selector_cache = indeed_cards.SelectorCache()
+    calls = []
+
+    def counting(paths):
+        return [(label, lambda card, path=path, label=label: calls.append(label) or path(card)) for label, path in paths]
+
+    original = indeed_cards.FIELD_PATHS
+    indeed_cards.FIELD_PATHS = {field: counting(paths) for field, paths in original.items()}
+    try:
+        indeed_cards.extract_cards(results_page(10), domain='uk.indeed.com')
+        calls.clear()
+        indeed_cards.extract_cards(results_page(10), domain='uk.indeed.com')
+        # One evaluation per field per card once the winners are known
+        assert len(calls) == 10 * len(original)
+        assert cache.hit_rate('uk.indeed.com') > 0.9
+
+        # A layout change on one domain is a miss there, then the new winner sticks
+        legacy = b'<div class="result" data-jk="old1"><h2 class="jobTitle">Test Analyst</h2></div>'
+        assert indeed_cards.extract_cards(legacy, domain='uk.indeed.com')[0]['title'] == 'Test Analyst'
+        assert any('uk.indeed.com title: .jobTitle' in line for line in cache.summary())
+        assert cache.hit_rate('de.indeed.com') is None
+    finally:
+        indeed_cards.FIELD_PATHS = original
+        indeed_cards.selector_cache = indeed_cards.SelectorCache()
+
+
+def embedded_page(results):
+    """Results page with the job list in Indeed's inline provider script and no card markup"""
+    data = {'metaData': {'mosaicProviderJobCardsModel': {'results': results}}}
+    return (b'<html><head><script>window.mosaic.providerData["mosaic-provider-jobcards"]='
+            + json.dumps(data).encode() + b';window.mosaic.other={"x": 1};</script></head>'
+            b'<body><h1>QA jobs</h1></body></html>')
+
+
+def test_embedded_json_is_decoded_without_html_parse():
+    page = embedded_page([
+        {'jobkey': 'e1', 'displayTitle': 'Senior QA {Automation} Engineer', 'company': 'Acme',
+         'formattedLocation': 'Remote', 'snippet': '<ul><li>3+ years &amp; Cypress</li><li>API tests</li></ul>',
+         'salarySnippet': {'text': '£50,000 a year'}},
+        {'jobkey': 'e2', 'title': 'Test Analyst', 'company': 'Beta'},
+        {'title': 'No key'},
+    ])
+    jobs = indeed_cards.extract_jobs(page)
+    assert jobs[0] == {'job_key': 'e1', 'title': 'Senior QA {Automation} Engineer', 'company': 'Acme',
+                       'location': 'Remote', 'snippet': '3+ years & Cypress API tests', 'salary': '£50,000 a year'}
+    assert [job['job_key'] for job in jobs] == ['e1', 'e2']
+    assert indeed_cards.extract_jobs(page, limit=1)[0]['job_key'] == 'e1'
+
+
+def test_pages_without_embedded_json_use_the_cards():
+    assert indeed_cards.embedded_jobs(results_page(2)) is None
+    assert [job['job_key'] for job in indeed_cards.extract_jobs(results_page(2))] == ['abc000', 'abc001']
+
+
+if __name__ == "__main__":
+    print("🧩 TESTING INDEED CARD EXTRACTION")
+    print("=" * 50)
+    test_modern_cards_are_extracted()
+    print("✅ Modern job cards are extracted")
+    test_only_the_card_region_is_parsed()
+    print("✅ Only the card region is parsed")
+    test_non_ascii_cards_keep_the_page_charset()
+    print("✅ Non-ASCII cards keep the page's charset")
+    test_legacy_cards_fall_back_to_class_selectors()
+    print("✅ Legacy cards fall back to class selectors")
+    test_page_without_cards()
+    print("✅ Pages without cards come back empty")
+    test_selector_cache_learns_each_domain()
+    print("✅ Selector cache learns each domain")
+    test_embedded_json_is_decoded_without_html_parse()
+    print("✅ Embedded job JSON is decoded without an HTML parse")
+    test_pages_without_embedded_json_use_the_cards()
+    print("✅ Pages without embedded JSON use the job cards")
+    print("\n✅ Indeed card extraction test complete!")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Quick test of the local job classifier
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import job_classifier
+
+QA_TITLES = ['QA Engineer', 'Senior QA Automation Engineer', 'SDET', 'Test Automation Engineer',
+             'Software Tester', 'Quality Assurance Analyst', 'QA Lead', 'Automation Test Engineer']
+OTHER_TITLES = ['Sales Manager', 'Backend Developer', 'Product Designer', 'Account Executive',
+                'Data Analyst', 'Marketing Lead', 'Frontend Developer', 'Office Manager']
+
+
+def history():
+    jobs = []
+    for n in range(5):
+        jobs += [{'title': title, 'description': 'Selenium, Cypress and pytest test automation, 3+ years',
+                  'tags': ['qa', 'testing']} for title in QA_TITLES]
+        jobs += [{'title': title, 'description': 'React, Salesforce, Figma and spreadsheets', 'tags': ['business']}
+                 for title in OTHER_TITLES]
+    return jobs
+
+
+def trained():
+    classifier = job_classifier.JobClassifier()
+    assert classifier.fit(history()) == 80
+    return classifier
+
+
+def test_confident_jobs_are_scored_locally():
+    classifier = trained()
+    asked = []
+    qa = classifier.classify({'title': 'QA Automation Engineer', 'description': 'Cypress and Selenium'}, asked.append)
+    sales = classifier.classify({'title': 'Sales Manager', 'description': 'Salesforce pipeline'}, asked.append)
+    assert not asked
+    assert qa['ai_score'] >= 9 and qa['ai_source'] == 'local'
+    assert sales['ai_score'] <= 2
+    assert classifier.answered == 2 and classifier.asked == 0
+
+
+def test_unsure_jobs_ask_and_the_answer_is_learned():
+    classifier = trained()
+    unsure = {'title': 'Release Coordinator', 'description': 'Plans releases'}
+    assert not classifier.score(unsure)[1]
+
+    def ask(job):
+        job['gemini_analysis'] = {'is_testing_role': True, 'relevance_score': 8}
+        return job
+
+    before = classifier.probability(unsure)
+    job = classifier.classify(dict(unsure), ask)
+    assert job['gemini_analysis']['relevance_score'] == 8 and 'ai_source' not in job
+    assert classifier.asked == 1
+    assert classifier.probability(unsure) > before
+
+
+def test_stored_labels():
+    assert job_classifier.stored_label({'ai_score': 8}) == 1
+    assert job_classifier.stored_label({'ai_score': '3'}) == 0
+    assert job_classifier.stored_label({'ai_score': 5}) is None
+    assert job_classifier.stored_label({'gemini_analysis': {'is_testing_role': False, 'relevance_score': 9}}) == 0
+    # The model's own guesses never become training labels
+    assert job_classifier.stored_label({'ai_score': 9, 'ai_source': 'local'}) is None
+
+
+def test_untrained_classifier_defers_to_gemini():
+    classifier = job_classifier.JobClassifier()
+    asked = []
+    job = classifier.classify({'title': 'QA Engineer'}, lambda job: asked.append(job) or job)
+    assert asked and 'ai_score' not in job
+    # Without Gemini the job goes through unscored, as before
+    assert 'ai_score' not in classifier.classify({'title': 'QA Engineer'})
+    assert job_classifier.train([None, 'junk']).documents.sum() == 0
+
+
+def test_scoring_takes_microseconds():
+    classifier = trained()
+    job = {'title': 'Senior QA Engineer', 'description': 'Selenium, Cypress and pytest; 3+ years. ' * 5,
+           'tags': ['qa', 'automation']}
+    classifier.score(job)
+    started = time.perf_counter()
+    for _ in range(1000):
+        classifier.score(job)
+    elapsed = (time.perf_counter() - started) / 1000
+    print(f"   {elapsed * 1e6:.0f}µs per job")
+    assert elapsed < 0.005
+
+
+if __name__ == "__main__":
+    print("🧠 TESTING JOB CLASSIFIER")
+    print("=" * 50)
+    test_confident_jobs_are_scored_locally()
+    print("✅ Confident jobs are scored locally")
+    test_unsure_jobs_ask_and_the_answer_is_learned()
+    print("✅ Unsure jobs ask Gemini and the answer is learned")
+    test_stored_labels()
+    print("✅ Stored Gemini scores become labels, local guesses don't")
+    test_untrained_classifier_defers_to_gemini()
+    print("✅ Untrained classifier defers to Gemini")
+    test_scoring_takes_microseconds()
+    print("✅ Scoring takes microseconds")
+    print("\n✅ Job classifier test complete!")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Quick test of cross-source near-duplicate detection
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from job_dedup import NearDuplicateIndex, job_fingerprint
+
+
+def make_job(job_id, title, company, location, source):
+    return {'id': job_id, 'title': title, 'company': company, 'location': location, 'source': source}
+
+
+def test_same_posting_on_two_sources_is_collapsed():
+    index = NearDuplicateIndex()
+    jobs = [
+        make_job("remoteok_1", "Senior QA Automation Engineer", "TechCorp Ltd", "London, UK", "RemoteOK"),
+        make_job("jooble_2", "Senior QA Automation Engineer", "TechCorp", "London", "Jooble"),
+        make_job("reed_3", "Manual Test Analyst", "Another Company", "Leeds", "Reed.co.uk"),
+    ]
+    unique = index.collapse(jobs)
+    assert [job['id'] for job in unique] == ["remoteok_1", "reed_3"]
+
+    # Later scans are checked against the indexed history too
+    repost = make_job("reed_4", "Senior QA Automation Engineer", "TechCorp Limited", "London", "Reed.co.uk")
+    assert index.collapse([repost]) == []
+
+
+def test_jobs_without_features_are_never_duplicates():
+    index = NearDuplicateIndex()
+    blank = [make_job(f"blank_{n}", "", None, "", "Jooble") for n in range(3)]
+    assert job_fingerprint(blank[0]) is None
+    assert index.collapse(blank) == blank
+    assert len(index) == 0
+
+
+def test_index_is_bounded():
+    index = NearDuplicateIndex(max_jobs=10)
+    index.seed(make_job(f"job_{n}", f"QA Engineer {n} role {n * 7}", f"Company {n}", "Remote", "Test")
+               for n in range(50))
+    assert len(index) == 10
+    assert sum(len(bucket) for bucket in index._buckets.values()) == 10 * index.bands
+
+
+if __name__ == "__main__":
+    print("🔁 TESTING NEAR-DUPLICATE DETECTION")
+    print("=" * 50)
+    test_same_posting_on_two_sources_is_collapsed()
+    print("✅ Cross-source duplicates collapsed")
+    test_jobs_without_features_are_never_duplicates()
+    print("✅ Jobs without title, company or location are never duplicates")
+    test_index_is_bounded()
+    print("✅ Fingerprint window stays bounded")
+    print("\n✅ Near-duplicate test complete!")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Quick test of deterministic job ids
+"""
+
+import os
+import sys
+import subprocess
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from job_ids import normalize_url, make_job_id
+
+
+def test_tracking_params_are_ignored():
+    clean = normalize_url("https://www.indeed.com/viewjob?jk=abc123")
+    assert normalize_url("HTTPS://Indeed.com/viewjob/?utm_source=rss&jk=abc123&from=feed#apply") == clean
+    assert normalize_url("https://indeed.com/viewjob?jk=zzz999") != clean
+
+
+def test_ids_prefer_native_then_url_then_fields():
+    assert make_job_id('reed', 54321, "https://www.reed.co.uk/jobs/1") == "reed_54321"
+    assert make_job_id('jooble', None, "https://jooble.org/desc/1?ckey=qa") == \
+        make_job_id('jooble', '', "https://jooble.org/desc/1?ckey=qa&utm_campaign=x")
+    assert make_job_id('indeed_uk', None, None, "QA Engineer", "Acme") == \
+        make_job_id('indeed_uk', None, None, "qa engineer ", "ACME")
+
+
+def test_ids_are_stable_across_processes():
+    code = "from job_ids import make_job_id; print(make_job_id('so', None, 'https://stackoverflow.com/jobs/42'))"
+    directory = os.path.dirname(os.path.abspath(__file__))
+    outputs = {
+        subprocess.run([sys.executable, '-c', code], cwd=directory, capture_output=True, text=True).stdout
+        for _ in range(2)
+    }
+    assert len(outputs) == 1
+
+
+if __name__ == "__main__":
+    print("🆔 TESTING JOB IDS")
+    print("=" * 50)
+    test_tracking_params_are_ignored()
+    print("✅ Tracking parameters stripped")
+    test_ids_prefer_native_then_url_then_fields()
+    print("✅ Id fallbacks work")
+    test_ids_are_stable_across_processes()
+    print("✅ Ids stable across processes")
+    print("\n✅ Job id test complete!")
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Quick test of the SQLite tracked-job store
+"""
+
+import os
+import sys
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from job_store import open_job_store, store_path_for, JournalJobStore
+from seen_index import SeenIndex
+
+
+def make_legacy_file(directory):
+    path = os.path.join(directory, "demo_jobs.json")
+    jobs = {
+        "101": {'id': "101", 'title': "QA Engineer", 'source': "RemoteOK"},
+        "reed_202": {'id': "reed_202", 'title': "Test Analyst", 'source': "Reed.co.uk"}
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(jobs, f)
+    return path
+
+
+def test_legacy_import_and_lookup():
+    with tempfile.TemporaryDirectory() as directory:
+        store = open_job_store(make_legacy_file(directory))
+
+        assert len(store) == 2
+        assert "101" in store
+        assert store["reed_202"]['title'] == "Test Analyst"
+        assert os.path.exists(store_path_for(os.path.join(directory, "demo_jobs.json")))
+        store.close()
+
+
+def test_corrupt_legacy_file_starts_empty():
+    with tempfile.TemporaryDirectory() as directory:
+        legacy = os.path.join(directory, "broken_jobs.json")
+        with open(legacy, 'w', encoding='utf-8') as f:
+            f.write('{"101": {"title": "QA Eng')
+        for backend in ('sqlite', 'journal'):
+            store = open_job_store(legacy, backend=backend)
+            assert len(store) == 0
+            store["303"] = {'id': "303"}
+            assert store.save() == 1
+            store.close()
+
+
+def test_save_only_writes_new_jobs():
+    with tempfile.TemporaryDirectory() as directory:
+        legacy = make_legacy_file(directory)
+        store = open_job_store(legacy)
+
+        store["303"] = {'id': "303", 'title': "SDET", 'source': "Jooble"}
+        store["101"] = {'id': "101", 'title': "Duplicate", 'source': "RemoteOK"}
+
+        assert store.save() == 1
+        assert store.save() == 0
+        store.close()
+
+        reopened = open_job_store(legacy)
+        assert len(reopened) == 3
+        assert reopened["101"]['title'] == "QA Engineer"
+        assert reopened.recent(1)[0]['id'] == "303"
+        reopened.close()
+
+
+def test_journal_appends_and_compacts():
+    with tempfile.TemporaryDirectory() as directory:
+        legacy = make_legacy_file(directory)
+        store = open_job_store(legacy, backend='journal')
+        store.compact()
+        assert not os.path.exists(store.journal_path)
+
+        store["303"] = {'id': "303", 'title': "SDET", 'source': "Jooble"}
+        assert store.save() == 1
+        with open(store.journal_path, 'r', encoding='utf-8') as f:
+            assert len(f.readlines()) == 1
+
+        store.compact()
+        store.close()
+        assert not os.path.exists(store.journal_path)
+
+        reopened = JournalJobStore(store_path_for(legacy, 'journal'))
+        assert len(reopened) == 3
+        assert reopened["303"]['title'] == "SDET"
+
+
+def test_interrupted_compaction_is_finished_on_open():
+    with tempfile.TemporaryDirectory() as directory:
+        legacy = make_legacy_file(directory)
+        store = open_job_store(legacy, backend='journal')
+        store.close()
+        # The process died after moving the journal aside, before the snapshot was written
+        os.replace(store.journal_path, store.compacting_path)
+
+        reopened = JournalJobStore(store_path_for(legacy, 'journal'))
+        assert not os.path.exists(reopened.compacting_path)
+        assert len(reopened) == 2 and reopened["101"]['title'] == "QA Engineer"
+
+        reopened["303"] = {'id': "303", 'title': "SDET", 'source': "Jooble"}
+        reopened.save()
+        reopened.compact()
+        assert not os.path.exists(reopened.journal_path)
+        reopened.close()
+
+
+def test_readers_see_every_job_across_a_compaction():
+    with tempfile.TemporaryDirectory() as directory:
+        store = open_job_store(make_legacy_file(directory), backend='journal')
+        store.compact()
+        store["303"] = {'id': "303", 'title': "SDET", 'source': "Jooble"}
+        store.save()
+
+        jobs = store.values()
+        first = next(jobs)
+        store.compact()
+        assert [first['id']] + [job['id'] for job in jobs] == ["101", "reed_202", "303"]
+        store.close()
+
+
+def test_index_is_current_after_every_save():
+    with tempfile.TemporaryDirectory() as directory:
+        legacy = make_legacy_file(directory)
+        for backend in ('sqlite', 'journal'):
+            store = open_job_store(legacy, backend=backend)
+            store["303"] = {'id': "303", 'title': "SDET", 'source': "Jooble"}
+            store.save()
+            # No close(): a monitor killed between scans restarts from the saved index
+            index = SeenIndex.load(store.index_path, store._stamp())
+            assert index is not None and "303" in index and len(index) == 3
+
+
+def test_two_processes_sharing_a_store():
+    with tempfile.TemporaryDirectory() as directory:
+        legacy = make_legacy_file(directory)
+        for backend in ('sqlite', 'journal'):
+            # e.g. job_monitor and job_monitor_debug, both on tracked_jobs
+            first = open_job_store(legacy, backend=backend)
+            second = open_job_store(legacy, backend=backend)
+            first["303"] = {'id': "303", 'title': "SDET", 'source': "Jooble"}
+            first.save()
+            second["404"] = {'id': "404", 'title': "QA Lead", 'source': "Reed.co.uk"}
+            second.save()
+            assert "303" in second
+
+            # The index the second one wrote last holds both, so neither job is new after a restart
+            reopened = open_job_store(legacy, backend=backend)
+            assert "303" in reopened and "404" in reopened and len(reopened) == 4
+            for store in (first, second, reopened):
+                store.close()
+
+
+def test_seen_index_round_trip():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "seen.idx")
+        index = SeenIndex.from_ids(["101", "reed_202"])
+        index.add("303")
+        assert "303" in index and "404" not in index
+        index.save(path, stamp=7)
+
+        assert SeenIndex.load(path, stamp=8) is None
+        loaded = SeenIndex.load(path, stamp=7)
+        assert len(loaded) == 3
+        assert "reed_202" in loaded
+
+
+if __name__ == "__main__":
+    print("💾 TESTING JOB STORE")
+    print("=" * 50)
+    test_legacy_import_and_lookup()
+    print("✅ Legacy JSON import works")
+    test_corrupt_legacy_file_starts_empty()
+    print("✅ Corrupt legacy JSON starts an empty store")
+    test_save_only_writes_new_jobs()
+    print("✅ Incremental saves work")
+    test_journal_appends_and_compacts()
+    print("✅ JSONL journal and compaction work")
+    test_interrupted_compaction_is_finished_on_open()
+    print("✅ Interrupted compaction is finished on open")
+    test_readers_see_every_job_across_a_compaction()
+    print("✅ Readers see every job across a compaction")
+    test_index_is_current_after_every_save()
+    print("✅ Seen-id index is current after every save")
+    test_two_processes_sharing_a_store()
+    print("✅ Two processes can share a store")
+    test_seen_index_round_trip()
+    print("✅ Seen-id index save/load works")
+    print("\n✅ Job store test complete!")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Quick test of the shared keyword matcher
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import keyword_matcher
+
+TESTING = ['test', 'qa', 'quality assurance', 'automation', 'selenium', 'cypress']
+EXPERIENCE = ['2+ year', '2 year', 'experienced', 'senior', '3+ year']
+EXCLUSIONS = ['sales', 'marketing', 'hr']
+OVERLAPPING = ['automation', 'test automation', 'test', 'qa']
+
+
+def spans(text):
+    matcher = keyword_matcher.KeywordMatcher({'testing': TESTING, 'experience': EXPERIENCE, 'exclusion': EXCLUSIONS})
+    return list(matcher.spans(text))
+
+
+def check_matcher():
+    description = 'we need a senior qa engineer with 3+ years of cypress and test automation'
+    found = spans(description)
+
+    # Same occurrences as one substring search per keyword, overlaps included
+    assert {keyword for start, end, keyword, names in found} == \
+        {keyword for keyword in TESTING + EXPERIENCE + EXCLUSIONS if keyword in description}
+    assert all(description[start:end] == keyword for start, end, keyword, names in found)
+    assert [(keyword, names) for start, end, keyword, names in spans('senior sales lead')] == \
+        [('senior', {'experience'}), ('sales', {'exclusion'})]
+    assert spans('backend developer') == [] and spans('') == []
+
+    # In text order, repeats included
+    assert [keyword for start, end, keyword, names in spans('test the qa tests')] == ['test', 'qa', 'test']
+    return found
+
+
+def test_automaton():
+    assert keyword_matcher.ahocorasick is not None, "pyahocorasick is listed in requirements.txt"
+    check_matcher()
+
+
+def test_fallback_without_pyahocorasick():
+    text = 'qa test automation and automation tests'
+    automaton = check_matcher(), list(keyword_matcher.KeywordMatcher({'testing': OVERLAPPING}).spans(text))
+    original = keyword_matcher.ahocorasick
+    keyword_matcher.ahocorasick = None
+    try:
+        # Same spans in the same order as the automaton, even where keywords overlap
+        assert (check_matcher(), list(keyword_matcher.KeywordMatcher({'testing': OVERLAPPING}).spans(text))) == automaton
+    finally:
+        keyword_matcher.ahocorasick = original
+
+
+if __name__ == "__main__":
+    print("🔤 TESTING KEYWORD MATCHER")
+    print("=" * 50)
+    test_automaton()
+    print("✅ One automaton finds every keyword occurrence")
+    test_fallback_without_pyahocorasick()
+    print("✅ Same spans, same order without pyahocorasick")
+    print("\n✅ Keyword matcher test complete!")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Quick test of paginated API search
+"""
+
+import os
+import sys
+import json
+import base64
+import threading
+from urllib.parse import urlsplit, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import http_client
+import pagination
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Reed-style search over TOTAL jobs, ranked by relevance"""
+    total = 0
+    pages = []
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        skip, take = int(query['resultsToSkip'][0]), int(query['resultsToTake'][0])
+        Handler.pages.append(skip // take)
+        # The API key is sent as the basic-auth username
+        assert self.headers['Authorization'] == 'Basic ' + base64.b64encode(b'key:').decode()
+        results = [{'jobId': n} for n in range(skip, min(skip + take, Handler.total))]
+        body = json.dumps({'results': results, 'totalResults': Handler.total}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def search(base, budget=2):
+    return pagination.reed_search('key', {'keywords': 'qa'}, budget=budget, url=f"{base}/search")
+
+
+def test_pages_are_read_to_the_total_or_the_budget():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    size = pagination.REED_PAGE_SIZE
+    try:
+        # The results fit in two pages: the first is read alone, its total says one more is left
+        Handler.total, Handler.pages = size + 30, []
+        assert len(search(base)) == size + 30
+        assert Handler.pages == [0, 1]
+
+        # A single short page is the only request
+        Handler.total, Handler.pages = 30, []
+        assert len(search(base)) == 30
+        assert Handler.pages == [0]
+
+        # More results than the budget covers are capped at the budget
+        Handler.total, Handler.pages = 5 * size, []
+        assert len(search(base)) == 2 * size
+        assert sorted(Handler.pages) == [0, 1]
+    finally:
+        server.shutdown()
+        http_client.close()
+
+
+if __name__ == "__main__":
+    print("📄 TESTING PAGINATED SEARCH")
+    print("=" * 50)
+    test_pages_are_read_to_the_total_or_the_budget()
+    print("✅ Pages are read to the result total or the budget")
+    print("\n✅ Pagination test complete!")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Quick test of the parse pool
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import parse_pool
+import indeed_cards
+
+ITEM = '''<item><title>QA Engineer {n}</title><link>https://weworkremotely.com/jobs/{n}</link>
+<guid>job-{n}</guid><pubDate>Mon, 04 Mar 2024 10:{m:02d}:00 +0000</pubDate>
+<description>&lt;p&gt;{padding}&lt;/p&gt;</description></item>'''
+
+
+def rss(count, padding=400):
+    items = ''.join(ITEM.format(n=n, m=n % 60, padding='Selenium ' * (padding // 9)) for n in range(count))
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>WWR</title>{items}</channel></rss>'.encode()
+
+
+def test_large_feeds_parse_in_workers():
+    pool = parse_pool.ParsePool(max_workers=2, min_pool_bytes=1024)
+    try:
+        feed = pool.run(parse_pool.parse_feed, rss(100))
+        assert pool.pooled == 1 and pool.inline == 0
+        assert len(feed.entries) == 100
+        entry = feed.entries[0]
+        assert entry.title == 'QA Engineer 0' and entry.get('id') == 'job-0'
+        assert entry.get('published_parsed')[:5] == (2024, 3, 4, 10, 0)
+        assert 'tags' not in entry and 'summary_detail' not in entry
+
+        # Small bodies aren't worth the trip to a worker
+        assert len(pool.run(parse_pool.parse_feed, rss(1, padding=0)).entries) == 1
+        assert pool.inline == 1
+    finally:
+        pool.close()
+
+
+def test_pages_parse_side_by_side_with_errors_returned():
+    pool = parse_pool.ParsePool(max_workers=2, min_pool_bytes=0)
+    try:
+        page = (b'<html><body><div class="job_seen_beacon"><h2 class="jobTitle"><a data-jk="k1">'
+                b'<span title="SDET">SDET</span></a></h2></div></body></html>')
+        results = pool.parse_all(indeed_cards.extract_jobs, [(page, 5, 'indeed.com'), (None, 5, 'indeed.com')])
+        assert results[0][0]['job_key'] == 'k1' and results[0][0]['title'] == 'SDET'
+        assert isinstance(results[1], Exception)
+    finally:
+        pool.close()
+
+
+def test_selectors_learned_in_workers_reach_the_parent():
+    original = parse_pool.pool, indeed_cards.selector_cache
+    parse_pool.pool = parse_pool.ParsePool(max_workers=2, min_pool_bytes=0)
+    indeed_cards.selector_cache = indeed_cards.SelectorCache()
+    try:
+        page = (b'<html><body><div class="job_seen_beacon"><h2 class="jobTitle"><a data-jk="k1">'
+                b'<span title="SDET">SDET</span></a></h2></div></body></html>')
+        first = indeed_cards.extract_all([(page, 5, 'uk.indeed.com'), (None, 5, 'uk.indeed.com')])
+        assert first[0][0]['title'] == 'SDET' and isinstance(first[1], Exception)
+        assert parse_pool.pool.pooled == 1
+        assert indeed_cards.selector_cache.hit_rate('uk.indeed.com') == 0
+        assert indeed_cards.selector_cache.summary()
+
+        # The next page starts from the winners the first one found in its worker
+        indeed_cards.extract_all([(page, 5, 'uk.indeed.com')])
+        stats = indeed_cards.selector_cache.stats
+        assert stats[('uk.indeed.com', 'cards')] == stats[('uk.indeed.com', 'title')] == {'hits': 1, 'misses': 1}
+    finally:
+        parse_pool.pool.close()
+        parse_pool.pool, indeed_cards.selector_cache = original
+
+
+def test_unavailable_pool_parses_in_thread():
+    pool = parse_pool.ParsePool(max_workers=0)
+    assert len(pool.run(parse_pool.parse_feed, rss(3)).entries) == 3
+    assert pool.inline == 1 and pool.pooled == 0
+
+
+if __name__ == "__main__":
+    print("🧮 TESTING PARSE POOL")
+    print("=" * 50)
+    test_large_feeds_parse_in_workers()
+    print("✅ Large feeds are parsed in worker processes")
+    test_pages_parse_side_by_side_with_errors_returned()
+    print("✅ Pages parse side by side, errors are returned")
+    test_selectors_learned_in_workers_reach_the_parent()
+    print("✅ Selectors learned in workers reach the parent")
+    test_unavailable_pool_parses_in_thread()
+    print("✅ Without workers, parsing falls back to the calling thread")
+    print("\n✅ Parse pool test complete!")
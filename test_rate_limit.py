@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Quick test of the per-host rate limiter
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import rate_limit
+import scan_deadline
+
+
+def test_bucket_allows_burst_then_paces():
+    bucket = rate_limit.TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.05 < bucket.reserve() <= 0.1
+    assert 0.15 < bucket.reserve() <= 0.2
+
+
+def test_each_indeed_domain_has_its_own_bucket():
+    limiter = rate_limit.HostRateLimiter({'indeed': (10, 1)})
+    assert limiter.rate_for('uk.indeed.com') == (10, 1)
+    assert limiter.rate_for('indeed.co.uk') == (10, 1)
+    assert limiter.rate_for('api.telegram.org') is None
+
+    start = time.monotonic()
+    for url in ['https://uk.indeed.com/jobs', 'https://ca.indeed.com/jobs', 'https://indeed.co.uk/jobs']:
+        assert limiter.wait(url) == 0
+    assert limiter.wait('https://api.telegram.org/bot123/sendMessage') == 0
+
+    # Second request to the same domain waits for its own refill only
+    assert limiter.wait('https://uk.indeed.com/jobs?start=10') > 0
+    assert time.monotonic() - start < 0.5
+
+
+def test_wait_stops_at_the_scan_deadline():
+    limiter = rate_limit.HostRateLimiter({'indeed': (0.1, 1)})
+    limiter.wait('https://uk.indeed.com/jobs')
+    start = time.monotonic()
+    with scan_deadline.bounded(0.2):
+        # The next token is 10s away; the scan only has 0.2s left
+        assert limiter.wait('https://uk.indeed.com/jobs') <= 0.2
+    assert time.monotonic() - start < 0.5
+
+
+if __name__ == "__main__":
+    print("⏳ TESTING PER-HOST RATE LIMITER")
+    print("=" * 50)
+    test_bucket_allows_burst_then_paces()
+    print("✅ Bucket allows a burst, then paces")
+    test_each_indeed_domain_has_its_own_bucket()
+    print("✅ Indeed country domains are limited independently")
+    test_wait_stops_at_the_scan_deadline()
+    print("✅ Waits stop at the scan deadline")
+    print("\n✅ Rate limiter test complete!")
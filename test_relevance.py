@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Quick test of batch relevance scoring
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+import relevance
+import alert_pipeline
+import keyword_matcher
+
+NOW = 1_700_000_000
+
+
+def job(title, description='', tags=None, salary='Competitive', hours_old=1.0):
+    return {'title': title, 'description': description, 'tags': tags or [], 'salary': salary,
+            'epoch': NOW - hours_old * 3600}
+
+
+def test_better_matches_score_higher():
+    jobs = [
+        job('Office Manager', 'Run the office'),
+        job('Senior QA Automation Engineer', '3+ years of Selenium and Cypress test automation', ['qa', 'testing']),
+        job('Backend Developer', 'Write some unit tests'),
+    ]
+    ranked = relevance.rank(jobs, now=NOW)
+    assert [job['title'] for job in ranked] == ['Senior QA Automation Engineer', 'Backend Developer', 'Office Manager']
+    assert all(0 <= job['relevance_score'] <= 10 for job in ranked)
+
+
+def test_recency_and_salary_break_ties():
+    older = job('QA Engineer', 'Selenium', hours_old=48)
+    newer = job('QA Engineer', 'Selenium', hours_old=0)
+    paid = job('QA Engineer', 'Selenium', salary='$90,000 - $110,000', hours_old=48)
+    scores = relevance.get_scorer().scores([older, newer, paid], now=NOW)
+    assert scores[1] > scores[0] and scores[2] > scores[0]
+    # Equal jobs keep the order they were found in
+    twins = [job('QA Engineer'), job('QA Engineer')]
+    assert relevance.rank(twins, now=NOW) == twins
+
+
+def test_posted_times_from_every_monitor_format():
+    assert relevance.posted_at({'epoch': 5}) == 5.0
+    assert relevance.posted_at({'published': 'Mon, 04 Mar 2024 10:00:00 +0000'}) == 1709546400.0
+    assert relevance.posted_at({'posted': '2024-03-04T10:00:00+00:00'}) == 1709546400.0
+    assert relevance.posted_at({'date_found': 'soon'}) != relevance.posted_at({'date_found': 'soon'})  # NaN
+    assert relevance.rank([], now=NOW) == []
+
+
+def counts_job_by_job(scorer, jobs):
+    counts = np.zeros((len(jobs), len(scorer.columns)))
+    for row, job in enumerate(jobs):
+        for group, keyword, field in scorer.profile.hits(**relevance.job_fields(job)):
+            if field in relevance.FIELD_WEIGHTS:
+                counts[row, scorer.columns[(group, keyword)]] += relevance.FIELD_WEIGHTS[field]
+    return counts
+
+
+def test_batch_counts_match_the_profile_job_by_job():
+    jobs = [job('SDET / QA Lead', 'Latest tools: pytest, Café-testing, 2+ years', ['test_automation', 'QA']),
+            job('Tester', 'aqua\x00qa senior'), job('', '', None), job('Ünïcode QA', 'naïve—test—ing 3 years')]
+    scorer = relevance.get_scorer()
+    assert keyword_matcher.ahocorasick is not None, "pyahocorasick is listed in requirements.txt"
+    counts = scorer.term_counts(jobs)
+    assert counts.sum() > 0
+    assert np.array_equal(counts, counts_job_by_job(scorer, jobs))
+
+    original = keyword_matcher.ahocorasick
+    keyword_matcher.ahocorasick = None
+    try:
+        assert np.array_equal(relevance.RelevanceScorer(scorer.profile).term_counts(jobs), counts)
+    finally:
+        keyword_matcher.ahocorasick = original
+
+
+def test_thousands_of_candidates_score_in_one_pass():
+    jobs = [job(f'QA Engineer {n}' if n % 3 else f'Data Analyst {n}',
+                'Selenium, Cypress and pytest; 3+ years of test automation. ' * 3, ['qa'], hours_old=n % 72)
+            for n in range(3000)]
+    started = time.perf_counter()
+    ranked = relevance.rank(jobs, now=NOW)
+    elapsed = time.perf_counter() - started
+    assert len(ranked) == 3000 and ranked[0]['title'].startswith('QA Engineer')
+    print(f"   3000 jobs ranked in {elapsed * 1000:.0f}ms")
+    assert elapsed < 2.0
+
+
+def test_alert_batches_are_sent_ranked():
+    sent = []
+    with alert_pipeline.AlertBatcher(sent.append, window=10, rank=lambda jobs: relevance.rank(jobs, now=NOW)) as alerts:
+        alerts.add([job('Office Manager')])
+        alerts.add([job('QA Engineer', '2+ years Selenium')])
+    assert [job['title'] for job in sent[0]] == ['QA Engineer', 'Office Manager']
+
+
+if __name__ == "__main__":
+    print("📊 TESTING RELEVANCE SCORING")
+    print("=" * 50)
+    test_better_matches_score_higher()
+    print("✅ Better matches score higher")
+    test_recency_and_salary_break_ties()
+    print("✅ Recency and salary break ties")
+    test_posted_times_from_every_monitor_format()
+    print("✅ Posted times read from every monitor's format")
+    test_batch_counts_match_the_profile_job_by_job()
+    print("✅ Batch term counts match the profile job by job")
+    test_thousands_of_candidates_score_in_one_pass()
+    print("✅ Thousands of candidates score in one pass")
+    test_alert_batches_are_sent_ranked()
+    print("✅ Alert batches are sent ranked")
+    print("\n✅ Relevance scoring test complete!")
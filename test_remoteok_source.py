@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Quick test of the shared RemoteOK feed snapshot
+"""
+
+import os
+import sys
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import http_client
+import remoteok_source
+
+FEED = [
+    {'legal': 'Legal notice'},
+    {'id': '1', 'position': 'QA Engineer', 'company': 'Acme', 'tags': ['qa', 'Testing'],
+     'description': 'Manual and automated software testing'},
+    {'id': '2', 'position': 'SDET', 'company': 'Globex', 'tags': ['sdet', 'automation'],
+     'description': 'Build test automation in Python'},
+    {'id': '3', 'position': 'Backend Developer', 'company': 'Initech', 'tags': ['python', 'quality-assurance'],
+     'description': 'APIs'},
+]
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    requests = 0
+
+    def do_GET(self):
+        FeedHandler.requests += 1
+        body = json.dumps(FEED).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_views_come_from_the_snapshot():
+    feed = remoteok_source.RemoteOKFeed()
+    feed._index(FEED)
+    feed._fetched_at = float('inf')  # Never stale
+
+    assert [job['id'] for job in feed.jobs()] == ['1', '2', '3']
+    assert [job['id'] for job in feed.by_tag('testing')] == ['1']
+    assert [job['id'] for job in feed.by_tag('Quality Assurance')] == ['3']
+    assert [job['id'] for job in feed.search('software testing')] == ['1']
+    assert [job['id'] for job in feed.search('python')] == ['2', '3']
+    assert feed.by_tag('devops') == []
+    assert feed.fetch_count == 0
+
+
+def test_one_download_serves_every_tag():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    original_url = remoteok_source.FEED_URL
+    remoteok_source.FEED_URL = f"http://127.0.0.1:{server.server_address[1]}/api"
+    try:
+        FeedHandler.requests = 0
+        feed = remoteok_source.RemoteOKFeed(timeout=5)
+        for tag in ['qa', 'testing', 'automation', 'sdet', 'quality assurance']:
+            assert feed.by_tag(tag)
+        assert feed.fetch_count == 1
+        assert FeedHandler.requests == 1
+
+        feed.refresh(force=True)
+        assert FeedHandler.requests == 2
+    finally:
+        remoteok_source.FEED_URL = original_url
+        server.shutdown()
+        http_client.close()
+
+
+if __name__ == "__main__":
+    print("🌍 TESTING REMOTEOK FEED SNAPSHOT")
+    print("=" * 50)
+    test_views_come_from_the_snapshot()
+    print("✅ Tag and search views answered from memory")
+    test_one_download_serves_every_tag()
+    print("✅ One download per cycle serves every tag")
+    print("\n✅ RemoteOK feed test complete!")
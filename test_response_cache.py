@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Quick test of the on-disk response cache and offline replay
+"""
+
+import os
+import sys
+import zlib
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import http_client
+import response_cache
+
+
+class JobsHandler(BaseHTTPRequestHandler):
+    requests = 0
+
+    def _reply(self, body):
+        JobsHandler.requests += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply(b'[{"id": "1", "position": "QA Engineer"}]')
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._reply(b'{"echo": ' + body + b'}')
+
+    def log_message(self, *args):
+        pass
+
+
+def serve():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), JobsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    response_cache.SOURCE_TTLS['127.0.0.1'] = 60
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def stop(server):
+    response_cache.SOURCE_TTLS.pop('127.0.0.1', None)
+    response_cache.set_cache(None)
+    server.shutdown()
+    http_client.close()
+
+
+def test_only_job_boards_are_cached():
+    assert response_cache.ttl_for('https://remoteok.io/api') > 0
+    assert response_cache.ttl_for('https://uk.indeed.com/jobs?q=qa') > 0
+    assert response_cache.ttl_for('https://api.telegram.org/bot123/sendMessage') == 0
+
+
+def test_processes_share_responses_within_ttl():
+    server, base = serve()
+    directory = tempfile.mkdtemp()
+    try:
+        JobsHandler.requests = 0
+        response_cache.set_cache(response_cache.ResponseCache(directory, offline=False))
+        first = http_client.get(f"{base}/api", params={'tag': 'qa'}, timeout=5)
+        assert first.json()[0]['id'] == '1'
+
+        # A second monitor process opening the same cache directory
+        response_cache.set_cache(response_cache.ResponseCache(directory, offline=False))
+        second = http_client.get(f"{base}/api", params={'tag': 'qa'}, timeout=5)
+        assert second.json() == first.json() and second.from_cache
+        assert JobsHandler.requests == 1
+
+        # Same process asking again conditionally gets a 304, not the same body twice
+        assert http_client.get(f"{base}/api", params={'tag': 'qa'}, timeout=5, conditional=True).status_code == 304
+
+        # The body is part of the key
+        http_client.post(f"{base}/search", json={'keywords': 'qa'}, timeout=5)
+        http_client.post(f"{base}/search", json={'keywords': 'sdet'}, timeout=5)
+        http_client.post(f"{base}/search", json={'keywords': 'qa'}, timeout=5)
+        assert JobsHandler.requests == 3
+    finally:
+        stop(server)
+
+
+def test_offline_replays_recorded_responses():
+    server, base = serve()
+    directory = tempfile.mkdtemp()
+    try:
+        response_cache.set_cache(response_cache.ResponseCache(directory, offline=False))
+        http_client.get(f"{base}/api", timeout=5)
+
+        JobsHandler.requests = 0
+        response_cache.set_cache(response_cache.ResponseCache(directory, offline=True))
+        replay = http_client.get(f"{base}/api", timeout=5, conditional=True)
+        assert replay.status_code == 200 and replay.json()[0]['position'] == 'QA Engineer'
+        assert JobsHandler.requests == 0
+
+        for url in [f"{base}/never-recorded", 'https://api.telegram.org/bot123/sendMessage']:
+            try:
+                http_client.get(url, timeout=5)
+                assert False, "offline request reached the network"
+            except response_cache.OfflineMiss:
+                pass
+    finally:
+        stop(server)
+
+
+def test_corrupt_entries_are_misses():
+    cache = response_cache.ResponseCache(tempfile.mkdtemp(), offline=False)
+    for raw in [b'{"status": 2', b'{"status": 200}\n[]', b'[200]\n[]', b'']:
+        with open(cache._path('key'), 'wb') as f:
+            f.write(zlib.compress(raw))
+        assert cache.load('key', 'https://remoteok.io/api', ttl=60) is None
+    with open(cache._path('key'), 'wb') as f:
+        f.write(b'not zlib')
+    assert cache.load('key', 'https://remoteok.io/api', ttl=60) is None
+
+
+if __name__ == "__main__":
+    print("📼 TESTING RESPONSE CACHE")
+    print("=" * 50)
+    test_only_job_boards_are_cached()
+    print("✅ Only job board responses are cached")
+    test_processes_share_responses_within_ttl()
+    print("✅ Monitors share responses within the TTL")
+    test_offline_replays_recorded_responses()
+    print("✅ Offline mode replays recorded responses")
+    test_corrupt_entries_are_misses()
+    print("✅ Corrupt entries are misses")
+    print("\n✅ Response cache test complete!")
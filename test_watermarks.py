@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Quick test of per-source watermarks
+"""
+
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watermarks import Watermarks, watermark_path, reed_posted, jooble_updated
+
+
+def feed(*ids):
+    """RemoteOK-style newest-first items whose epoch grows with the id"""
+    return [{'id': str(n), 'epoch': 1700000000 + n} for n in ids]
+
+
+def item_id(job):
+    return job['id']
+
+
+def epoch(job):
+    return job['epoch']
+
+
+def test_newest_first_feed_stops_at_previous_top():
+    marks = Watermarks(os.path.join(tempfile.mkdtemp(), 'jobs.watermarks.json'))
+    assert len(marks.fresh('remoteok', feed(5, 4, 3, 2, 1), item_id, epoch)) == 5
+
+    fresh = marks.fresh('remoteok', feed(7, 6, 5, 4, 3, 2, 1), item_id, epoch)
+    assert [job['id'] for job in fresh] == ['7', '6']
+    assert marks.fresh('remoteok', feed(7, 6, 5, 4), item_id, epoch) == []
+
+
+def test_pinned_post_does_not_hide_new_ones():
+    marks = Watermarks(os.path.join(tempfile.mkdtemp(), 'jobs.watermarks.json'))
+    marks.fresh('remoteok', feed(5, 4, 3), item_id, epoch)
+    fresh = marks.fresh('remoteok', feed(3, 7, 6, 5, 4), item_id, epoch)
+    assert [job['id'] for job in fresh] == ['7', '6']
+
+
+def test_unordered_results_are_filtered_not_cut():
+    marks = Watermarks(os.path.join(tempfile.mkdtemp(), 'jobs.watermarks.json'))
+    first = [{'jobId': 1, 'date': '01/03/2024'}, {'jobId': 2, 'date': '03/03/2024'}]
+    marks.fresh('reed', first, lambda job: job['jobId'], reed_posted, ordered=False)
+
+    second = [{'jobId': 1, 'date': '01/03/2024'}, {'jobId': 2, 'date': '03/03/2024'},
+              {'jobId': 9, 'date': '28/02/2024'}, {'jobId': 3, 'date': '03/03/2024'},
+              {'jobId': 4, 'date': '04/03/2024'}]
+    fresh = marks.fresh('reed', second, lambda job: job['jobId'], reed_posted, ordered=False)
+    # Job 9 is dated before the watermark but was never seen - indexed late, it is still new
+    assert [job['jobId'] for job in fresh] == [9, 3, 4]
+    assert marks._marks['reed']['published'] == '2024-03-04'
+
+
+def test_watermarks_survive_restart():
+    path = watermark_path(os.path.join(tempfile.mkdtemp(), 'automatic_jobs.json'))
+    assert path.endswith('automatic_jobs.watermarks.json')
+
+    marks = Watermarks(path)
+    marks.fresh('jooble', [{'id': 1, 'updated': '2024-03-04T10:00:00.0000000'}], item_id=lambda job: job['id'],
+                published=jooble_updated)
+    marks.save()
+
+    reloaded = Watermarks(path)
+    assert reloaded._marks['jooble']['published'] == '2024-03-04T10:00:00'
+    assert reloaded.fresh('jooble', [{'id': 1, 'updated': '2024-03-04T10:00:00'}],
+                          lambda job: job['id'], jooble_updated) == []
+
+
+if __name__ == "__main__":
+    print("🌊 TESTING SOURCE WATERMARKS")
+    print("=" * 50)
+    test_newest_first_feed_stops_at_previous_top()
+    print("✅ Newest-first feeds stop at the previous top")
+    test_pinned_post_does_not_hide_new_ones()
+    print("✅ A pinned post does not hide new ones")
+    test_unordered_results_are_filtered_not_cut()
+    print("✅ Unordered results are filtered item by item")
+    test_watermarks_survive_restart()
+    print("✅ Watermarks survive a restart")
+    print("\n✅ Watermark test complete!")
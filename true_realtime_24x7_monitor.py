@@ -4,18 +4,22 @@ ULTRA-AGGRESSIVE TRUE REAL-TIME 24/7 Job Monitor
 Continuous scanning with 15-second intervals and instant alerts
 """
 
-import requests
-import json
 import datetime
 import time
 import os
 import threading
 import asyncio
 import aiohttp
-from concurrent.futures import ThreadPoolExecutor
-import feedparser
 import logging
 import sys
+import http_client
+import fetch_engine
+import relevance
+import alert_pipeline
+import remoteok_source
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id
 
 # Ultra-aggressive logging
 logging.basicConfig(
@@ -40,17 +44,6 @@ class TrueRealtime24x7Monitor:
         self.jobs_found_today = 0
         self.is_running = True
         
-        # Ultra-specific testing patterns
-        self.testing_patterns = [
-            'qa engineer', 'test engineer', 'testing engineer', 'quality engineer',
-            'qa analyst', 'test analyst', 'quality analyst', 'testing analyst',
-            'qa automation', 'test automation', 'automation engineer', 'automation tester',
-            'sdet', 'qa lead', 'test lead', 'quality lead', 'testing lead',
-            'qa manager', 'test manager', 'quality manager', 'testing manager',
-            'software tester', 'manual tester', 'automated tester', 'performance tester',
-            'qa specialist', 'test specialist', 'quality specialist', 'testing specialist'
-        ]
-        
         # Send startup notification
         self.send_startup_notification()
         
@@ -72,84 +65,51 @@ class TrueRealtime24x7Monitor:
             logging.error(f"Startup notification error: {e}")
     
     def load_tracked_jobs(self):
-        try:
-            with open(self.jobs_file, 'r') as f:
-                self.tracked_jobs = json.load(f)
-        except FileNotFoundError:
-            self.tracked_jobs = {}
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
         try:
-            with open(self.jobs_file, 'w') as f:
-                json.dump(self.tracked_jobs, f, indent=2)
+            self.tracked_jobs.save()
         except Exception as e:
             logging.error(f"Save error: {e}")
     
     def is_testing_job(self, title, description):
         """Ultra-precise testing job detection"""
-        text = f"{title} {description}".lower()
-        
-        # Must match testing patterns
-        is_testing = any(pattern in text for pattern in self.testing_patterns)
-        
-        # Additional testing indicators
-        testing_keywords = ['qa', 'test', 'quality', 'automation', 'sdet']
-        has_keyword = any(keyword in text for keyword in testing_keywords)
-        
-        # Exclude non-testing roles
-        exclusions = ['sales', 'marketing', 'business development', 'account', 'finance', 'hr', 'customer support']
-        has_exclusion = any(excl in text for excl in exclusions)
-        
-        return (is_testing or has_keyword) and not has_exclusion
+        # Must match testing keywords and not be a sales, business or support role
+        return filter_profiles.profile('testing_roles').matches(title=title, description=description)
     
     def ultra_fast_remoteok_scan(self):
         """Ultra-fast RemoteOK scanning"""
         jobs = []
         try:
-            # Multiple rapid API calls
-            api_urls = [
-                "https://remoteok.io/api?tag=qa",
-                "https://remoteok.io/api?tag=testing",
-                "https://remoteok.io/api?tag=automation",
-                "https://remoteok.io/api?tag=sdet"
-            ]
+            feed = remoteok_source.get_feed()
+            tags = ['qa', 'testing', 'automation', 'sdet']
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'application/json'
-            }
-            
-            for url in api_urls:
+            for tag in tags:
                 try:
-                    response = requests.get(url, headers=headers, timeout=8)
-                    if response.status_code == 200:
-                        data = response.json()
+                    for job in feed.by_tag(tag)[:7]:
+                        if not job or not isinstance(job, dict):
+                            continue
                         
-                        for job in data[1:8]:  # Skip legal notice
-                            if not job or not isinstance(job, dict):
-                                continue
-                            
-                            title = job.get('position', '')
-                            description = job.get('description', '')
+                        title = job.get('position', '')
+                        description = job.get('description', '')
+                        
+                        if self.is_testing_job(title, description):
+                            job_id = make_job_id('remoteok_ultra', job.get('id'), job.get('url'), job.get('position'), job.get('company'))
                             
-                            if self.is_testing_job(title, description):
-                                job_id = f"remoteok_ultra_{job.get('id', len(jobs))}"
-                                
-                                if job_id not in self.tracked_jobs:
-                                    job_entry = {
-                                        'id': job_id,
-                                        'title': title,
-                                        'company': job.get('company', 'N/A'),
-                                        'location': job.get('location', 'Remote'),
-                                        'salary': self.format_salary(job.get('salary_min'), job.get('salary_max')),
-                                        'url': f"https://remoteok.io/remote-jobs/{job.get('slug', '')}",
-                                        'source': 'RemoteOK Ultra',
-                                        'found_at': datetime.datetime.now().isoformat(),
-                                        'urgency': 'HIGH'
-                                    }
-                                    jobs.append(job_entry)
-                    
-                    time.sleep(0.2)  # Minimal delay
+                            if job_id not in self.tracked_jobs:
+                                job_entry = {
+                                    'id': job_id,
+                                    'title': title,
+                                    'company': job.get('company', 'N/A'),
+                                    'location': job.get('location', 'Remote'),
+                                    'salary': self.format_salary(job.get('salary_min'), job.get('salary_max')),
+                                    'url': f"https://remoteok.io/remote-jobs/{job.get('slug', '')}",
+                                    'source': 'RemoteOK Ultra',
+                                    'found_at': datetime.datetime.now().isoformat(),
+                                    'urgency': 'HIGH'
+                                }
+                                jobs.append(job_entry)
                 except Exception as e:
                     logging.warning(f"RemoteOK URL error: {e}")
             
@@ -170,16 +130,17 @@ class TrueRealtime24x7Monitor:
                 'https://www.indeed.com/rss?q=qa+automation&sort=date&limit=10'
             ]
             
-            for feed_url in feeds:
+            for feed in fetch_engine.fetch_feeds(feeds):
                 try:
-                    feed = feedparser.parse(feed_url)
+                    if isinstance(feed, Exception):
+                        raise feed
                     
                     for entry in feed.entries[:5]:
                         title = entry.get('title', '')
                         description = entry.get('summary', '')
                         
                         if self.is_testing_job(title, description):
-                            job_id = f"indeed_ultra_{entry.get('id', len(jobs))}"
+                            job_id = make_job_id('indeed_ultra', entry.get('id'), entry.get('link'), entry.get('title'))
                             
                             if job_id not in self.tracked_jobs:
                                 job_entry = {
@@ -194,8 +155,6 @@ class TrueRealtime24x7Monitor:
                                     'urgency': 'HIGH'
                                 }
                                 jobs.append(job_entry)
-                    
-                    time.sleep(0.2)
                 except Exception as e:
                     logging.warning(f"Indeed feed error: {e}")
                     
@@ -216,17 +175,21 @@ class TrueRealtime24x7Monitor:
                 'sdet+engineer'
             ]
             
-            for search in searches:
+            feeds = fetch_engine.fetch_feeds(
+                [f'https://stackoverflow.com/jobs/feed?q={search}&sort=i&r=true' for search in searches]
+            )
+            
+            for feed in feeds:
                 try:
-                    url = f'https://stackoverflow.com/jobs/feed?q={search}&sort=i&r=true'
-                    feed = feedparser.parse(url)
+                    if isinstance(feed, Exception):
+                        raise feed
                     
                     for entry in feed.entries[:3]:
                         title = entry.get('title', '')
                         description = entry.get('summary', '')
                         
                         if self.is_testing_job(title, description):
-                            job_id = f"stackoverflow_ultra_{entry.get('id', len(jobs))}"
+                            job_id = make_job_id('stackoverflow_ultra', entry.get('id'), entry.get('link'), entry.get('title'))
                             
                             if job_id not in self.tracked_jobs:
                                 job_entry = {
@@ -241,8 +204,6 @@ class TrueRealtime24x7Monitor:
                                     'urgency': 'HIGH'
                                 }
                                 jobs.append(job_entry)
-                    
-                    time.sleep(0.2)
                 except Exception as e:
                     logging.warning(f"SO search error: {e}")
                     
@@ -274,7 +235,7 @@ class TrueRealtime24x7Monitor:
                     'disable_web_page_preview': True
                 }
                 
-                response = requests.post(url, data=data, timeout=10)
+                response = http_client.post(url, data=data, timeout=10)
                 
                 if response.status_code == 200:
                     return True
@@ -338,27 +299,29 @@ class TrueRealtime24x7Monitor:
         
         all_new_jobs = []
         
-        # Concurrent ultra-fast scanning
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [
-                executor.submit(self.ultra_fast_remoteok_scan),
-                executor.submit(self.ultra_fast_indeed_scan),
-                executor.submit(self.ultra_fast_stackoverflow_scan)
-            ]
-            
-            for future in futures:
-                try:
-                    jobs = future.result(timeout=12)
-                    for job in jobs:
-                        if job['id'] not in self.tracked_jobs:
-                            self.tracked_jobs[job['id']] = job
-                            all_new_jobs.append(job)
-                except Exception as e:
-                    logging.warning(f"Scan timeout: {e}")
+        # Concurrent ultra-fast scanning on the shared fetch engine
+        sources = [
+            self.ultra_fast_remoteok_scan,
+            self.ultra_fast_indeed_scan,
+            self.ultra_fast_stackoverflow_scan
+        ]
+        
+        # Each source's new jobs are alerted the moment it finishes, not after the slowest one
+        with alert_pipeline.AlertBatcher(self.send_instant_job_alert, rank=relevance.rank) as alerts:
+            for source, jobs in fetch_engine.iter_sources(sources, deadline=12):
+                if isinstance(jobs, Exception):
+                    logging.warning(f"Scan timeout: {jobs}")
+                    continue
+                new_jobs = []
+                for job in jobs:
+                    if job['id'] not in self.tracked_jobs:
+                        self.tracked_jobs[job['id']] = job
+                        new_jobs.append(job)
+                alerts.add(new_jobs)
+                all_new_jobs.extend(new_jobs)
         
         if all_new_jobs:
             logging.info(f"🎉 FOUND {len(all_new_jobs)} NEW TESTING JOBS!")
-            self.send_instant_job_alert(all_new_jobs)
             self.save_tracked_jobs()
             
             for job in all_new_jobs:
@@ -4,16 +4,20 @@ ULTRA REAL-TIME 24/7 Job Monitor
 Continuous scanning with instant alerts - NEVER STOPS
 """
 
-import requests
-import json
 import datetime
 import time
 import os
 import threading
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
-import feedparser
+import http_client
+import fetch_engine
+import relevance
+import alert_pipeline
+import remoteok_source
+import filter_profiles
+from job_store import open_job_store
+from job_ids import make_job_id
 
 # Real-time logging
 logging.basicConfig(
@@ -42,16 +46,11 @@ class UltraRealtime24x7Monitor:
         self.send_startup_alert()
         
     def load_tracked_jobs(self):
-        try:
-            with open(self.jobs_file, 'r') as f:
-                self.tracked_jobs = json.load(f)
-        except:
-            self.tracked_jobs = {}
+        self.tracked_jobs = open_job_store(self.jobs_file)
     
     def save_tracked_jobs(self):
         try:
-            with open(self.jobs_file, 'w') as f:
-                json.dump(self.tracked_jobs, f, indent=2)
+            self.tracked_jobs.save()
         except Exception as e:
             logging.error(f"Save error: {e}")
     
@@ -89,7 +88,7 @@ class UltraRealtime24x7Monitor:
                     'disable_web_page_preview': True
                 }
                 
-                response = requests.post(url, data=data, timeout=10)
+                response = http_client.post(url, data=data, timeout=10)
                 if response.status_code == 200:
                     return True
                     
@@ -106,47 +105,39 @@ class UltraRealtime24x7Monitor:
             # Multiple simultaneous searches
             search_terms = ['qa', 'testing', 'automation', 'sdet', 'quality']
             
+            feed = remoteok_source.get_feed()
+            
             for term in search_terms:
                 try:
-                    url = f"https://remoteok.io/api?tag={term}"
-                    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-                    
-                    response = requests.get(url, headers=headers, timeout=8)
-                    if response.status_code == 200:
-                        data = response.json()
+                    for job in feed.by_tag(term)[:5]:  # Top 5 per term
+                        if not job or not isinstance(job, dict):
+                            continue
+                            
+                        title = str(job.get('position', '')).lower()
+                        description = str(job.get('description', '')).lower()
                         
-                        for job in data[1:6]:  # Top 5 per term
-                            if not job or not isinstance(job, dict):
-                                continue
-                                
-                            title = str(job.get('position', '')).lower()
-                            description = str(job.get('description', '')).lower()
+                        # Ultra-specific testing filter
+                        if filter_profiles.profile('testing').matches(title=title):
+                            job_id = make_job_id('remoteok_ultra', job.get('id'), job.get('url'), job.get('position'), job.get('company'))
                             
-                            # Ultra-specific testing filter
-                            testing_keywords = ['qa', 'test', 'quality', 'automation', 'sdet']
-                            if any(keyword in title for keyword in testing_keywords):
-                                job_id = f"remoteok_ultra_{job.get('id', len(jobs))}"
+                            if job_id not in self.tracked_jobs:
+                                salary = 'Competitive'
+                                if job.get('salary_min') and job.get('salary_max'):
+                                    salary = f"${job['salary_min']:,} - ${job['salary_max']:,}"
                                 
-                                if job_id not in self.tracked_jobs:
-                                    salary = 'Competitive'
-                                    if job.get('salary_min') and job.get('salary_max'):
-                                        salary = f"${job['salary_min']:,} - ${job['salary_max']:,}"
-                                    
-                                    job_entry = {
-                                        'id': job_id,
-                                        'title': job.get('position', 'Testing Position'),
-                                        'company': job.get('company', 'Tech Company'),
-                                        'location': job.get('location', 'Remote'),
-                                        'salary': salary,
-                                        'url': f"https://remoteok.io/remote-jobs/{job.get('slug', '')}",
-                                        'source': 'RemoteOK',
-                                        'found_at': datetime.datetime.now().isoformat(),
-                                        'tags': job.get('tags', [])
-                                    }
-                                    jobs.append(job_entry)
-                    
-                    time.sleep(0.2)  # Minimal delay
-                    
+                                job_entry = {
+                                    'id': job_id,
+                                    'title': job.get('position', 'Testing Position'),
+                                    'company': job.get('company', 'Tech Company'),
+                                    'location': job.get('location', 'Remote'),
+                                    'salary': salary,
+                                    'url': f"https://remoteok.io/remote-jobs/{job.get('slug', '')}",
+                                    'source': 'RemoteOK',
+                                    'found_at': datetime.datetime.now().isoformat(),
+                                    'tags': job.get('tags', [])
+                                }
+                                jobs.append(job_entry)
+                
                 except Exception as e:
                     continue  # Skip errors, keep scanning
             
@@ -167,16 +158,16 @@ class UltraRealtime24x7Monitor:
                 'https://uk.indeed.com/rss?q=qa+automation&sort=date'
             ]
             
-            for feed_url in feeds:
+            for feed in fetch_engine.fetch_feeds(feeds):
                 try:
-                    feed = feedparser.parse(feed_url)
+                    if isinstance(feed, Exception):
+                        raise feed
                     
                     for entry in feed.entries[:3]:  # Top 3 per feed
                         title = str(entry.get('title', '')).lower()
                         
-                        testing_keywords = ['qa', 'test', 'quality', 'automation', 'sdet']
-                        if any(keyword in title for keyword in testing_keywords):
-                            job_id = f"indeed_ultra_{entry.get('id', len(jobs))}"
+                        if filter_profiles.profile('testing').matches(title=title):
+                            job_id = make_job_id('indeed_ultra', entry.get('id'), entry.get('link'), entry.get('title'))
                             
                             if job_id not in self.tracked_jobs:
                                 job_entry = {
@@ -191,8 +182,6 @@ class UltraRealtime24x7Monitor:
                                 }
                                 jobs.append(job_entry)
                     
-                    time.sleep(0.2)
-                    
                 except Exception as e:
                     continue  # Skip errors, keep scanning
             
@@ -209,17 +198,20 @@ class UltraRealtime24x7Monitor:
                 'qa+engineer', 'test+automation', 'software+testing', 'sdet+engineer'
             ]
             
-            for search in searches:
+            feeds = fetch_engine.fetch_feeds(
+                [f'https://stackoverflow.com/jobs/feed?q={search}&sort=i' for search in searches]
+            )
+            
+            for feed in feeds:
                 try:
-                    url = f'https://stackoverflow.com/jobs/feed?q={search}&sort=i'
-                    feed = feedparser.parse(url)
+                    if isinstance(feed, Exception):
+                        raise feed
                     
                     for entry in feed.entries[:2]:  # Top 2 per search
                         title = str(entry.get('title', '')).lower()
                         
-                        testing_keywords = ['qa', 'test', 'quality', 'automation', 'sdet']
-                        if any(keyword in title for keyword in testing_keywords):
-                            job_id = f"stackoverflow_ultra_{entry.get('id', len(jobs))}"
+                        if filter_profiles.profile('testing').matches(title=title):
+                            job_id = make_job_id('stackoverflow_ultra', entry.get('id'), entry.get('link'), entry.get('title'))
                             
                             if job_id not in self.tracked_jobs:
                                 job_entry = {
@@ -234,8 +226,6 @@ class UltraRealtime24x7Monitor:
                                 }
                                 jobs.append(job_entry)
                     
-                    time.sleep(0.2)
-                    
                 except Exception as e:
                     continue  # Skip errors, keep scanning
             
@@ -292,27 +282,29 @@ class UltraRealtime24x7Monitor:
         
         all_new_jobs = []
         
-        # Concurrent ultra-fast scanning
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [
-                executor.submit(self.ultra_fast_remoteok_scan),
-                executor.submit(self.ultra_fast_indeed_scan),
-                executor.submit(self.ultra_fast_stackoverflow_scan)
-            ]
-            
-            for future in futures:
-                try:
-                    jobs = future.result(timeout=10)
-                    for job in jobs:
-                        if job['id'] not in self.tracked_jobs:
-                            self.tracked_jobs[job['id']] = job
-                            all_new_jobs.append(job)
-                except Exception as e:
-                    logging.warning(f"Scan timeout: {e}")
+        # Concurrent ultra-fast scanning on the shared fetch engine
+        sources = [
+            self.ultra_fast_remoteok_scan,
+            self.ultra_fast_indeed_scan,
+            self.ultra_fast_stackoverflow_scan
+        ]
+        
+        # Each source's new jobs are alerted the moment it finishes, not after the slowest one
+        with alert_pipeline.AlertBatcher(self.send_instant_job_alert, rank=relevance.rank) as alerts:
+            for source, jobs in fetch_engine.iter_sources(sources, deadline=10):
+                if isinstance(jobs, Exception):
+                    logging.warning(f"Scan timeout: {jobs}")
+                    continue
+                new_jobs = []
+                for job in jobs:
+                    if job['id'] not in self.tracked_jobs:
+                        self.tracked_jobs[job['id']] = job
+                        new_jobs.append(job)
+                alerts.add(new_jobs)
+                all_new_jobs.extend(new_jobs)
         
         if all_new_jobs:
             logging.info(f"🎉 FOUND {len(all_new_jobs)} NEW TESTING JOBS!")
-            self.send_instant_job_alert(all_new_jobs)
             self.save_tracked_jobs()
             
             for job in all_new_jobs:
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Source Watermarks
+Newest item seen per feed, persisted next to the job store, so steady-state scans only
+look at the items published since the last one. Newest-first feeds are read until the
+first items an earlier scan already saw; unordered results are filtered by remembered id.
+"""
+
+import os
+import json
+import time
+import calendar
+import logging
+import threading
+
+# Newest ids remembered per feed - recognises items that share the newest publish time,
+# which for day-granular dates can be a whole page
+MAX_IDS = 50
+
+# Consecutive already-seen items before a newest-first feed is abandoned; tolerates one
+# pinned or re-bumped post sitting above new ones
+STOP_AFTER_SEEN = 3
+
+
+def watermark_path(jobs_file):
+    """automatic_jobs.json -> automatic_jobs.watermarks.json"""
+    return os.path.splitext(jobs_file)[0] + '.watermarks.json'
+
+
+def entry_published(entry):
+    """Unix time of an RSS/Atom entry, or None"""
+    parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    return calendar.timegm(parsed) if parsed else None
+
+
+def entry_id(entry):
+    return entry.get('id') or entry.get('link')
+
+
+def reed_id(job):
+    return job.get('jobId')
+
+
+def jooble_id(job):
+    return job.get('id') or job.get('link')
+
+
+def reed_posted(job):
+    """Reed's dd/mm/yyyy posting date as a sortable yyyy-mm-dd"""
+    try:
+        day, month, year = str(job.get('date', '')).split('/')
+        return f"{year}-{month}-{day}"
+    except ValueError:
+        return None
+
+
+def jooble_updated(job):
+    """Jooble's ISO timestamp, trimmed to whole seconds"""
+    return str(job.get('updated') or '')[:19] or None
+
+
+class Watermarks:
+    """Per-feed high-water marks: the newest publish time and the newest few ids"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._marks = {}
+        self._dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._marks = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning(f"Watermarks not loaded from {path}: {e}")
+
+    def _seen(self, feed, ordered=True):
+        """Predicate for items at or behind the feed's watermark. Publish times only count on
+        newest-first feeds; an aggregator can index an older-dated job after newer ones."""
+        with self._lock:
+            mark = self._marks.get(feed, {})
+        seen_ids = set(mark.get('ids', []))
+        newest = mark.get('published') if ordered else None
+
+        def seen(item, item_id, published):
+            stamp = published(item) if published else None
+            return str(item_id(item)) in seen_ids or (newest is not None and stamp is not None and stamp < newest)
+        return seen
+
+    def seen_ids(self, feed):
+        """Ids of the newest items already seen on this feed"""
+        with self._lock:
+            return set(self._marks.get(feed, {}).get('ids', []))
+
+    def fresh(self, feed, items, item_id, published=None, ordered=True):
+        """Items not seen on an earlier scan, newest first, and move the watermark past them.
+        Newest-first feeds stop at the previous top; unordered results are only filtered by the
+        remembered ids, and anything older is left to the job store to recognise."""
+        with self._lock:
+            mark = self._marks.get(feed, {})
+        newest = mark.get('published')
+        seen = self._seen(feed, ordered)
+
+        fresh = []
+        seen_run = 0
+        for item in items:
+            if seen(item, item_id, published):
+                seen_run += 1
+                if ordered and seen_run >= STOP_AFTER_SEEN:
+                    break
+                continue
+            seen_run = 0
+            fresh.append(item)
+
+        if fresh:
+            stamps = [stamp for stamp in (published(item) for item in fresh) if stamp is not None] if published else []
+            ids = [str(item_id(item)) for item in fresh] + [i for i in mark.get('ids', [])]
+            with self._lock:
+                self._marks[feed] = {
+                    'published': max(stamps + ([newest] if newest is not None else [])) if stamps else newest,
+                    'ids': ids[:MAX_IDS],
+                    'updated': int(time.time())
+                }
+                self._dirty = True
+        return fresh
+
+    def save(self):
+        with self._lock:
+            if not self._dirty and os.path.exists(self.path):
+                return
+            marks = dict(self._marks)
+            self._dirty = False
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(marks, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Watermarks not saved to {self.path}: {e}")